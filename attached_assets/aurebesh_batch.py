@@ -0,0 +1,91 @@
+import atexit
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from aurebesh_engine import get_translator
+
+# Batches smaller than this are translated in-process: below it, shipping the
+# strings to worker processes costs more than translating them.
+POOL_THRESHOLD = 5000
+
+_pool = None
+_pool_workers = 0
+_pool_users = 0  # batches currently mapping on _pool
+_pool_cond = threading.Condition()
+
+# -----------------------------
+# Worker Pool
+# -----------------------------
+def _acquire_pool(workers):
+    # The pool is kept between calls so repeated batches don't pay the
+    # process start-up cost again. Callers may be on different threads (the
+    # HTTP service uses an executor), so the pool is only replaced once no
+    # batch is still mapping on it; release it with _release_pool().
+    global _pool, _pool_workers, _pool_users
+    with _pool_cond:
+        while _pool is not None and _pool_workers != workers and _pool_users:
+            _pool_cond.wait()
+        if _pool is None or _pool_workers != workers:
+            _shutdown_locked()
+            _pool = ProcessPoolExecutor(max_workers=workers)
+            _pool_workers = workers
+        _pool_users += 1
+        return _pool
+
+def _release_pool():
+    global _pool_users
+    with _pool_cond:
+        _pool_users -= 1
+        _pool_cond.notify_all()
+
+def shutdown_pool():
+    """Stop the worker processes, waiting for running batches first."""
+    with _pool_cond:
+        while _pool_users:
+            _pool_cond.wait()
+        _shutdown_locked()
+
+def _shutdown_locked():
+    global _pool, _pool_workers
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+        _pool_workers = 0
+
+atexit.register(shutdown_pool)
+
+def _translate_chunk(direction, texts):
+    translate = get_translator(direction)
+    return [translate(t) for t in texts]
+
+# -----------------------------
+# Batch Translation
+# -----------------------------
+def translate_many(texts, direction="to_aurebesh", workers=None, chunk_size=None,
+                   threshold=POOL_THRESHOLD):
+    """Translate a list of strings, spreading large batches over worker processes.
+
+    Results come back in input order. Batches shorter than ``threshold`` (or
+    with ``workers`` <= 1) skip the pool entirely.
+    """
+    translate = get_translator(direction)
+    texts = list(texts)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(texts) < threshold:
+        return [translate(t) for t in texts]
+
+    if chunk_size is None:
+        # A few chunks per worker keeps them busy if some chunks run long.
+        chunk_size = -(-len(texts) // (workers * 4))
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+
+    pool = _acquire_pool(workers)
+    try:
+        results = []
+        for translated in pool.map(_translate_chunk, [direction] * len(chunks), chunks):
+            results.extend(translated)
+    finally:
+        _release_pool()
+    return results
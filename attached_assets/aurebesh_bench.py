@@ -0,0 +1,302 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from aurebesh_core import add_history_entry, draw_choices
+from aurebesh_wordsearch import PuzzleBook, WordTrie, find_words, generate_seeded, pack_puzzle
+from aurebesh_engine import english_to_aurebesh, aurebesh_to_english
+from aurebesh_journal import HistoryJournal
+from aurebesh_persist import WriteBehindPersister, atomic_write_json
+from aurebesh_search import SearchIndex
+from aurebesh_sqlite import SQLiteStore
+
+CORPUS_SIZES = [10, 1024, 100 * 1024, 10 * 1024 * 1024, 100 * 1024 * 1024]
+HISTORY_SIZES = [100, 1000, 10000]
+WORD_SEARCH_CASES = [(12, 6), (12, 10), (20, 12), (30, 20)]
+SOLVER_DICTIONARY_SIZE = 100000
+DECK_SIZES = [34, 100, 1000]
+
+# Mix of plain words and ligature-heavy ones ("th", "sh", "oo", ...).
+_WORDS = (
+    "the force is strong with this one bad feeling about it shoot through hyperspace "
+    "wookiee khetanna moon chewbacca rebel alliance empire kashyyyk theed palace "
+    "thing ocean aeon sith jedi droid blaster ship"
+).split()
+
+# -----------------------------
+# Synthetic Inputs
+# -----------------------------
+def make_corpus(size, rng):
+    """English text of exactly `size` characters (ASCII, so also bytes)."""
+    words = []
+    length = 0
+    target = min(size, 64 * 1024)
+    while length < target:
+        word = rng.choice(_WORDS)
+        words.append(word)
+        length += len(word) + 1
+    block = " ".join(words)
+    # Tile one seeded block so 100 MB corpora don't take minutes to build.
+    return (block * (size // len(block) + 1))[:size]
+
+def make_history(count, rng):
+    return [{
+        "english": " ".join(rng.choice(_WORDS) for _ in range(6)),
+        "aurebesh": "",
+        "favorite": rng.random() < 0.1,
+        "timestamp": "2025-01-01T00:00:00",
+    } for _ in range(count)]
+
+def make_words(count, rng, min_len=3, max_len=8):
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    return ["".join(rng.choice(letters) for _ in range(rng.randint(min_len, max_len)))
+            for _ in range(count)]
+
+# -----------------------------
+# Timing
+# -----------------------------
+def _time(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return {"min_s": min(times), "median_s": statistics.median(times), "repeat": repeat}
+
+def _label(size):
+    for unit, scale in (("MB", 1024 * 1024), ("KB", 1024)):
+        if size >= scale:
+            return f"{size // scale}{unit}"
+    return f"{size}B"
+
+# -----------------------------
+# Benchmarks
+# -----------------------------
+def bench_translation(results, rng, repeat, max_bytes):
+    for size in CORPUS_SIZES:
+        if size > max_bytes:
+            continue
+        english = make_corpus(size, rng)
+        aurebesh = english_to_aurebesh(english)
+        runs = repeat if size < 10 * 1024 * 1024 else 1
+        for name, fn, text in (("to_aurebesh", english_to_aurebesh, english),
+                               ("to_english", aurebesh_to_english, aurebesh)):
+            stats = _time(lambda: fn(text), runs)
+            stats["mb_per_s"] = size / (1024 * 1024) / stats["min_s"] if stats["min_s"] else 0.0
+            results[f"translate.{name}.{_label(size)}"] = stats
+
+def bench_history(results, rng, repeat, ops=20):
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in HISTORY_SIZES:
+            snapshot = os.path.join(tmp, f"history_{count}.json")
+            with open(snapshot, "w", encoding="utf-8") as f:
+                json.dump([dict(entry, id=i) for i, entry in enumerate(make_history(count, rng))], f)
+            journal = HistoryJournal(snapshot)
+            phrases = [f"entry {i}" for i in range(ops)]
+
+            def run_adds():
+                for phrase in phrases:
+                    add_history_entry(phrase, phrase, journal)
+
+            def run_favorites():
+                for entry_id in range(ops):
+                    journal.set_favorite(entry_id, True)
+
+            stats = _time(run_adds, repeat)
+            stats["per_op_s"] = stats["min_s"] / ops
+            results[f"history.add_history_entry.{count}"] = stats
+            stats = _time(run_favorites, repeat)
+            stats["per_op_s"] = stats["min_s"] / ops
+            results[f"history.set_favorite.{count}"] = stats
+            results[f"history.compact.{count}"] = _time(journal.compact, repeat)
+            results[f"history.load.{count}"] = _time(lambda: HistoryJournal(snapshot).close(), repeat)
+            journal.close()
+
+def bench_history_sqlite(results, rng, repeat, ops=20):
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in HISTORY_SIZES:
+            path = os.path.join(tmp, f"history_{count}.db")
+            store = SQLiteStore(path)
+            store.import_data([dict(entry, id=i + 1) for i, entry in enumerate(make_history(count, rng))], [], [])
+            journal = store.history()
+            phrases = [f"entry {i}" for i in range(ops)]
+
+            def run_adds():
+                for phrase in phrases:
+                    add_history_entry(phrase, phrase, journal)
+
+            def run_favorites():
+                for entry_id in range(1, ops + 1):
+                    journal.set_favorite(entry_id, True)
+
+            stats = _time(run_adds, repeat)
+            stats["per_op_s"] = stats["min_s"] / ops
+            results[f"history_sqlite.add_history_entry.{count}"] = stats
+            stats = _time(run_favorites, repeat)
+            stats["per_op_s"] = stats["min_s"] / ops
+            results[f"history_sqlite.set_favorite.{count}"] = stats
+            results[f"history_sqlite.first_page.{count}"] = _time(lambda: journal.page(0, 100), repeat)
+            results[f"history_sqlite.last_page.{count}"] = _time(lambda: journal.page(count - 100, 100), repeat)
+            store.close()
+
+def bench_write_behind(results, rng, repeat, ops=20, count=10000):
+    """UI-thread cost of a favorite toggle: journal record plus saved-phrases save."""
+    with tempfile.TemporaryDirectory() as tmp:
+        entries = [dict(entry, id=i) for i, entry in enumerate(make_history(count, rng))]
+        phrases = [entry["english"] for entry in entries[:1000]]
+        for mode in ("sync", "deferred"):
+            snapshot = os.path.join(tmp, f"history_{mode}.json")
+            with open(snapshot, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            saved_path = os.path.join(tmp, f"saved_{mode}.json")
+            persister = WriteBehindPersister() if mode == "deferred" else None
+            journal = HistoryJournal(snapshot, persister=persister)
+
+            def toggle():
+                for entry_id in range(ops):
+                    journal.set_favorite(entry_id, entry_id % 2 == 0)
+                    data = list(phrases)
+                    save = lambda: atomic_write_json(saved_path, data, ensure_ascii=False, indent=2)
+                    if persister is None:
+                        save()
+                    else:
+                        persister.schedule("saved_phrases", save)
+
+            stats = _time(toggle, repeat)
+            stats["per_op_s"] = stats["min_s"] / ops
+            results[f"write_behind.toggle_favorite.{mode}"] = stats
+            if persister is not None:
+                results["write_behind.flush.deferred"] = _time(persister.flush, 1)
+                persister.close()
+            journal.close()
+
+def bench_search(results, rng, repeat, count=100000):
+    docs = [(i, entry["english"]) for i, entry in enumerate(make_history(count, rng))]
+    results[f"search.build.{count}"] = _time(lambda: SearchIndex(docs), 1)
+    index = SearchIndex(docs)
+    for query in ("t", "the", "force str", "sh wo", "zzz"):
+        results[f"search.query.{query.replace(' ', '+')}"] = _time(
+            lambda: index.search(query, newest_first=True, limit=100), repeat)
+    next_id = count
+
+    def update():
+        nonlocal next_id
+        index.add(next_id, "a brand new translation")
+        index.remove(next_id - count)
+        next_id += 1
+
+    stats = _time(update, repeat)
+    results["search.add_and_remove"] = stats
+
+def bench_word_search(results, rng, repeat):
+    for size, count in WORD_SEARCH_CASES:
+        words = make_words(count, rng, max_len=min(8, size))
+        seed = rng.getrandbits(32)
+        failures = 0
+
+        # Seeded, so every repetition (and every run with the same --seed)
+        # does the same search.
+        def run():
+            nonlocal failures
+            try:
+                generate_seeded(words, size, seed)
+            except ValueError:
+                failures += 1
+
+        stats = _time(run, repeat)
+        stats["failures"] = failures
+        results[f"word_search.{size}x{size}.{count}_words"] = stats
+
+    # Packed puzzles, as the pre-generation cache stores them.
+    size, count = WORD_SEARCH_CASES[0]
+    words = make_words(count, rng, max_len=min(8, size))
+    data = b"".join(pack_puzzle(seed, *generate_seeded(words, size, seed)) for seed in range(repeat))
+    book = PuzzleBook(data)
+    results[f"word_search.pack.{size}x{size}"] = _time(
+        lambda: pack_puzzle(0, *generate_seeded(words, size, 0)), repeat)
+    results[f"word_search.unpack.{size}x{size}"] = _time(lambda: book.puzzle(len(book) - 1), repeat)
+    results["word_search.book_load"] = _time(lambda: PuzzleBook(data), repeat)
+
+    # Solving a finished grid against a big dictionary.
+    dictionary = make_words(SOLVER_DICTIONARY_SIZE, rng)
+    results["word_search.trie_build"] = _time(lambda: WordTrie(dictionary), 1)
+    trie = WordTrie(dictionary)
+    for size, count in WORD_SEARCH_CASES:
+        grid, _ = generate_seeded(make_words(count, rng, max_len=min(8, size)), size, 0)
+        stats = _time(lambda: find_words(grid, trie), repeat)
+        stats["found"] = len(find_words(grid, trie))
+        results[f"word_search.solve.{size}x{size}"] = stats
+
+def bench_flashcards(results, rng, repeat):
+    for size in DECK_SIZES:
+        deck = make_words(size, rng)
+
+        # One full pass through the deck, as FlashCardPopup.next_card does.
+        def run():
+            for card in deck:
+                draw_choices(deck, card)
+
+        stats = _time(run, repeat)
+        stats["per_card_s"] = stats["min_s"] / size
+        results[f"flashcards.next_card.{size}_cards"] = stats
+
+GROUPS = {
+    "translation": lambda results, rng, args: bench_translation(results, rng, args.repeat, args.max_bytes),
+    "history": lambda results, rng, args: bench_history(results, rng, args.repeat),
+    "history_sqlite": lambda results, rng, args: bench_history_sqlite(results, rng, args.repeat),
+    "search": lambda results, rng, args: bench_search(results, rng, args.repeat),
+    "write_behind": lambda results, rng, args: bench_write_behind(results, rng, args.repeat),
+    "word_search": lambda results, rng, args: bench_word_search(results, rng, args.repeat),
+    "flashcards": lambda results, rng, args: bench_flashcards(results, rng, args.repeat),
+}
+
+# -----------------------------
+# Command-Line Entry Point
+# -----------------------------
+def run(groups=None, seed=1234, repeat=5, max_bytes=CORPUS_SIZES[-1]):
+    args = argparse.Namespace(repeat=repeat, max_bytes=max_bytes)
+    results = {}
+    for name in groups or GROUPS:
+        # Each group gets its own seeded generator so groups can be run
+        # alone and still see the same inputs.
+        GROUPS[name](results, random.Random(f"{seed}:{name}"), args)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the translator's hot paths.")
+    parser.add_argument("groups", nargs="*",
+                        help=f"benchmark groups to run: {', '.join(GROUPS)} (default: all)")
+    parser.add_argument("-o", "--output", help="write JSON here instead of stdout")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-bytes", type=int, default=CORPUS_SIZES[-1],
+                        help="skip translation corpora larger than this")
+    args = parser.parse_args(argv)
+    unknown = [g for g in args.groups if g not in GROUPS]
+    if unknown:
+        parser.error(f"unknown benchmark group(s): {', '.join(unknown)}")
+
+    report = run(args.groups, args.seed, args.repeat, args.max_bytes)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+import sys
+import threading
+from collections import OrderedDict
+
+from aurebesh_engine import get_translator
+
+# -----------------------------
+# Bounded LRU Translation Cache
+# -----------------------------
+class TranslationCache:
+    """LRU memo in front of both translation directions.
+
+    Bounded by entry count and by the approximate memory held by the cached
+    strings; whichever limit is hit first evicts the least recently used
+    entries. Safe to share between threads.
+    """
+    def __init__(self, maxsize=2048, maxbytes=4 * 1024 * 1024):
+        if maxsize < 1 or maxbytes < 1:
+            raise ValueError("Cache limits must be positive")
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def translate(self, text, direction="to_aurebesh"):
+        key = (direction, text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        # Translate outside the lock so other threads aren't held up.
+        result = get_translator(direction)(text)
+        cost = sys.getsizeof(text) + sys.getsizeof(result)
+        if cost > self.maxbytes:
+            return result
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (result, cost)
+                self._bytes += cost
+                while len(self._entries) > self.maxsize or self._bytes > self.maxbytes:
+                    _, (_, old_cost) = self._entries.popitem(last=False)
+                    self._bytes -= old_cost
+                    self.evictions += 1
+        return result
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+translation_cache = TranslationCache()
+
+def cached_translate(text, direction="to_aurebesh"):
+    return translation_cache.translate(text, direction)
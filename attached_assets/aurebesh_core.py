@@ -0,0 +1,485 @@
+import json
+import os
+import random
+import threading
+
+from aurebesh_engine import ligatures
+from aurebesh_journal import HistoryJournal
+from aurebesh_persist import WriteBehindPersister, atomic_write_json
+from aurebesh_search import SearchIndex, scan
+
+# -----------------------------
+# Persistent Storage for Saved Phrases and History
+# -----------------------------
+# "json" keeps the original per-file storage; "sqlite" keeps everything in
+# one indexed database (imported from the JSON files on first use).
+STORAGE_BACKEND = os.environ.get("AUREBESH_STORAGE", "json")
+DATABASE_FILE = os.path.join(os.path.dirname(__file__), "aurebesh.db")
+
+_store = None
+_store_lock = threading.Lock()
+
+# Saves from the UI are queued here and written on a background thread.
+# Saved phrases and unlocked tiers are read from memory once loaded, so the
+# UI never waits for a pending write.
+persister = WriteBehindPersister()
+
+def flush_pending_writes():
+    persister.flush()
+
+def use_sqlite():
+    if STORAGE_BACKEND not in ("json", "sqlite"):
+        raise ValueError(f"Unknown storage backend: {STORAGE_BACKEND!r}")
+    return STORAGE_BACKEND == "sqlite"
+
+def get_store():
+    global _store
+    with _store_lock:  # the persister thread may get here first
+        if _store is None:
+            from aurebesh_sqlite import SQLiteStore
+            store = SQLiteStore(DATABASE_FILE)
+            if store.needs_import():
+                store.import_data(
+                    HistoryJournal(HISTORY_FILE, HISTORY_LOG_FILE),
+                    _read_json(SAVED_PHRASES_FILE, []),
+                    _read_json(UNLOCKED_TIERS_FILE, {}).get("tiers", []),
+                )
+            _store = store
+    return _store
+
+def _read_json(path, default):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+    except Exception as e:
+        print("Error reading", path, e)
+        return default
+
+SAVED_PHRASES_FILE = os.path.join(os.path.dirname(__file__), "saved_phrases.json")
+def load_saved_phrases():
+    if use_sqlite():
+        return get_store().load_saved_phrases()
+    try:
+        with open(SAVED_PHRASES_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print("No saved phrases found:", e)
+        return []
+def save_phrases_to_file(phrases):
+    global _saved_phrases
+    phrases = list(dict.fromkeys(phrases))
+    with _index_lock:
+        _saved_phrases = phrases
+        _indexes["saved"] = None  # rebuilt on the next search
+        _index_backlog["saved"] = None  # and any build under way is stale
+        _revisions["saved"] += 1
+    if use_sqlite():
+        snapshot = list(phrases)
+        _schedule_phrase_change(lambda store: store.save_saved_phrases(snapshot))
+    else:
+        _schedule_phrases_save(phrases)
+def _schedule_phrases_save(phrases):
+    phrases = list(phrases)
+    persister.schedule("saved_phrases", lambda: _write_phrases(phrases))
+def _write_phrases(phrases):
+    try:
+        atomic_write_json(SAVED_PHRASES_FILE, phrases, ensure_ascii=False, indent=2)
+    except Exception as e:
+        print("Error saving phrases:", e)
+
+# Under SQLite each change touches only its own row, so they can't replace
+# one another like whole-file saves do; they are queued in order and the
+# persister applies every queued change in one go.
+_phrase_changes = []
+_phrase_changes_lock = threading.Lock()
+
+def _schedule_phrase_change(change):
+    with _phrase_changes_lock:
+        _phrase_changes.append(change)
+    persister.schedule("saved_phrases", _write_phrase_changes)
+def _write_phrase_changes():
+    with _phrase_changes_lock:
+        changes = list(_phrase_changes)
+        del _phrase_changes[:]
+    store = get_store()
+    for change in changes:
+        change(store)
+
+UNLOCKED_TIERS_FILE = os.path.join(os.path.dirname(__file__), "unlocked_tiers.json")
+_unlocked_tiers = None  # last saved tiers; ahead of the disk while a write is pending
+
+def load_unlocked_tiers():
+    if _unlocked_tiers is not None:
+        return set(_unlocked_tiers)
+    if use_sqlite():
+        return get_store().load_unlocked_tiers()
+    try:
+        with open(UNLOCKED_TIERS_FILE, "r", encoding="utf-8") as f:
+            return set(json.load(f).get("tiers", [1]))
+    except:
+        return {1}
+
+def save_unlocked_tiers(tiers_set):
+    global _unlocked_tiers
+    tiers = _unlocked_tiers = sorted(tiers_set)
+    if use_sqlite():
+        persister.schedule("unlocked_tiers", lambda: get_store().save_unlocked_tiers(tiers))
+    else:
+        persister.schedule("unlocked_tiers", lambda: _write_unlocked_tiers(tiers))
+def _write_unlocked_tiers(tiers):
+    try:
+        atomic_write_json(UNLOCKED_TIERS_FILE, {"tiers": tiers}, indent=2)
+    except Exception as e:
+        print("Error saving unlocked tiers:", e)
+
+HISTORY_FILE = os.path.join(os.path.dirname(__file__), "history.json")
+HISTORY_LOG_FILE = os.path.join(os.path.dirname(__file__), "history.jsonl")
+def load_history():
+    if use_sqlite():
+        return get_store().history()
+    return HistoryJournal(HISTORY_FILE, HISTORY_LOG_FILE, persister=persister)
+
+# The stored data is read on first use rather than at import time, so
+# scripts that only translate never touch the disk.
+_history = None
+_saved_phrases = None
+
+def get_history():
+    global _history
+    if _history is None:
+        _history = load_history()
+    return _history
+
+def get_saved_phrases():
+    """All saved phrases, oldest first, loaded once and kept in memory."""
+    global _saved_phrases
+    if _saved_phrases is None:
+        _saved_phrases = load_saved_phrases()
+    return _saved_phrases
+
+def __getattr__(name):
+    if name == "history":
+        return get_history()
+    if name == "saved_phrases":
+        return get_saved_phrases()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def add_history_entry(eng, aus, journal=None):
+    if not eng.strip():
+        return
+    history = journal if journal is not None else get_history()
+    last = history.last()
+    if last and last["english"] == eng:
+        return
+    entry = history.append(eng, aus)
+    if journal is None:
+        _reindex("history", entry["id"], eng)
+
+def delete_history_entry(entry_id):
+    get_history().delete(entry_id)
+    _reindex("history", entry_id, None)
+
+def toggle_history_favorite(entry_id):
+    """Flip an entry's favorite flag, saving or unsaving its phrase to match."""
+    history = get_history()
+    entry = history.get(entry_id)
+    if entry is None:
+        raise KeyError(entry_id)
+    favorite = not entry.get("favorite", False)
+    history.set_favorite(entry_id, favorite)
+    if favorite:
+        add_saved_phrase(entry["english"])
+    else:
+        remove_saved_phrase(entry["english"])
+    return favorite
+
+def add_saved_phrase(phrase):
+    phrases = get_saved_phrases()
+    added = phrase not in phrases
+    if added:
+        phrases.append(phrase)
+        if use_sqlite():
+            _schedule_phrase_change(lambda store: store.add_saved_phrase(phrase))
+        else:
+            _schedule_phrases_save(phrases)
+        _reindex("saved", phrase, phrase)
+    return added
+
+def remove_saved_phrase(phrase):
+    phrases = get_saved_phrases()
+    removed = phrase in phrases
+    if removed:
+        phrases.remove(phrase)
+        if use_sqlite():
+            _schedule_phrase_change(lambda store: store.remove_saved_phrase(phrase))
+        else:
+            _schedule_phrases_save(phrases)
+        _reindex("saved", phrase, None)
+    return removed
+
+def page_saved_phrases(offset, limit):
+    return get_saved_phrases()[offset:offset + limit]
+
+# -----------------------------
+# Search Over History and Saved Phrases
+# -----------------------------
+# Each index is built once and then kept current by the functions above.
+# prepare_search_indexes() lets the UI build them on a background thread
+# before the user starts typing. Builds run outside _index_lock, so
+# changes and searches never wait for one: changes made meanwhile are
+# queued in _index_backlog and replayed onto the new index, and searches
+# scan the documents directly until it is ready.
+_index_lock = threading.RLock()
+_indexes = {"history": None, "saved": None}
+_index_backlog = {"history": None, "saved": None}  # [(doc id, text)] while building
+# Bumped on every change, so a pop-up that is opened again can tell
+# whether the rows it already shows are still current.
+_revisions = {"history": 0, "saved": 0}
+
+def data_revision(name):
+    """Change counter for "history" or "saved"."""
+    return _revisions[name]
+
+def _index_docs(name):
+    if name == "history":
+        return [(entry["id"], entry["english"]) for entry in get_history()]
+    return [(phrase, phrase) for phrase in get_saved_phrases()]
+
+def _apply_change(index, doc_id, text):
+    if text is None:
+        index.remove(doc_id)
+    else:
+        index.add(doc_id, text)
+
+def _build_index(name):
+    """Build the index for `name` unless it exists or another thread is
+    already building it."""
+    with _index_lock:
+        if _indexes[name] is not None or _index_backlog[name] is not None:
+            return
+        backlog = _index_backlog[name] = []
+    try:
+        # Changes from here on are queued as well as being in the snapshot;
+        # replaying them is harmless, since add and remove are idempotent.
+        index = SearchIndex(_index_docs(name))
+    except BaseException:
+        with _index_lock:
+            if _index_backlog[name] is backlog:
+                _index_backlog[name] = None
+        raise
+    with _index_lock:
+        if _index_backlog[name] is not backlog:
+            return  # the data was replaced while we were building
+        for doc_id, text in backlog:
+            _apply_change(index, doc_id, text)
+        _indexes[name] = index
+        _index_backlog[name] = None
+
+def _reindex(name, doc_id, text):
+    with _index_lock:
+        _revisions[name] += 1
+        if _indexes[name] is not None:
+            _apply_change(_indexes[name], doc_id, text)
+        elif _index_backlog[name] is not None:
+            _index_backlog[name].append((doc_id, text))
+
+def prepare_search_indexes():
+    _build_index("history")
+    _build_index("saved")
+
+def _search(name, query, newest_first=False, limit=None):
+    with _index_lock:
+        index = _indexes[name]
+        if index is not None:
+            return index.search(query, newest_first=newest_first, limit=limit)
+        building = _index_backlog[name] is not None
+    if not building:
+        threading.Thread(target=_build_index, args=(name,), daemon=True).start()
+    return scan(_index_docs(name), query, newest_first=newest_first, limit=limit)
+
+def search_history(query, limit=None):
+    """Ids of history entries whose English text matches `query`, newest first."""
+    return _search("history", query, newest_first=True, limit=limit)
+
+def search_saved_phrases(query, limit=None):
+    """Saved phrases matching `query`, in the order they were saved."""
+    return _search("saved", query, limit=limit)
+
+# -----------------------------
+# Preset Phrases
+# -----------------------------
+preset_phrases = [
+  "May the Force be with you",
+  "I have a bad feeling about this",
+  "Do. Or do not. There is no try.",
+  "This is the way",
+  "Use the Force, Luke.",
+  "Help me, Obi-Wan Kenobi. You’re my only hope.",
+  "These aren’t the droids you’re looking for.",
+  "I find your lack of faith disturbing.",
+  "The Force will be with you. Always.",
+  "Never tell me the odds!",
+  "It’s a trap!",
+  "In my experience, there's no such thing as luck.",
+  "Stay on target.",
+  "I am your father.",
+  "I will not be the last Jedi.",
+  "Rebellions are built on hope.",
+  "I am one with the Force. The Force is with me.",
+  "I feel the good in you, the conflict.",
+  "Your eyes can deceive you; don’t trust them.",
+  "The circle is now complete.",
+  "Remember, the Force will be with you, always.",
+  "Now this is podracing!",
+  "You were the chosen one!",
+  "I have the highground",
+  "You’ve taken your first step into a larger world.",
+  "Only a Sith deals in absolutes.",
+  "Power! Unlimited power!",
+  "I’m altering the deal. Pray I don’t alter it any further.",
+  "Why, you stuck-up, half-witted, scruffy-looking nerf herder!",
+  "I suggest a new strategy, R2. Let the Wookiee win.",
+  "Truly wonderful, the mind of a child is.",
+  "I am a Jedi, like my father before me.",
+  "You don’t know the power of the dark side!",
+  "Chewie, we’re home.",
+  "I’ll never turn to the dark side.",
+  "I’ve been waiting for you, Obi-Wan.",
+  "I’ve got a bad feeling about this.",
+  "I want to go home and rethink my life.",
+  "That’s no moon. It’s a space station.",
+  "You don’t believe in the Force, do you?",
+  "Mind tricks don’t work on me.",
+  "I’m just a simple man trying to make my way in the universe.",
+  "Fear leads to anger. Anger leads to hate. Hate leads to suffering.",
+  "We take them together.",
+  "Light the fire.",
+  "It’s not about lifting rocks.",
+  "You know, sometimes I amaze even myself.",
+  "This deal is getting worse all the time.",
+  "It’s like poetry, it rhymes.",
+  "The Force is strong with this one.",
+  "Let the Wookiee win.",
+  "Don’t get cocky.",
+  "Somebody has to save our skins.",
+  "Clearly the kid is the brains of the operation.",
+  "Understanding you does not mean I agree with you.",
+  "Oh, I'm confident, I'm just not stupid.",
+  "Good soldiers follow orders.",
+  "This Is on You Now. This Is Like Skin.",
+  "You've Become More Than Your Fear.",
+  "That Ends Today! There Is One Way Out.",
+  "The Empire Is a Disease That Thrives in Darkness.",
+  "We're the Rhydo, Kid. We're the Fuel.",
+  "Remember This: Try.",
+  "The Death of Truth Is the Ultimate Victory of Evil.",
+  "I Burn My Life to Make a Sunrise That I Know I'll Never See.",
+  "Tyranny requires constant effort.",
+  "So this is how liberty dies. With Thunderous applause.",
+  "Your focus determines your reality.",
+  "There's always a bigger fish.",
+  "Fear is the path to the dark side.",
+  "Luminous beings are we, not this crude matter.",
+  "The greatest teacher, failure is.",
+  "We are what they grow beyond.",
+  "Adventure. Excitement. A jedi craves not these things.",
+  "You must unlearn what you have learned.",
+  "To defeat an enemy, you must know them.",
+  "Be careful not to choke on your aspirations.",
+  "This will be a day long remembered.",
+  "The Force, the Jedi. All of it. It's all true.",
+  "I am no Jedi, but I know the Force.",
+  "An elegant weapon for a more civilized age.",
+
+]
+
+def get_all_phrases():
+    return preset_phrases + get_saved_phrases()
+
+# -----------------------------
+# Flash‐Card Tier Definitions
+# -----------------------------
+TIERS = {
+    # Tier 1 is single letters + digraph ligatures
+    1: [chr(c) for c in range(ord('a'), ord('z')+1)] + list(ligatures.keys()),
+    # Tier 2 might be simple words (you can flesh this out later)
+    2: [
+  "lightsaber", "blaster", "bowcaster", "thermal detonator", "ion cannon",
+  "disruptor", "electrostaff", "force pike", "comlink", "datapad",
+
+  "x-wing", "tie fighter", "millennium falcon", "star destroyer", "tie advanced",
+  "snowspeeder", "podracer", "slave i", "speeder bike", "imperial shuttle",
+
+  "luke", "leia", "han", "chewbacca", "yoda",
+  "obi wan", "anakin", "vader", "palpatine", "lando",
+
+  "wookiee", "ewok", "rodian", "twi'lek", "zabrak",
+  "mon calamari", "duros", "bothan", "kashyyykian", "jawa",
+
+  "tatooine", "coruscant", "naboo", "hoth", "endor",
+  "kamino", "geonosis", "mustafar", "dagobah", "kashyyyk",
+
+  "rebel alliance", "galactic empire", "first order", "resistance", "jedi order",
+  "sith order", "bounty hunters", "clone troopers", "stormtroopers", "droids",
+
+  "death star", "jabbas palace", "cloud city", "mos eisley", "mos espas",
+  "jundland wastes", "ootini", "yavin 4", "theed palace", "hanging gardens",
+
+  "hyperspace", "blue squadron", "gold squadron", "rogue squadron", "force sensitive",
+  "holocron", "midichlorian", "lightspeed", "hyperdrive", "cantina",
+
+  "padawan", "jedi master", "jedi knight", "sith lord", "grand moff",
+  "moff", "admiral", "general", "commander", "captain",
+
+  "u-wing", "a-wing", "b-wing", "tie interceptor", "tie bomber",
+  "starfighter", "cr90 corvette", "venator class star destroyer", "mon cal amphibious cruiser", "droid control ship"
+]
+,
+    # Tier 3 is your full preset phrases
+    3: preset_phrases
+}
+
+# -----------------------------
+# Word Search Generation
+# -----------------------------
+# The generator lives in aurebesh_wordsearch; it is re-exported here
+# alongside the rest of the game data.
+from aurebesh_wordsearch import generate_word_search, find_words, AnswerKey, Puzzle, PuzzlePool, WordTrie
+
+WORD_SEARCH_CACHE_FILE = os.path.join(os.path.dirname(__file__), "word_search_cache.bin")
+# (words, grid size) pairs the app offers; puzzles for each are generated
+# ahead of time in the background.
+WORD_SEARCH_PUZZLES = [
+    (["MAY", "THE", "FORCE", "BE", "WITH", "YOU"], 12),
+]
+
+# Learning words (tier 2 and up) shorter than this may turn up by chance
+# in a puzzle's random fill.
+EXTRA_WORD_MIN_LENGTH = 3
+
+_puzzle_pool = None
+
+def get_puzzle_pool():
+    """The shared PuzzlePool, started on first use."""
+    global _puzzle_pool
+    if _puzzle_pool is None:
+        # Keep the app's own vocabulary out of the fill, so the only words
+        # a player can find are the ones they were asked for.
+        vocabulary = WordTrie((w for tier, words in TIERS.items() if tier >= 2 for w in words),
+                              min_length=EXTRA_WORD_MIN_LENGTH)
+        _puzzle_pool = PuzzlePool(WORD_SEARCH_CACHE_FILE, WORD_SEARCH_PUZZLES, persister=persister,
+                                  avoid=vocabulary)
+        _puzzle_pool.start()
+    return _puzzle_pool
+
+# -----------------------------
+# Flash-Card Deck Sampling
+# -----------------------------
+def draw_choices(cards, answer, count=4):
+    """Pick count-1 distractors from the deck and shuffle in the answer."""
+    others = [o for o in cards if o != answer]
+    choices = random.sample(others, count - 1) + [answer]
+    random.shuffle(choices)
+    return choices
@@ -0,0 +1,285 @@
+import re
+import unicodedata
+
+# -----------------------------
+# Define Ligatures and Mappings
+# -----------------------------
+ligatures = {
+    "ch": "\ue011",
+    "sh": "\ue016",
+    "th": "\ue018",
+    "ae": "\ue010",
+    "eo": "\ue012",
+    "kh": "\ue013",
+    "oo": "\ue015",
+    "ng": "\ue014"
+}
+
+# -----------------------------
+# Compiled Ligature Tables
+# -----------------------------
+class _ReverseTable(dict):
+    """str.translate() table: glyph -> ligature, anything else -> NFC lowercase.
+
+    Non-glyph characters are resolved on first sight and memoized, so each
+    distinct code point is normalized once instead of once per occurrence.
+    """
+    def __missing__(self, cp):
+        value = unicodedata.normalize('NFC', chr(cp)).lower()
+        self[cp] = value
+        return value
+
+_END = ""  # trie key marking that a ligature ends at this node
+
+def _trie_pattern(node):
+    # Children are tried before the end marker, so the regex prefers the
+    # longest ligature and only backs off to a shorter one when it must.
+    branches = [re.escape(ch) + _trie_pattern(child)
+                for ch, child in sorted(node.items()) if ch != _END]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    return "(?:" + body + ")?" if _END in node else body
+
+class LigatureTable:
+    """A ligature set compiled for greedy longest-match translation.
+
+    The ligatures are stored in a trie, which is compiled into a single
+    regex: at each position the scanner follows one trie path, so the cost
+    per character depends on the longest ligature, not on how many there
+    are. Ligatures may be any length; each maps to a single glyph.
+    """
+    def __init__(self, table):
+        self.table = {}
+        self._trie = {}
+        reverse = _ReverseTable()
+        for lig, glyph in table.items():
+            lig = lig.lower()
+            if not lig or len(glyph) != 1:
+                raise ValueError(f"Invalid ligature {lig!r} -> {glyph!r}")
+            if ord(glyph) in reverse:
+                raise ValueError(f"Glyph {glyph!r} is used by more than one ligature")
+            self.table[lig] = glyph
+            reverse[ord(glyph)] = lig
+            node = self._trie
+            for ch in lig:
+                node = node.setdefault(ch, {})
+            node[_END] = glyph
+        self.max_length = max(map(len, self.table), default=1)
+        self._forward_re = re.compile(_trie_pattern(self._trie) or "(?!)")
+        self._forward_sub = lambda m: self.table[m.group()]
+        self._reverse = reverse
+
+    def to_aurebesh(self, text):
+        # Glyphs live in the Private Use Area and have no case, so
+        # upper-casing after the substitution only touches single letters.
+        return self._forward_re.sub(self._forward_sub, text.lower()).upper()
+
+    def to_english(self, text):
+        return text.translate(self._reverse)
+
+    def to_aurebesh_partial(self, text):
+        """Translate text that continues in a later chunk.
+
+        Returns (output, rest). rest is the lowercased tail that could still
+        grow into a longer ligature; prepend it to the next chunk.
+        """
+        lowered = text.lower()
+        n = len(lowered)
+        window = n - self.max_length + 1  # tokens starting before this are final
+        spans = []
+        def sub(m):
+            if m.end() > window:
+                spans.append(m.span())
+            return self.table[m.group()]
+        out = self._forward_re.sub(sub, lowered)
+
+        cut = n
+        i = max(window, 0)
+        while i < n:
+            end = i + 1
+            for s, e in spans:
+                if s < i < e:       # inside a ligature that started earlier
+                    break
+                if s == i:
+                    end = e
+            else:
+                if self._could_extend(lowered, i, n):
+                    cut = i
+                    break
+            i = end if end > i else i + 1
+        if cut == n:
+            return out.upper(), ""
+        rest = lowered[cut:]
+        tail = self._forward_re.sub(self._forward_sub, rest)
+        return out[:len(out) - len(tail)].upper(), rest
+
+    def _could_extend(self, lowered, start, end):
+        # True if lowered[start:end] is a proper prefix of some ligature.
+        node = self._trie
+        for ch in lowered[start:end]:
+            node = node.get(ch)
+            if node is None:
+                return False
+        return any(key != _END for key in node)
+
+    def spans_boundary(self, text, i):
+        """True if some ligature occurrence in text crosses position i."""
+        lo = max(0, i - self.max_length + 1)
+        chunk = text[lo:i + self.max_length - 1].lower()
+        cut = i - lo
+        for j in range(cut):
+            node = self._trie
+            for k in range(j, len(chunk)):
+                node = node.get(chunk[k])
+                if node is None:
+                    break
+                if k >= cut and _END in node:
+                    return True
+        return False
+
+default_table = LigatureTable(ligatures)
+
+def english_to_aurebesh(text):
+    return default_table.to_aurebesh(text)
+
+def aurebesh_to_english(text):
+    return default_table.to_english(text)
+
+# -----------------------------
+# Direction Lookup
+# -----------------------------
+DIRECTIONS = {
+    "to_aurebesh": english_to_aurebesh,
+    "to_english": aurebesh_to_english,
+}
+
+def get_translator(direction):
+    try:
+        return DIRECTIONS[direction]
+    except KeyError:
+        raise ValueError(f"Unknown translation direction {direction!r}") from None
+
+# -----------------------------
+# Incremental Re-translation
+# -----------------------------
+_BLOCK = 64  # characters compared per step when matching text around an edit
+_NEAR = 64  # how far either side of the cursor an edit is looked for
+
+# Lower-casing these depends on their neighbours (capital sigma) or changes
+# the length (dotted capital I), so text containing them is never cut.
+_UNCUTTABLE = "\u03a3\u0130"
+
+def _common_prefix_len(a, b, start=0):
+    # Galloping block comparisons: the scanning stays in C and the cost grows
+    # with the distance to the first difference, not with the length.
+    n = min(len(a), len(b))
+    i, step = min(start, n), _BLOCK
+    while i < n:
+        j = min(i + step, n)
+        if a[i:j] == b[i:j]:
+            i, step = j, step * 2
+        elif step > 1:
+            step //= 2
+        else:
+            return i
+    return n
+
+def _common_suffix_len(a, b, limit, start=0):
+    la, lb = len(a), len(b)
+    i, step = min(start, limit), _BLOCK
+    while i < limit:
+        j = min(i + step, limit)
+        if a[la - j:la - i] == b[lb - j:lb - i]:
+            i, step = j, step * 2
+        elif step > 1:
+            step //= 2
+        else:
+            return i
+    return limit
+
+def _uncuttable(text):
+    return sum(map(text.count, _UNCUTTABLE))
+
+class EditMirror:
+    """Keeps a translation in step with a source text as it is edited.
+
+    edit() returns the patch to apply to the translation. The edit is
+    looked for next to ``cursor`` (the TextInput's cursor_index()), and its
+    offset in the translation is counted from the previous edit, so only
+    the text between the two is translated: typing costs depend on the
+    size of the edit and how far the cursor moved, not on the length of
+    the text.
+    """
+    def __init__(self, direction):
+        self.direction = direction
+        self.translate = get_translator(direction)
+        self.reset("")
+
+    def reset(self, src):
+        """Start over from src; returns its full translation."""
+        dst = self.translate(src)
+        self.src = src
+        self.dst_len = len(dst)
+        self._anchor = (0, 0)  # a cut point in src and its offset in the translation
+        self._uncuttable = _uncuttable(src)
+        return dst
+
+    def edit(self, new_src, cursor=None):
+        """Return (start, end, text): replacing translation[start:end] with
+        text gives the translation of new_src."""
+        old_src = self.src
+        start, old_end, new_end = self._locate(old_src, new_src, cursor)
+        self._uncuttable += (_uncuttable(new_src[start:new_end])
+                             - _uncuttable(old_src[start:old_end]))
+        if self._uncuttable and self.translate is english_to_aurebesh:
+            old_len = self.dst_len
+            return 0, old_len, self.reset(new_src)
+
+        if self.translate is english_to_aurebesh:
+            # Widen the edit wherever a ligature could straddle its edges.
+            spans = default_table.spans_boundary
+            while spans(old_src, start) or spans(new_src, start):
+                start -= 1
+            while spans(old_src, old_end) or spans(new_src, new_end):
+                old_end += 1
+                new_end += 1
+
+        dst_start = self._offset(old_src, start)
+        old_len = len(self.translate(old_src[start:old_end]))
+        text = self.translate(new_src[start:new_end])
+        self.src = new_src
+        self.dst_len += len(text) - old_len
+        self._anchor = (start, dst_start)
+        return dst_start, dst_start + old_len, text
+
+    def _locate(self, old_src, new_src, cursor):
+        # Returns (start, old_end, new_end). An edit that inserts or deletes
+        # d characters at the cursor lies within d of it in both texts, so
+        # the search starts from a window around it. TextInput reports its
+        # cursor before or after the change, or not at all when another line
+        # changed, so the text outside the window is checked too: a plain
+        # comparison, without translating any of it.
+        old_len, new_len = len(old_src), len(new_src)
+        delta = new_len - old_len
+        shorter = min(old_len, new_len)
+        lo = hi = 0
+        if cursor is not None and delta:
+            reach = abs(delta) + _NEAR
+            lo = max(cursor - reach, 0)
+            hi = max(shorter - cursor - reach, 0)
+            if (not new_src.startswith(old_src[:lo])
+                    or not new_src.endswith(old_src[old_len - hi:])):
+                lo = hi = 0
+        p = _common_prefix_len(old_src, new_src, lo)
+        q = _common_suffix_len(old_src, new_src, shorter - p, hi)
+        return p, len(old_src) - q, len(new_src) - q
+
+    def _offset(self, src, i):
+        # Where src[:i] ends in the translation, counted from the anchor.
+        # Both positions are cut points, so translating the text between
+        # them gives exactly the translation in between.
+        anchor, offset = self._anchor
+        if i >= anchor:
+            return offset + len(self.translate(src[anchor:i]))
+        return offset - len(self.translate(src[i:anchor]))
@@ -0,0 +1,216 @@
+import itertools
+import json
+import os
+import threading
+from datetime import datetime
+
+from aurebesh_persist import atomic_write_json
+
+COMPACT_MIN_RECORDS = 1000
+
+# -----------------------------
+# Append-Only History Journal
+# -----------------------------
+class HistoryJournal:
+    """Translation history stored as a JSON snapshot plus a JSONL change log.
+
+    Adding an entry, flipping a favorite or deleting an entry appends one
+    small record to the log, so each write costs the same no matter how
+    long the history is. Once the log has as many records as the history
+    has entries (and at least `compact_min`), `compact()` folds it into a
+    fresh snapshot. Replaying a record twice is harmless, so a crash
+    between writing the snapshot and truncating the log loses nothing.
+
+    Entries carry a stable integer "id" that survives deletes and
+    compaction; iteration yields them oldest first.
+
+    With a `persister` (a WriteBehindPersister) records are queued in
+    memory and written by its background thread; call `flush()` to force
+    them out.
+    """
+    def __init__(self, snapshot_path, log_path=None, compact_min=COMPACT_MIN_RECORDS, persister=None):
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path or os.path.splitext(snapshot_path)[0] + ".jsonl"
+        self.compact_min = compact_min
+        self.persister = persister
+        self._entries = {}
+        self._next_id = 0
+        self._log = None
+        self._log_records = 0
+        self._queued_lines = []
+        self._queued_snapshot = None
+        self._queue_lock = threading.Lock()
+        self._file_lock = threading.Lock()
+        self._load()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(list(self._entries.values()))
+
+    def __reversed__(self):
+        return iter(list(reversed(self._entries.values())))
+
+    def get(self, entry_id):
+        return self._entries.get(entry_id)
+
+    def last(self):
+        if not self._entries:
+            return None
+        return next(reversed(self._entries.values()))
+
+    def page(self, offset, limit):
+        """Entries newest first, skipping `offset` of them."""
+        return list(itertools.islice(reversed(self._entries.values()), offset, offset + limit))
+
+    # -- Changes --------------------------------------------------------
+    def append(self, eng, aus, favorite=False):
+        entry = {
+            "id": self._next_id,
+            "english": eng,
+            "aurebesh": aus,
+            "favorite": favorite,
+            "timestamp": datetime.now().isoformat()
+        }
+        record = {"op": "add", "entry": entry}
+        self._apply(record)
+        self._write(record)
+        return entry
+
+    def set_favorite(self, entry_id, favorite):
+        if entry_id not in self._entries:
+            raise KeyError(entry_id)
+        record = {"op": "fav", "id": entry_id, "favorite": bool(favorite)}
+        self._apply(record)
+        self._write(record)
+
+    def delete(self, entry_id):
+        if entry_id not in self._entries:
+            raise KeyError(entry_id)
+        record = {"op": "del", "id": entry_id}
+        self._apply(record)
+        self._write(record)
+
+    def compact(self):
+        """Rewrite the snapshot from memory and empty the log."""
+        # The copy is taken now so the writer never sees later changes; any
+        # queued records are already part of it.
+        with self._queue_lock:
+            self._queued_snapshot = [dict(entry) for entry in self._entries.values()]
+            self._queued_lines = []
+        self._log_records = 0
+        self._schedule()
+
+    def flush(self):
+        """Write out any queued snapshot and log records."""
+        with self._file_lock:
+            with self._queue_lock:
+                snapshot, self._queued_snapshot = self._queued_snapshot, None
+                lines, self._queued_lines = self._queued_lines, []
+            try:
+                if snapshot is not None:
+                    atomic_write_json(self.snapshot_path, snapshot, ensure_ascii=False, indent=2)
+                    snapshot = None
+                    self._close_log()
+                    open(self.log_path, "w").close()
+                if lines:
+                    if self._log is None:
+                        self._log = open(self.log_path, "a", encoding="utf-8")
+                    self._log.write("".join(lines))
+                    self._log.flush()
+            except Exception as e:
+                print("Error saving history:", e)
+                self._requeue(snapshot, lines)
+
+    def close(self):
+        if self.persister is not None:
+            self.persister.flush(self.log_path)
+        self.flush()
+        with self._file_lock:
+            self._close_log()
+
+    # -- Internals ------------------------------------------------------
+    def _apply(self, record):
+        op = record["op"]
+        if op == "add":
+            entry = record["entry"]
+            self._entries[entry["id"]] = entry
+            self._next_id = max(self._next_id, entry["id"] + 1)
+        elif op == "fav":
+            entry = self._entries.get(record["id"])
+            if entry is not None:
+                entry["favorite"] = record["favorite"]
+        elif op == "del":
+            self._entries.pop(record["id"], None)
+        else:
+            raise ValueError(f"Unknown history record: {op!r}")
+
+    def _write(self, record):
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._queue_lock:
+            self._queued_lines.append(line)
+        self._log_records += 1
+        if self._log_records >= max(self.compact_min, len(self._entries)):
+            self.compact()
+        else:
+            self._schedule()
+
+    def _requeue(self, snapshot, lines):
+        # Put back whatever didn't reach the disk so the next flush retries
+        # it; records queued meanwhile are newer and go after it. A snapshot
+        # queued meanwhile already covers everything.
+        with self._queue_lock:
+            if self._queued_snapshot is None:
+                if snapshot is not None:
+                    self._queued_snapshot = snapshot
+                self._queued_lines[:0] = lines
+
+    def _schedule(self):
+        if self.persister is None:
+            self.flush()
+        else:
+            self.persister.schedule(self.log_path, self.flush)
+
+    def _close_log(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def _load(self):
+        migrated = False
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            snapshot = []
+        except Exception as e:
+            print("No history found:", e)
+            snapshot = []
+        for entry in snapshot:
+            if "id" not in entry:
+                # Files written before entries had ids.
+                entry = dict(entry, id=self._next_id)
+                migrated = True
+            self._apply({"op": "add", "entry": entry})
+
+        try:
+            with open(self.log_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            data = b""
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            # A crash mid-append leaves a torn last line; drop it so the
+            # next record starts on a line of its own.
+            with open(self.log_path, "r+b") as f:
+                f.truncate(end)
+        for line in data[:end].splitlines():
+            try:
+                self._apply(json.loads(line))
+            except (ValueError, KeyError, TypeError) as e:
+                print("Skipping bad history record:", e)
+            self._log_records += 1
+
+        if migrated:
+            self.compact()
@@ -0,0 +1,142 @@
+import atexit
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_DEBOUNCE = 0.5
+DEFAULT_MAX_WAIT = 2.0
+
+# -----------------------------
+# Atomic File Writes
+# -----------------------------
+def atomic_write_json(path, data, **dump_kwargs):
+    """Write `data` as JSON so readers only ever see the old or new file."""
+    _atomic_write(path, "w", lambda f: json.dump(data, f, **dump_kwargs), encoding="utf-8")
+
+def atomic_write_bytes(path, data):
+    """Write raw bytes so readers only ever see the old or new file."""
+    _atomic_write(path, "wb", lambda f: f.write(data))
+
+def _atomic_write(path, mode, write, **open_kwargs):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, mode, **open_kwargs) as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+# -----------------------------
+# Write-Behind Persister
+# -----------------------------
+class WriteBehindPersister:
+    """Runs save callbacks on a background thread, coalescing repeats.
+
+    `schedule(key, fn)` replaces any write still pending under `key`, so a
+    burst of saves to the same file costs one write. A write runs once
+    `debounce` seconds pass without a newer one, or `max_wait` seconds
+    after the first of the burst, whichever comes first. Writes never run
+    concurrently and a newer write for a key never runs before an older
+    one. Pending writes are flushed at interpreter exit.
+    """
+    def __init__(self, debounce=DEFAULT_DEBOUNCE, max_wait=DEFAULT_MAX_WAIT):
+        self.debounce = debounce
+        self.max_wait = max_wait
+        self._pending = OrderedDict()  # key -> (first, last, fn)
+        self._cond = threading.Condition()
+        self._run_lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+        self.writes = 0
+        self.coalesced = 0
+
+    def schedule(self, key, fn):
+        with self._cond:
+            if self._closed:
+                run_now = True
+            else:
+                run_now = False
+                now = time.monotonic()
+                if key in self._pending:
+                    first = self._pending.pop(key)[0]
+                    self.coalesced += 1
+                else:
+                    first = now
+                self._pending[key] = (first, now, fn)
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+                    self._thread.start()
+                    atexit.register(self.close)
+                self._cond.notify()
+        if run_now:
+            # Late saves (e.g. from other atexit handlers) go straight to disk.
+            with self._run_lock:
+                self._call(fn)
+
+    def pending(self):
+        with self._cond:
+            return list(self._pending)
+
+    def flush(self, key=None):
+        """Run pending writes (all, or just `key`) on the calling thread."""
+        with self._run_lock:
+            with self._cond:
+                if key is None:
+                    tasks = [fn for _, _, fn in self._pending.values()]
+                    self._pending.clear()
+                elif key in self._pending:
+                    tasks = [self._pending.pop(key)[2]]
+                else:
+                    tasks = []
+            for fn in tasks:
+                self._call(fn)
+
+    def close(self):
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def _deadline(self, first, last):
+        return min(first + self.max_wait, last + self.debounce)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if self._pending:
+                        now = time.monotonic()
+                        wait = min(self._deadline(f, l) for f, l, _ in self._pending.values()) - now
+                        if wait <= 0:
+                            break
+                        self._cond.wait(wait)
+                    else:
+                        self._cond.wait()
+                if self._closed:
+                    return
+            with self._run_lock:
+                with self._cond:
+                    now = time.monotonic()
+                    due = [k for k, (f, l, _) in self._pending.items() if self._deadline(f, l) <= now]
+                    tasks = [self._pending.pop(k)[2] for k in due]
+                for fn in tasks:
+                    self._call(fn)
+
+    def _call(self, fn):
+        try:
+            fn()
+            self.writes += 1
+        except Exception as e:
+            print("Error in background save:", e)
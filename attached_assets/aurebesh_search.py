@@ -0,0 +1,149 @@
+import bisect
+import heapq
+import itertools
+import re
+
+_TOKEN = re.compile(r"\w+")
+_MAX_CHAR = "\U0010ffff"
+_SHORT = 2  # prefixes this long or shorter get their own posting sets
+
+def tokenize(text):
+    return _TOKEN.findall(text.casefold())
+
+def _matches(prefixes, text):
+    folded = text.casefold()
+    # Substring tests are cheap and rule out most documents before the
+    # text has to be split into words.
+    if not all(prefix in folded for prefix in prefixes):
+        return False
+    words = _TOKEN.findall(folded)
+    return all(any(w.startswith(prefix) for w in words) for prefix in prefixes)
+
+def scan(docs, query, newest_first=False, limit=None):
+    """SearchIndex.search() straight over (doc id, text) pairs, in order.
+
+    For when the index isn't built yet: it is linear in the number of
+    documents, but needs no set-up.
+    """
+    prefixes = set(tokenize(query))
+    if not prefixes:
+        return []
+    if newest_first:
+        docs = reversed(docs)
+    hits = (doc_id for doc_id, text in docs if _matches(prefixes, text))
+    return list(itertools.islice(hits, limit))
+
+# -----------------------------
+# Inverted Search Index
+# -----------------------------
+class SearchIndex:
+    """Incremental inverted index over short texts (history, saved phrases).
+
+    Every query word is matched as a prefix of an indexed word, and all
+    query words must match ("han sol" finds "Han Solo"). Documents are
+    added and removed one at a time, so keeping the index current never
+    needs a rebuild. Results come back in the order documents were added.
+    """
+    def __init__(self, docs=()):
+        self._postings = {}  # word -> set of doc ids
+        self._words = []     # sorted vocabulary, for prefix ranges
+        self._docs = {}      # doc id -> (insertion order, words)
+        self._short = {}     # short prefix -> set of doc ids
+        self._counter = 0
+        for doc_id, text in docs:
+            self.add(doc_id, text)
+
+    def __len__(self):
+        return len(self._docs)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._docs
+
+    def add(self, doc_id, text):
+        if doc_id in self._docs:
+            self.remove(doc_id)
+        words = frozenset(tokenize(text))
+        self._docs[doc_id] = (self._counter, words)
+        self._counter += 1
+        for word in words:
+            posting = self._postings.get(word)
+            if posting is None:
+                posting = self._postings[word] = set()
+                bisect.insort(self._words, word)
+            posting.add(doc_id)
+        for prefix in self._short_prefixes(words):
+            self._short.setdefault(prefix, set()).add(doc_id)
+
+    def remove(self, doc_id):
+        doc = self._docs.pop(doc_id, None)
+        if doc is None:
+            return False
+        for word in doc[1]:
+            posting = self._postings[word]
+            posting.discard(doc_id)
+            if not posting:
+                del self._postings[word]
+                del self._words[bisect.bisect_left(self._words, word)]
+        for prefix in self._short_prefixes(doc[1]):
+            posting = self._short[prefix]
+            posting.discard(doc_id)
+            if not posting:
+                del self._short[prefix]
+        return True
+
+    @staticmethod
+    def _short_prefixes(words):
+        return {word[:n] for word in words for n in range(1, _SHORT + 1) if len(word) >= n}
+
+    def _expand(self, prefix):
+        lo = bisect.bisect_left(self._words, prefix)
+        hi = bisect.bisect_left(self._words, prefix + _MAX_CHAR, lo)
+        return self._words[lo:hi]
+
+    def search(self, query, newest_first=False, limit=None):
+        """Doc ids matching every word of `query`, in insertion order."""
+        prefixes = set(tokenize(query))
+        if not prefixes:
+            return []
+        groups = []
+        for prefix in prefixes:
+            if len(prefix) <= _SHORT:
+                # Short prefixes expand to many words; use the
+                # precomputed set instead.
+                posting = self._short.get(prefix)
+                if not posting:
+                    return []
+                groups.append((len(posting), prefix, [posting]))
+                continue
+            words = self._expand(prefix)
+            if not words:
+                return []
+            groups.append((sum(len(self._postings[w]) for w in words), prefix, [self._postings[w] for w in words]))
+        # Start from the rarest prefix. Once the candidates are fewer than
+        # a prefix's postings, checking each candidate's own words is
+        # cheaper than building the union.
+        groups.sort(key=lambda group: group[0])
+        docs = self._docs
+        matches = None
+        for size, prefix, postings in groups:
+            if matches is None:
+                matches = set().union(*postings)
+            elif len(postings) == 1:
+                matches.intersection_update(postings[0])
+            elif len(matches) < size:
+                matches = {d for d in matches if any(w.startswith(prefix) for w in docs[d][1])}
+            else:
+                matches.intersection_update(set().union(*postings))
+            if not matches:
+                return []
+
+        if len(matches) * 8 >= len(docs):
+            # Dense results: _docs is already in insertion order, so walking
+            # it beats sorting (and can stop as soon as `limit` is reached).
+            hits = (d for d in (reversed(docs) if newest_first else docs) if d in matches)
+            return list(itertools.islice(hits, limit))
+        order = lambda d: docs[d][0]
+        if limit is not None:
+            pick = heapq.nlargest if newest_first else heapq.nsmallest
+            return pick(limit, matches, key=order)
+        return sorted(matches, key=order, reverse=newest_first)
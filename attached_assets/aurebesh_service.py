@@ -0,0 +1,207 @@
+import argparse
+import asyncio
+import json
+
+from aurebesh_batch import POOL_THRESHOLD, translate_many
+from aurebesh_cache import cached_translate
+from aurebesh_engine import get_translator
+
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 16 * 1024 * 1024
+IDLE_TIMEOUT = 60
+# Requests carrying more text than this are translated off the event loop,
+# even when they are too small a batch to be worth the process pool.
+INLINE_MAX_CHARS = 64 * 1024
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+}
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+# -----------------------------
+# Endpoints
+# -----------------------------
+def _direction(payload):
+    direction = payload.get("direction", "to_aurebesh")
+    if not isinstance(direction, str):
+        raise HTTPError(400, "'direction' must be a string")
+    get_translator(direction)  # raises ValueError for unknown directions
+    return direction
+
+async def _off_loop(fn, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, fn, *args)
+
+async def _translate(payload):
+    text = payload.get("text")
+    if not isinstance(text, str):
+        raise HTTPError(400, "'text' must be a string")
+    direction = _direction(payload)
+    if len(text) <= INLINE_MAX_CHARS:
+        return {"result": cached_translate(text, direction)}
+    return {"result": await _off_loop(cached_translate, text, direction)}
+
+async def _translate_batch(payload):
+    texts = payload.get("texts")
+    if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+        raise HTTPError(400, "'texts' must be a list of strings")
+    direction = _direction(payload)
+    if len(texts) < POOL_THRESHOLD and sum(map(len, texts)) <= INLINE_MAX_CHARS:
+        return {"results": [cached_translate(t, direction) for t in texts]}
+    # Big batches go to the process pool, and a few long strings to a
+    # worker thread, so the event loop keeps serving other connections.
+    return {"results": await _off_loop(translate_many, texts, direction)}
+
+async def _health(payload):
+    return {"status": "ok"}
+
+ROUTES = {
+    ("GET", "/health"): _health,
+    ("POST", "/translate"): _translate,
+    ("POST", "/translate/batch"): _translate_batch,
+}
+
+# -----------------------------
+# HTTP/1.1 Connection Handling
+# -----------------------------
+def _parse_head(head):
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ")
+    except ValueError:
+        raise HTTPError(400, "Malformed request line") from None
+    headers = {}
+    for line in lines[1:]:
+        if not line:
+            continue
+        name, sep, value = line.partition(":")
+        if not sep:
+            raise HTTPError(400, "Malformed header")
+        headers[name.strip().lower()] = value.strip()
+    return method, target.split("?", 1)[0], version, headers
+
+def _keep_alive(version, headers):
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.0":
+        return connection == "keep-alive"
+    return connection != "close"
+
+def _response(status, payload, keep_alive):
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+        f"Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+def _parse_body(body):
+    try:
+        payload = json.loads(body)
+    except (UnicodeDecodeError, json.JSONDecodeError, RecursionError) as e:
+        raise HTTPError(400, f"Invalid JSON: {e}") from None
+    if not isinstance(payload, dict):
+        raise HTTPError(400, "Request body must be a JSON object")
+    return payload
+
+async def _handle_request(method, path, body):
+    handler = ROUTES.get((method, path))
+    if handler is None:
+        if any(p == path for _, p in ROUTES):
+            raise HTTPError(405, f"{method} not allowed on {path}")
+        raise HTTPError(404, f"No route for {path}")
+    payload = {}
+    if len(body) > INLINE_MAX_CHARS:
+        # Decoding a multi-megabyte body takes long enough to stall every
+        # other connection, so large ones are parsed on a worker thread.
+        payload = await _off_loop(_parse_body, body)
+    elif body:
+        payload = _parse_body(body)
+    try:
+        return await handler(payload)
+    except ValueError as e:
+        raise HTTPError(400, str(e)) from None
+
+async def handle_connection(reader, writer):
+    """Serve requests on one connection until the client closes it.
+
+    Requests are answered strictly in order, so pipelined requests simply
+    queue up in the stream buffer.
+    """
+    try:
+        while True:
+            try:
+                head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), IDLE_TIMEOUT)
+            except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                break
+            except asyncio.LimitOverrunError:
+                writer.write(_response(431, {"error": "Headers too large"}, False))
+                break
+
+            keep_alive = False
+            try:
+                method, path, version, headers = _parse_head(head)
+                keep_alive = _keep_alive(version, headers)
+                try:
+                    length = int(headers.get("content-length", "0"))
+                except ValueError:
+                    raise HTTPError(400, "Invalid Content-Length") from None
+                if length < 0:
+                    raise HTTPError(400, "Invalid Content-Length")
+                if length > MAX_BODY_BYTES:
+                    keep_alive = False
+                    raise HTTPError(413, "Request body too large")
+                body = await reader.readexactly(length) if length else b""
+                result = await _handle_request(method, path, body)
+                writer.write(_response(200, result, keep_alive))
+            except HTTPError as e:
+                writer.write(_response(e.status, {"error": str(e)}, keep_alive))
+            except asyncio.IncompleteReadError:
+                break
+            except Exception as e:
+                print("Error handling request:", e)
+                keep_alive = False
+                writer.write(_response(500, {"error": "Internal server error"}, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+# -----------------------------
+# Server Entry Point
+# -----------------------------
+async def serve(host="127.0.0.1", port=8765, unix_path=None):
+    if unix_path:
+        server = await asyncio.start_unix_server(handle_connection, unix_path, limit=MAX_HEADER_BYTES)
+    else:
+        server = await asyncio.start_server(handle_connection, host, port, limit=MAX_HEADER_BYTES)
+    async with server:
+        await server.serve_forever()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the Aurebesh translator over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
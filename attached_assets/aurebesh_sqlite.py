@@ -0,0 +1,199 @@
+import sqlite3
+import threading
+from datetime import datetime
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    english TEXT NOT NULL,
+    aurebesh TEXT NOT NULL,
+    favorite INTEGER NOT NULL DEFAULT 0,
+    timestamp TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS saved_phrases (
+    position INTEGER PRIMARY KEY,
+    phrase TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS unlocked_tiers (
+    tier INTEGER PRIMARY KEY
+);
+"""
+
+_HISTORY_COLUMNS = "id, english, aurebesh, favorite, timestamp"
+
+# PRAGMA user_version once the JSON files have been imported.
+IMPORTED_VERSION = 1
+
+def _entry(row):
+    return {
+        "id": row[0],
+        "english": row[1],
+        "aurebesh": row[2],
+        "favorite": bool(row[3]),
+        "timestamp": row[4],
+    }
+
+# -----------------------------
+# SQLite Storage Backend
+# -----------------------------
+class SQLiteStore:
+    """History, saved phrases and unlocked tiers in one SQLite database.
+
+    Every change runs in its own transaction and touches only the affected
+    rows, and the popups read one page at a time instead of loading whole
+    tables. The connection is guarded by a lock so it can be shared with
+    background threads.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.executescript(SCHEMA)
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _write(self, sql, params=()):
+        with self._lock, self._conn:
+            return self._conn.execute(sql, params)
+
+    def is_empty(self):
+        return not any(
+            self._query(f"SELECT 1 FROM {table} LIMIT 1")
+            for table in ("history", "saved_phrases", "unlocked_tiers")
+        )
+
+    def needs_import(self):
+        """True until import_data() has run once on this database.
+
+        Emptying the tables later doesn't bring the old JSON data back.
+        """
+        with self._lock:
+            if self._query("PRAGMA user_version")[0][0] >= IMPORTED_VERSION:
+                return False
+            if not self.is_empty():
+                # Databases filled before the marker existed.
+                self._write(f"PRAGMA user_version = {IMPORTED_VERSION}")
+                return False
+            return True
+
+    def import_data(self, entries, phrases, tiers):
+        """Bulk-load existing JSON data in a single transaction."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO history ({_HISTORY_COLUMNS}) VALUES (?, ?, ?, ?, ?)",
+                [(e["id"], e["english"], e.get("aurebesh", ""), int(e.get("favorite", False)),
+                  e.get("timestamp", "")) for e in entries],
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO saved_phrases (phrase) VALUES (?)",
+                [(p,) for p in phrases],
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO unlocked_tiers (tier) VALUES (?)",
+                [(t,) for t in tiers],
+            )
+            # Same transaction as the rows, so a failed import is retried.
+            self._conn.execute(f"PRAGMA user_version = {IMPORTED_VERSION}")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # -- Saved phrases ----------------------------------------------------
+    def load_saved_phrases(self):
+        return [row[0] for row in self._query("SELECT phrase FROM saved_phrases ORDER BY position")]
+
+    def save_saved_phrases(self, phrases):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM saved_phrases")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO saved_phrases (phrase) VALUES (?)",
+                [(p,) for p in phrases],
+            )
+
+    def add_saved_phrase(self, phrase):
+        return self._write("INSERT OR IGNORE INTO saved_phrases (phrase) VALUES (?)", (phrase,)).rowcount > 0
+
+    def remove_saved_phrase(self, phrase):
+        return self._write("DELETE FROM saved_phrases WHERE phrase = ?", (phrase,)).rowcount > 0
+
+    def page_saved_phrases(self, offset, limit):
+        return [row[0] for row in self._query(
+            "SELECT phrase FROM saved_phrases ORDER BY position LIMIT ? OFFSET ?", (limit, offset))]
+
+    # -- Unlocked tiers -----------------------------------------------------
+    def load_unlocked_tiers(self):
+        return {row[0] for row in self._query("SELECT tier FROM unlocked_tiers")} or {1}
+
+    def save_unlocked_tiers(self, tiers_set):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM unlocked_tiers")
+            self._conn.executemany("INSERT INTO unlocked_tiers (tier) VALUES (?)", [(t,) for t in tiers_set])
+
+    # -- History --------------------------------------------------------------
+    def history(self):
+        return SQLiteHistory(self)
+
+class SQLiteHistory:
+    """Translation history backed by the `history` table.
+
+    Offers the same interface as HistoryJournal, so the app doesn't care
+    which backend is in use.
+    """
+    def __init__(self, store):
+        self.store = store
+
+    def __len__(self):
+        return self.store._query("SELECT COUNT(*) FROM history")[0][0]
+
+    def __iter__(self):
+        return iter([_entry(r) for r in self.store._query(f"SELECT {_HISTORY_COLUMNS} FROM history ORDER BY id")])
+
+    def __reversed__(self):
+        return iter([_entry(r) for r in self.store._query(f"SELECT {_HISTORY_COLUMNS} FROM history ORDER BY id DESC")])
+
+    def get(self, entry_id):
+        rows = self.store._query(f"SELECT {_HISTORY_COLUMNS} FROM history WHERE id = ?", (entry_id,))
+        return _entry(rows[0]) if rows else None
+
+    def last(self):
+        rows = self.store._query(f"SELECT {_HISTORY_COLUMNS} FROM history ORDER BY id DESC LIMIT 1")
+        return _entry(rows[0]) if rows else None
+
+    def page(self, offset, limit):
+        """Entries newest first, skipping `offset` of them."""
+        return [_entry(r) for r in self.store._query(
+            f"SELECT {_HISTORY_COLUMNS} FROM history ORDER BY id DESC LIMIT ? OFFSET ?", (limit, offset))]
+
+    def append(self, eng, aus, favorite=False):
+        timestamp = datetime.now().isoformat()
+        cursor = self.store._write(
+            "INSERT INTO history (english, aurebesh, favorite, timestamp) VALUES (?, ?, ?, ?)",
+            (eng, aus, int(favorite), timestamp),
+        )
+        return {"id": cursor.lastrowid, "english": eng, "aurebesh": aus,
+                "favorite": favorite, "timestamp": timestamp}
+
+    def set_favorite(self, entry_id, favorite):
+        cursor = self.store._write("UPDATE history SET favorite = ? WHERE id = ?", (int(favorite), entry_id))
+        if cursor.rowcount == 0:
+            raise KeyError(entry_id)
+
+    def delete(self, entry_id):
+        cursor = self.store._write("DELETE FROM history WHERE id = ?", (entry_id,))
+        if cursor.rowcount == 0:
+            raise KeyError(entry_id)
+
+    def compact(self):
+        with self.store._lock:
+            self.store._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self):
+        pass
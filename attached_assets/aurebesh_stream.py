@@ -0,0 +1,181 @@
+import argparse
+import io
+import mmap
+import os
+import sys
+import time
+
+from aurebesh_engine import DIRECTIONS, default_table, get_translator
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+# -----------------------------
+# Chunked Translation
+# -----------------------------
+def iter_chunks(fileobj, chunk_size=DEFAULT_CHUNK_SIZE):
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+def translate_chunks(chunks, direction="to_aurebesh", table=None):
+    """Translate an iterable of text chunks, yielding output as it goes.
+
+    English -> Aurebesh holds back the end of a chunk while it could still
+    become part of a ligature, so a "th" split across two chunks is joined
+    the same way it would be in one string.
+    """
+    get_translator(direction)  # reject unknown directions up front
+    table = table or default_table
+    if direction == "to_english":
+        # One glyph in, one piece out: chunk boundaries never matter.
+        for chunk in chunks:
+            if chunk:
+                yield table.to_english(chunk)
+        return
+
+    carry = ""
+    for chunk in chunks:
+        out, carry = table.to_aurebesh_partial(carry + chunk)
+        if out:
+            yield out
+    if carry:
+        yield table.to_aurebesh(carry)
+
+def translate_stream(infile, outfile, direction="to_aurebesh", chunk_size=DEFAULT_CHUNK_SIZE):
+    for piece in translate_chunks(iter_chunks(infile, chunk_size), direction):
+        outfile.write(piece)
+
+def translate_file(src_path, dst_path, direction="to_aurebesh", chunk_size=DEFAULT_CHUNK_SIZE):
+    started = time.perf_counter()
+    with open(src_path, "r", encoding="utf-8", newline="") as src, \
+         open(dst_path, "w", encoding="utf-8", newline="") as dst:
+        translate_stream(src, dst, direction, chunk_size)
+    return _stats(os.path.getsize(src_path), os.path.getsize(dst_path), time.perf_counter() - started)
+
+# -----------------------------
+# Memory-Mapped Translation
+# -----------------------------
+def iter_mapped_chunks(mapped, chunk_bytes=DEFAULT_BUFFER_SIZE):
+    """Decode UTF-8 bytes window by window without splitting a character."""
+    if chunk_bytes < 4:
+        raise ValueError("chunk_bytes must hold at least one UTF-8 character (4 bytes)")
+    pos, size = 0, len(mapped)
+    while pos < size:
+        end = min(pos + chunk_bytes, size)
+        # Back off continuation bytes (0b10xxxxxx) so the window ends on a
+        # character boundary. A valid character has at most three of them,
+        # so stop there (and always move forward): invalid input then fails
+        # in decode() instead of looping.
+        limit = max(pos + 1, end - 3)
+        while limit < end < size and (mapped[end] & 0xC0) == 0x80:
+            end -= 1
+        yield mapped[pos:end].decode("utf-8")
+        pos = end
+
+def translate_mapped_file(src_path, dst_path, direction="to_aurebesh",
+                          chunk_bytes=DEFAULT_BUFFER_SIZE, buffer_size=DEFAULT_BUFFER_SIZE):
+    """Translate a UTF-8 file through mmap and a fixed-size output buffer.
+
+    Only one input window and one output buffer are held in memory at a
+    time. Returns throughput stats (see _stats).
+    """
+    started = time.perf_counter()
+    buf = bytearray(buffer_size)
+    view = memoryview(buf)
+    fill = written = 0
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        size = os.fstat(src.fileno()).st_size
+        if size:
+            with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for piece in translate_chunks(iter_mapped_chunks(mapped, chunk_bytes), direction):
+                    data = piece.encode("utf-8")
+                    if fill + len(data) > buffer_size:
+                        dst.write(view[:fill])
+                        written += fill
+                        fill = 0
+                        if len(data) >= buffer_size:
+                            dst.write(data)
+                            written += len(data)
+                            continue
+                    view[fill:fill + len(data)] = data
+                    fill += len(data)
+        dst.write(view[:fill])
+        written += fill
+    view.release()
+    return _stats(size, written, time.perf_counter() - started)
+
+def translate_file_in_memory(src_path, dst_path, direction="to_aurebesh"):
+    started = time.perf_counter()
+    with open(src_path, "r", encoding="utf-8", newline="") as src:
+        text = src.read()
+    data = get_translator(direction)(text).encode("utf-8")
+    with open(dst_path, "wb") as dst:
+        dst.write(data)
+    return _stats(os.path.getsize(src_path), len(data), time.perf_counter() - started)
+
+def _stats(bytes_in, bytes_out, seconds):
+    return {
+        "bytes_in": bytes_in,
+        "bytes_out": bytes_out,
+        "seconds": seconds,
+        "mb_per_s": bytes_in / (1024 * 1024) / seconds if seconds > 0 else 0.0,
+    }
+
+# -----------------------------
+# Command-Line Entry Point
+# -----------------------------
+def _open_text(path, mode):
+    if path == "-":
+        stream = sys.stdin.buffer if mode == "r" else sys.stdout.buffer
+        return io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    return open(path, mode, encoding="utf-8", newline="")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Translate a text file between English and Aurebesh.")
+    parser.add_argument("direction", choices=sorted(DIRECTIONS))
+    parser.add_argument("input", nargs="?", default="-", help="input file ('-' for stdin)")
+    parser.add_argument("-o", "--output", default="-", help="output file ('-' for stdout)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="characters read per chunk, bytes per window with --mode mmap "
+                             "(default: %(default)s)")
+    parser.add_argument("--mode", choices=["stream", "mmap", "memory"], default="stream",
+                        help="stream: chunked text reads; mmap: memory-mapped input with a "
+                             "fixed output buffer; memory: whole file at once")
+    parser.add_argument("--stats", action="store_true", help="print throughput to stderr")
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+    if args.mode != "stream" and "-" in (args.input, args.output):
+        parser.error(f"--mode {args.mode} needs real input and output files")
+
+    if args.mode == "mmap":
+        stats = translate_mapped_file(args.input, args.output, args.direction,
+                                      chunk_bytes=max(args.chunk_size, 4))
+    elif args.mode == "memory":
+        stats = translate_file_in_memory(args.input, args.output, args.direction)
+    elif "-" not in (args.input, args.output):
+        stats = translate_file(args.input, args.output, args.direction, args.chunk_size)
+    else:
+        _translate_std_streams(args)
+        return
+    if args.stats:
+        print(f"{args.mode}: {stats['bytes_in'] / (1024 * 1024):.1f} MB in "
+              f"{stats['seconds']:.2f} s ({stats['mb_per_s']:.1f} MB/s)", file=sys.stderr)
+
+def _translate_std_streams(args):
+    src = _open_text(args.input, "r")
+    dst = _open_text(args.output, "w")
+    try:
+        translate_stream(src, dst, args.direction, args.chunk_size)
+    finally:
+        dst.flush()
+        if args.input != "-":
+            src.close()
+        if args.output != "-":
+            dst.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+import weakref
+from types import MappingProxyType
+
+# -----------------------------
+# Colour Helpers
+# -----------------------------
+def hex_to_rgba(hex_color, alpha=1):
+    hex_color = hex_color.lstrip('#')
+    lv = len(hex_color)
+    if lv == 6:
+        r, g, b = tuple(int(hex_color[i:i+2], 16) for i in range(0, 6, 2))
+    elif lv == 3:
+        r, g, b = tuple(int(hex_color[i]*2, 16) for i in range(0, 3))
+    else:
+        r, g, b = (0, 0, 0)
+    return (r/255, g/255, b/255, alpha)
+
+def get_contrasting_color(rgba):
+    r, g, b, _ = rgba
+    luminance = 0.2126 * r + 0.7152 * g + 0.0722 * b
+    return (0, 0, 0, 1) if luminance > 0.5 else (1, 1, 1, 1)
+
+# -----------------------------
+# VIEW_MODES: Color schemes per view.
+# -----------------------------
+_PALETTE_HEX = {
+    "Rebel": {
+         "bg": "f0ece1",
+         "container": "3b444b",
+         "label": "080808",
+         "input_text": "f0ece1",
+         "accent": "dd4e1e",
+         "icon_normal": "e5703d",
+         "icon_active": "dd4e1e"
+    },
+    "Imperial": {
+         "bg": "3B444B",
+         "container": "080808",
+         "label": "9c1b1b",
+         "input_text": "F0ECE1",
+         "accent": "D63333",
+         "icon_normal": "9c1b1b",
+         "icon_active": "D63333"
+    },
+    "Light Side": {  # formerly Jedi
+         "bg": "998b71",
+         "container": "3b444b",
+         "label": "90caff",
+         "input_text": "c4ac8b",
+         "accent": "90f3b7",
+         "icon_normal": "90caff",
+         "icon_active": "90f3b7"
+    },
+    "Dark Side": {   # formerly Sith
+         "bg": "242424",
+         "container": "000000",
+         "label": "ff0000",
+         "input_text": "F0ECE1",
+         "accent": "dfdfdf",
+         "icon_normal": "ff0000",
+         "icon_active": "2d2b3c"
+    },
+    "Bounty Hunter": {
+         "bg": "a6918d",
+         "container": "16071a",
+         "label": "fff8f1",
+         "input_text": "aaaaaa",
+         "accent": "889273",
+         "icon_normal": "889273",  # updated from "aaaaaa" to "889273"
+         "icon_active": "889273"
+    }
+}
+
+def _build_palette(hex_colors):
+    colors = {role: hex_to_rgba(value) for role, value in hex_colors.items()}
+    # Text drawn on icon and accent backgrounds.
+    colors["icon_text"] = get_contrasting_color(colors["icon_normal"])
+    colors["accent_text"] = get_contrasting_color(colors["accent"])
+    return MappingProxyType(colors)
+
+# Converted once at import; palettes are read-only, so they can be shared
+# and compared by identity.
+VIEW_MODES = MappingProxyType({name: _build_palette(hex_colors) for name, hex_colors in _PALETTE_HEX.items()})
+DEFAULT_VIEW_MODE = "Rebel"
+
+# Properties a MainIconButton takes from the palette.
+ICON_ROLES = MappingProxyType({
+    "normal_color": "icon_normal",
+    "active_color": "icon_active",
+    "background_color": "icon_normal",
+})
+
+# -----------------------------
+# Theme Manager
+# -----------------------------
+class ThemeManager:
+    """Keeps every registered widget in step with the current palette.
+
+    `register(widget, color="input_text")` records which palette role each
+    property takes and sets it straight away. `apply(palette)` then updates
+    every registered widget (open or pooled pop-ups included) in a single
+    pass on the calling thread, so the whole switch lands in one frame.
+    Widgets are held weakly and drop out once they are gone. Hooks cover
+    anything that isn't a plain property, such as recycled list rows.
+    """
+    def __init__(self, palette):
+        self.palette = palette
+        self._widgets = weakref.WeakKeyDictionary()  # widget -> {property: role}
+        self._hooks = []
+
+    def register(self, widget, **roles):
+        self._widgets.setdefault(widget, {}).update(roles)
+        self._set(widget, roles, self.palette)
+        return widget
+
+    def unregister(self, widget):
+        self._widgets.pop(widget, None)
+
+    def add_hook(self, fn):
+        """Call fn(palette) after each theme change."""
+        self._hooks.append(fn)
+
+    def apply(self, palette):
+        if palette is self.palette:
+            return
+        self.palette = palette
+        for widget, roles in list(self._widgets.items()):
+            self._set(widget, roles, palette)
+        for fn in self._hooks:
+            fn(palette)
+
+    @staticmethod
+    def _set(widget, roles, palette):
+        for prop, role in roles.items():
+            setattr(widget, prop, palette[role])
@@ -0,0 +1,1635 @@
+import os, json
+
+from kivy.metrics import dp
+from kivy.app import App
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.anchorlayout import AnchorLayout
+from kivy.uix.gridlayout import GridLayout
+from kivy.uix.textinput import TextInput
+from kivy.uix.button import Button
+from kivy.uix.dropdown import DropDown
+from kivy.uix.label import Label
+from kivy.uix.modalview import ModalView
+from kivy.uix.slider import Slider
+from kivy.uix.togglebutton import ToggleButton
+from kivy.uix.scrollview import ScrollView
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.core.window import Window
+from kivy.core.clipboard import Clipboard
+from kivy.clock import Clock
+from kivy.graphics import Color, Rectangle, Line
+import json, os, webbrowser
+from datetime import datetime
+from kivy.uix.filechooser import FileChooserIconView
+from threading import Thread
+from kivy.uix.widget import Widget
+from kivy.uix.progressbar import ProgressBar
+from kivy.animation import Animation
+from kivy.core.audio import SoundLoader
+
+
+# -----------------------------
+# Fixed Icon Button Class (48x48dp)
+# -----------------------------
+class FixedIconButton(Button):
+    def __init__(self, **kwargs):
+        kwargs.setdefault('size_hint', (None, None))
+        kwargs.setdefault('size', (dp(48), dp(48)))
+        super().__init__(**kwargs)
+        self.background_normal = ''
+
+# -----------------------------
+# Theme Palettes (precomputed in aurebesh_theme)
+# -----------------------------
+from aurebesh_theme import (
+    hex_to_rgba, get_contrasting_color, VIEW_MODES, DEFAULT_VIEW_MODE, ICON_ROLES, ThemeManager
+)
+
+CURRENT_VIEW = DEFAULT_VIEW_MODE
+
+# -----------------------------
+# Main Icon Button with Active State Behavior
+# -----------------------------
+MAIN_BTN_NORMAL = lambda: hex_to_rgba("e5703d")
+MAIN_BTN_ACTIVE = lambda: hex_to_rgba("dd4e1e")
+
+class MainIconButton(FixedIconButton):
+    def __init__(self, **kwargs):
+        self.normal_color = kwargs.pop('normal_color', MAIN_BTN_NORMAL())
+        self.active_color = kwargs.pop('active_color', MAIN_BTN_ACTIVE())
+        super().__init__(**kwargs)
+        self.background_color = self.normal_color
+
+    def on_press(self):
+        self.background_color = self.active_color
+        return super().on_press()
+
+    def on_release(self):
+        self.background_color = self.normal_color
+        return super().on_release()
+
+# -----------------------------
+# Helper: Draw blue border when focused.
+# -----------------------------
+def update_border(widget, focused):
+    widget.canvas.after.clear()
+    if focused:
+        with widget.canvas.after:
+            Color(0, 0, 1, 1)
+            Line(rectangle=(widget.x, widget.y, widget.width, widget.height), width=dp(2))
+
+# -----------------------------
+# Helper: Replace a span of a TextInput without resetting its whole text.
+# -----------------------------
+def patch_text_input(text_input, start, end, replacement, length=None):
+    # length is the current text length, when the caller already knows it.
+    if start == end and not replacement:
+        return
+    if length is None:
+        length = len(text_input.text)
+    if start == 0 and end == length:
+        text_input.text = replacement
+        return
+    if start != end:
+        text_input.select_text(start, end)
+        text_input.delete_selection()
+    if replacement:
+        text_input.cursor = text_input.get_cursor_from_index(start)
+        text_input.insert_text(replacement)
+
+# -----------------------------
+# Ligatures and Translation Engine
+# -----------------------------
+from aurebesh_engine import ligatures, EditMirror
+from aurebesh_cache import cached_translate
+
+# -----------------------------
+# Persistent Storage, Phrases and Game Data
+# -----------------------------
+from aurebesh_core import (
+    add_saved_phrase, remove_saved_phrase, page_saved_phrases,
+    delete_history_entry, toggle_history_favorite,
+    prepare_search_indexes, search_history, search_saved_phrases,
+    load_unlocked_tiers, save_unlocked_tiers,
+    history, add_history_entry, TIERS,
+    generate_word_search, draw_choices, flush_pending_writes, data_revision,
+    get_puzzle_pool, WORD_SEARCH_PUZZLES,
+)
+
+# -----------------------------
+# Base Class for Full-Window Pop-ups
+# -----------------------------
+class FullPopup(ModalView):
+    """Base class for full-window pop-ups with a header bar."""
+    def __init__(self, title_text, translator_widget, **kwargs):
+        super().__init__(**kwargs)
+        self.translator = translator_widget
+        self.theme = self.translator.theme
+        cs = self.translator.colors
+        self.size_hint = (1, 1)
+        self.theme.register(self, background_color="bg")
+
+        # Header bar (48dp high) with title and an X close button.
+        header = BoxLayout(
+            orientation="horizontal", 
+            size_hint=(1, None), 
+            height=dp(48)
+        )
+        
+        self.header_title = Label(
+            text=title_text,
+            font_size=dp(24),
+            font_name="fonts/VT323-Regular.ttf",
+            color=cs["input_text"],
+            halign="left",
+            size_hint=(1, 1)
+        )
+        self.header_title.bind(size=lambda inst, val: setattr(inst, 'text_size', (val[0], val[1])))
+        self.theme.register(self.header_title, color="input_text")
+        header.add_widget(self.header_title)
+        self.close_btn = MainIconButton(
+            text="\uf057",
+            font_size=dp(24),
+            normal_color=cs["icon_normal"],
+            active_color=cs["icon_active"],
+            font_name="fonts/icon-font.ttf",
+            size_hint=(None, None),
+            size=(dp(48), dp(48))
+        )
+        self.close_btn.bind(on_release=lambda x: self.dismiss())
+        self.theme.register(self.close_btn, **ICON_ROLES)
+        header.add_widget(self.close_btn)
+
+        self.main_layout = BoxLayout(orientation="vertical", spacing=dp(10))
+        anchor = AnchorLayout(anchor_y="top", size_hint=(1, None))
+        anchor.add_widget(header)
+        self.main_layout.add_widget(anchor)
+        self.content_area = BoxLayout(orientation="vertical", padding=[dp(10)]*2)
+        self.main_layout.add_widget(self.content_area)
+        self.add_widget(self.main_layout)
+
+    def add_search_box(self, on_search):
+        """Search field under the header; on_search(query) runs once typing pauses."""
+        cs = self.translator.colors
+        box = BoxLayout(size_hint=(1, None), height=dp(40), padding=[dp(10), 0])
+        self.search_input = TextInput(
+            hint_text="Search", multiline=False,
+            font_size=dp(18), font_name="fonts/VT323-Regular.ttf",
+            background_color=cs["container"],
+            foreground_color=cs["input_text"],
+            padding=[dp(10), dp(8)]
+        )
+        self.search_input.bind(focus=lambda inst, val: update_border(inst, val))
+        self.theme.register(self.search_input, background_color="container", foreground_color="input_text")
+        trigger = Clock.create_trigger(lambda dt: on_search(self.search_input.text.strip()), 0.15)
+        self.search_input.bind(text=lambda inst, val: trigger())
+        box.add_widget(self.search_input)
+        # index=1 puts it between the header and the content area.
+        self.main_layout.add_widget(box, index=1)
+        # Build the search indexes now so the first query doesn't wait.
+        Thread(target=prepare_search_indexes, daemon=True).start()
+
+    def refresh(self):
+        """Called by the PopupPool each time a built pop-up is opened again."""
+
+# -----------------------------
+# About Popup – New (with Disclaimer)
+# -----------------------------
+class AboutPopup(FullPopup):
+    def __init__(self, translator_widget, **kwargs):
+        super().__init__("About", translator_widget, **kwargs)
+        cs = self.translator.colors
+        content = BoxLayout(orientation="vertical", spacing=dp(10), padding=[dp(10)]*2)
+        info = (
+            "Imperial Remnant Podcast © 2025\n"
+            "All rights reserved.\n\n"
+            "This app translates English to Aurebesh for personal use only. "
+            "No warranty is provided.\n\n"
+            "Assets used in this app (fonts, icons, etc.) are either open source "
+            "or licensed for personal use only.\n\n"
+            "For more content, visit our YouTube channel:\nhttps://www.youtube.com/@imperialremnantpodcast\n\n"
+            "Disclaimer: This is a fan-made app created for entertainment purposes only. "
+            "It is not an official Star Wars product and is not affiliated with Lucasfilm, Disney, or any related entities."
+        )
+        self.info_label = Label(
+            text=info,
+            font_size=dp(20),
+            font_name="fonts/VT323-Regular.ttf",
+            color=cs["input_text"],
+            halign="left",
+            valign="middle"
+        )
+        self.info_label.bind(size=lambda inst, val: setattr(inst, 'text_size', (val[0], val[1])))
+        self.theme.register(self.info_label, color="input_text")
+        content.add_widget(self.info_label)
+        self.content_area.add_widget(content)
+
+# -----------------------------
+# Recycled Rows for the History and Saved Lists
+# -----------------------------
+PAGE_SIZE = 100  # rows fetched at a time as the history and saved lists scroll
+FIXED_DARKER = hex_to_rgba("2b3237")
+
+class RecycledRow(RecycleDataViewBehavior, BoxLayout):
+    """One list row. Only enough rows to fill the screen are ever built;
+    scrolling hands them new data through refresh_view_attrs."""
+    def __init__(self, **kwargs):
+        super().__init__(orientation="horizontal", spacing=dp(5), **kwargs)
+        self.index = None
+        self.data = {}
+        with self.canvas.before:
+            self.bg_color = Color(0, 0, 0, 0)
+            self.bg_rect = Rectangle(pos=self.pos, size=self.size)
+        self.bind(pos=lambda inst, val: setattr(self.bg_rect, 'pos', val))
+        self.bind(size=lambda inst, val: setattr(self.bg_rect, 'size', val))
+        self.label = Label(
+            size_hint_x=0.6,
+            halign="left",
+            valign="middle",
+            font_name="fonts/VT323-Regular.ttf"
+        )
+        self.label.bind(size=lambda inst, val: setattr(inst, 'text_size', (val[0], val[1])))
+        self.add_widget(self.label)
+
+    def add_icon(self, text, on_release):
+        btn = MainIconButton(text=text, font_size=dp(24), font_name="fonts/icon-font.ttf")
+        btn.bind(on_release=lambda x: on_release())
+        self.add_widget(btn)
+        return btn
+
+    def refresh_view_attrs(self, rv, index, data):
+        self.index = index
+        self.data = data
+        self.popup = rv.popup
+        cs = rv.popup.translator.colors
+        self.bg_color.rgba = cs["container"] if index % 2 == 0 else FIXED_DARKER
+        self.label.text = data["text"]
+        self.label.color = cs["input_text"]
+        for btn in self.children:
+            if isinstance(btn, MainIconButton):
+                set_icon_colors(btn, cs["icon_normal"], cs["icon_active"])
+
+def set_icon_colors(btn, normal, active):
+    btn.normal_color = normal
+    btn.active_color = active
+    btn.background_color = normal
+
+class HistoryRow(RecycledRow):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.add_icon("\uf0c5", lambda: Clipboard.copy(self.data["text"]))
+        self.fav_btn = self.add_icon("\uf005", lambda: self.popup.toggle_favorite(self.data["id"], self.index))
+        self.add_icon("\uf1f8", lambda: self.popup.delete_entry(self.data["id"], self.index))
+
+    def refresh_view_attrs(self, rv, index, data):
+        super().refresh_view_attrs(rv, index, data)
+        if not data["favorite"]:
+            set_icon_colors(self.fav_btn, (0.5, 0.5, 0.5, 1), rv.popup.translator.colors["icon_active"])
+
+class SavedRow(RecycledRow):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.label.size_hint_x = 0.7
+        self.add_icon("\uf0c5", lambda: Clipboard.copy(self.data["text"]))
+        self.add_icon("\uf1f8", lambda: self.popup.delete_saved(self.data["text"], self.index))
+
+class PagedRecycleView(RecycleView):
+    """RecycleView that pulls rows from `fetch(offset, limit)` a page at a
+    time as the user nears the bottom."""
+    def __init__(self, popup, viewclass, fetch, **kwargs):
+        super().__init__(**kwargs)
+        self.popup = popup
+        self.fetch = fetch
+        self.exhausted = False
+        layout = RecycleBoxLayout(
+            orientation="vertical", size_hint_y=None, spacing=dp(5), padding=[dp(10)]*2,
+            default_size=(None, dp(48)), default_size_hint=(1, None)
+        )
+        layout.bind(minimum_height=layout.setter("height"))
+        self.add_widget(layout)
+        # viewclass is forwarded to the layout, so it must be set after it.
+        self.viewclass = viewclass
+        self.bind(scroll_y=self.check_load_more)
+        # Rows pick their colors up in refresh_view_attrs.
+        popup.theme.add_hook(lambda palette: self.refresh_from_data())
+
+    def reload(self):
+        self.exhausted = False
+        self.data = []
+        self.load_more()
+
+    def load_more(self):
+        batch = self.fetch(len(self.data), PAGE_SIZE)
+        if len(batch) < PAGE_SIZE:
+            self.exhausted = True
+        self.data.extend(batch)
+
+    def check_load_more(self, inst, scroll_y):
+        if not self.exhausted and scroll_y <= 0.05:
+            self.load_more()
+
+    def locate(self, index, key, value):
+        """Index of the row whose `key` is `value`, trying `index` first."""
+        if index is not None and index < len(self.data) and self.data[index].get(key) == value:
+            return index
+        for i, row in enumerate(self.data):
+            if row.get(key) == value:
+                return i
+        return None
+
+    def update_row(self, index, **changes):
+        # Assigning one item only refreshes that row's view.
+        self.data[index] = dict(self.data[index], **changes)
+
+    def remove_row(self, index):
+        del self.data[index]
+
+# -----------------------------
+# History Popup
+# -----------------------------
+class HistoryPopup(FullPopup):
+    def __init__(self, translator_widget, **kwargs):
+        super().__init__("Translation History", translator_widget, **kwargs)
+        self.query = ""
+        self.add_search_box(self.search)
+        self.list_view = PagedRecycleView(self, HistoryRow, self.fetch_rows)
+        self.content_area.add_widget(self.list_view)
+        self.populate_history()
+
+    def refresh(self):
+        # Start from a clear search box, and only re-read the list if the
+        # history changed while the pop-up was closed.
+        self.search_input.text = ""
+        if self.query or self.revision != data_revision("history"):
+            self.query = ""
+            self.populate_history()
+        self.list_view.scroll_y = 1
+        super().refresh()
+
+    def search(self, query):
+        if query == self.query:
+            return
+        self.query = query
+        self.populate_history()
+
+    def populate_history(self):
+        self.matches = search_history(self.query) if self.query else None
+        self.list_view.reload()
+        self.revision = data_revision("history")
+
+    def fetch_rows(self, offset, limit):
+        # Newest first; a search pages through its matching ids instead.
+        if self.matches is None:
+            entries = history.page(offset, limit)
+        else:
+            entries = [e for e in map(history.get, self.matches[offset:offset + limit]) if e is not None]
+        return [{"id": e["id"], "text": e["english"], "favorite": e.get("favorite", False)} for e in entries]
+
+    def toggle_favorite(self, entry_id, index=None):
+        try:
+            favorite = toggle_history_favorite(entry_id)
+        except KeyError:
+            return
+        index = self.list_view.locate(index, "id", entry_id)
+        if index is not None:
+            self.list_view.update_row(index, favorite=favorite)
+        self.revision = data_revision("history")
+
+    def delete_entry(self, entry_id, index=None):
+        try:
+            delete_history_entry(entry_id)
+        except KeyError:
+            return
+        index = self.list_view.locate(index, "id", entry_id)
+        if index is not None:
+            self.list_view.remove_row(index)
+            # Keep later pages lined up with the rows already shown.
+            if self.matches is not None:
+                self.matches.remove(entry_id)
+        self.revision = data_revision("history")
+
+# -----------------------------
+# Saved Popup
+# -----------------------------
+class SavedPopup(FullPopup):
+    def __init__(self, translator_widget, **kwargs):
+        super().__init__("Saved Phrases", translator_widget, **kwargs)
+        self.query = ""
+        self.add_search_box(self.search)
+        self.list_view = PagedRecycleView(self, SavedRow, self.fetch_rows)
+        self.content_area.add_widget(self.list_view)
+        self.populate_saved()
+
+    def refresh(self):
+        self.search_input.text = ""
+        if self.query or self.revision != data_revision("saved"):
+            self.query = ""
+            self.populate_saved()
+        self.list_view.scroll_y = 1
+        super().refresh()
+
+    def search(self, query):
+        if query == self.query:
+            return
+        self.query = query
+        self.populate_saved()
+
+    def populate_saved(self):
+        self.matches = search_saved_phrases(self.query) if self.query else None
+        self.list_view.reload()
+        self.revision = data_revision("saved")
+
+    def fetch_rows(self, offset, limit):
+        if self.matches is None:
+            phrases = page_saved_phrases(offset, limit)
+        else:
+            phrases = self.matches[offset:offset + limit]
+        return [{"text": phrase} for phrase in phrases]
+
+    def delete_saved(self, phrase, index=None):
+        if not remove_saved_phrase(phrase):
+            return
+        index = self.list_view.locate(index, "text", phrase)
+        if index is not None:
+            self.list_view.remove_row(index)
+            if self.matches is not None:
+                self.matches.remove(phrase)
+        self.revision = data_revision("saved")
+
+# -----------------------------
+# Settings Popup – Updated
+# -----------------------------
+class SettingsPopup(FullPopup):
+    def __init__(self, translator_widget, **kwargs):
+        super().__init__("Settings", translator_widget, **kwargs)
+        cs = self.translator.colors
+        content = BoxLayout(orientation="vertical", spacing=dp(10), size_hint_y=1, padding=[dp(10)]*2)
+        # Font Size Row
+        fs_row = BoxLayout(orientation="horizontal", size_hint=(1, None), height=dp(48), spacing=dp(10))
+        fs_label = Label(
+            text="Font Size:",
+            size_hint=(0.4, 1),
+            font_size=dp(28),
+            color=cs["input_text"],
+            font_name="fonts/VT323-Regular.ttf",
+            valign="middle"
+        )
+        fs_label.bind(size=lambda inst, val: setattr(inst, 'text_size', (val[0], val[1])))
+        self.theme.register(fs_label, color="input_text")
+        self.fs_slider = Slider(min=18, max=72, value=self.translator.english_input.font_size if self.translator.english_input.font_size >= 18 else 32, size_hint=(0.6, 1))
+        self.fs_slider.bind(value=self.on_font_size_change)
+        fs_row.add_widget(fs_label)
+        fs_row.add_widget(self.fs_slider)
+        content.add_widget(fs_row)
+        # Theme Row (renamed from View Mode)
+        theme_row = BoxLayout(orientation="horizontal", size_hint=(1, None), height=dp(48), spacing=dp(10))
+        theme_label = Label(
+            text="Theme:",
+            size_hint=(0.4, 1),
+            font_size=dp(28),
+            color=cs["input_text"],
+            font_name="fonts/VT323-Regular.ttf",
+            valign="middle"
+        )
+        theme_label.bind(size=lambda inst, val: setattr(inst, 'text_size', (val[0], val[1])))
+        self.theme.register(theme_label, color="input_text")
+        self.vm_dropdown = DropDown()
+        self.vm_btn = Button(
+            text=self.translator.view_mode,
+            size_hint=(0.6, 1),
+            background_color=cs["icon_normal"],
+            background_normal="",
+            color=get_contrasting_color(cs["icon_normal"]),
+            font_name="fonts/VT323-Regular.ttf",
+            font_size=dp(24)
+        )
+        self.vm_btn.bind(on_release=self.vm_dropdown.open)
+        for mode in ["Rebel", "Imperial", "Light Side", "Dark Side", "Bounty Hunter"]:
+            btn = Button(
+                text=mode,
+                size_hint_y=None,
+                height=dp(48),
+                background_color=cs["icon_normal"],
+                background_normal="",
+                color=get_contrasting_color(cs["icon_normal"]),
+                font_name="fonts/VT323-Regular.ttf",
+                font_size=dp(24)
+            )
+            btn.bind(on_release=lambda btn, mode=mode: self.select_view_mode(mode))
+            self.vm_dropdown.add_widget(btn)
+        theme_row.add_widget(theme_label)
+        theme_row.add_widget(self.vm_btn)
+        content.add_widget(theme_row)
+        # Apply Row – New: Immediately apply the changes.
+        apply_row = BoxLayout(orientation="horizontal", size_hint=(1, None), height=dp(48), spacing=dp(10))
+        apply_btn = MainIconButton(
+            text="Apply",
+            font_size=dp(24),
+            normal_color=cs["icon_normal"],
+            active_color=cs["icon_active"],
+            font_name="fonts/VT323-Regular.ttf",
+            size_hint=(1, 1)
+        )
+        apply_btn.bind(on_release=lambda x: self.apply_theme())
+        apply_row.add_widget(apply_btn)
+        content.add_widget(apply_row)
+        # Reset Defaults Row
+        reset_row = BoxLayout(orientation="horizontal", size_hint=(1, None), height=dp(48), spacing=dp(10))
+        reset_btn = MainIconButton(
+            text="Reset Defaults",
+            font_size=dp(24),
+            normal_color=cs["icon_normal"],
+            active_color=cs["icon_active"],
+            font_name="fonts/VT323-Regular.ttf",
+            size_hint=(1, 1)
+        )
+        reset_btn.bind(on_release=self.reset_defaults)
+        reset_row.add_widget(reset_btn)
+        content.add_widget(reset_row)
+        # About Row
+        about_row = BoxLayout(orientation="horizontal", size_hint=(1, None), height=dp(48), spacing=dp(10))
+        about_btn = MainIconButton(
+            text="About",
+            font_size=dp(24),
+            normal_color=cs["icon_normal"],
+            active_color=cs["icon_active"],
+            font_name="fonts/VT323-Regular.ttf",
+            size_hint=(1, 1)
+        )
+        about_btn.bind(on_release=lambda x: self.open_about())
+        about_row.add_widget(about_btn)
+        content.add_widget(about_row)
+        self.content_area.add_widget(content)
+        for btn in [self.vm_btn] + self.vm_dropdown.container.children:
+            self.theme.register(btn, background_color="icon_normal", color="icon_text")
+        for btn in (apply_btn, reset_btn, about_btn):
+            self.theme.register(btn, **ICON_ROLES)
+
+    def refresh(self):
+        font_size = self.translator.english_input.font_size
+        self.fs_slider.value = font_size if font_size >= 18 else 32
+        self.vm_btn.text = self.translator.view_mode
+        super().refresh()
+
+
+    def on_font_size_change(self, instance, value):
+        new_size = int(value)
+        self.translator.english_input.font_size = new_size
+        self.translator.aurebesh_input.font_size = new_size
+
+    def select_view_mode(self, mode):
+        self.vm_btn.text = mode
+        self.translator.view_mode = mode
+        self.translator.colors = VIEW_MODES[mode]
+        self.vm_dropdown.dismiss()
+
+    def reset_defaults(self, instance):
+        default_font_size = 32
+        self.fs_slider.value = default_font_size
+        self.translator.english_input.font_size = default_font_size
+        self.translator.aurebesh_input.font_size = default_font_size
+        self.translator.view_mode = "Rebel"
+        self.translator.colors = VIEW_MODES["Rebel"]
+        self.vm_btn.text = "Rebel"
+
+    def open_about(self):
+        self.translator.popups.open(AboutPopup)
+
+    def apply_theme(self):
+        self.translator.apply_theme()
+        self.dismiss()
+
+# -----------------------------
+# Games Popup
+# -----------------------------
+class GameSelectionPopup(ModalView):
+    def __init__(self, translator_widget, **kwargs):
+        super().__init__(size_hint=(0.8, 0.6), **kwargs)
+        self.translator = translator_widget
+        self.auto_dismiss = False   # force use of close button
+
+        # 1) Outer vertical layout fills the popup
+        layout = BoxLayout(
+            orientation="vertical",
+            spacing=dp(10),
+            padding=[dp(10)] * 4
+        )
+
+        # 2) Spacer pushes everything else *up*
+        layout.add_widget(Widget(size_hint_y=1))
+
+        # 3) Game buttons (added bottom→top order)
+        btn_search = Button(text="Word Search", size_hint_y=None, height=dp(48))
+        btn_search.bind(on_release=lambda *_: (self.translator.open_word_search(), self.dismiss()))
+        layout.add_widget(btn_search)
+
+        btn_flash = Button(text="Flash-Cards", size_hint_y=None, height=dp(48))
+        btn_flash.bind(on_release=lambda *_: (self.translator.open_flashcards(), self.dismiss()))
+        layout.add_widget(btn_flash)
+
+        # 4) Header with Close icon goes *last*, so it appears at the top
+        header = BoxLayout(orientation="horizontal", size_hint_y=None, height=dp(48))
+        header.add_widget(Widget())  # pushes close-button right
+        self.close_btn = MainIconButton(
+            text="\uf057",  # FontAwesome “X” icon
+            font_size=dp(24),
+            normal_color=self.translator.colors["icon_normal"],
+            active_color=self.translator.colors["icon_active"],
+            font_name="fonts/icon-font.ttf",
+            size_hint=(None, None),
+            size=(dp(48), dp(48))
+        )
+        self.close_btn.bind(on_release=lambda *_: self.dismiss())
+        self.translator.theme.register(self.close_btn, **ICON_ROLES)
+        header.add_widget(self.close_btn)
+        layout.add_widget(header)
+
+        # 5) Finally, add this fully-built layout to the popup
+        self.add_widget(layout)
+
+# -----------------------------
+# Flash-Card Quiz Popup
+# -----------------------------
+import random
+from kivy.clock import Clock
+from kivy.uix.gridlayout import GridLayout
+
+class FlashCardPopup(ModalView):
+    def __init__(self, translator_widget, **kwargs):
+        super().__init__(size_hint=(0.9, 0.9), **kwargs)
+        self.translator = translator_widget
+        self.auto_dismiss = False
+
+        # 1) Tier state (don’t load cards yet)
+        self.current_tier   = 1
+        self.unlocked_tiers = {1}
+
+        # 2) Build the UI
+        self.layout = BoxLayout(orientation="vertical", padding=dp(20), spacing=dp(10))
+        
+        # Score label (will be updated by next_card)
+        self.score_lbl = Label(text="", size_hint_y=None, height=dp(30), color=(1, 1, 1, 1))
+        self.layout.add_widget(self.score_lbl)
+
+        # Progress bar
+        self.progress = ProgressBar(max=1, value=0, size_hint_y=None, height=dp(80))
+        self.layout.add_widget(self.progress)
+
+        # Prompt (Aurebesh glyph)
+        self.prompt = Label(
+            font_name="Aurebesh-ImpRemnant.otf",
+            font_size=dp(32),
+            halign="center",
+            valign="middle",
+            size_hint_y=None,
+            height=dp(100)
+        )
+        self.prompt.text_size = (self.prompt.width, None)
+        self.prompt.bind(
+            width=lambda inst, w: setattr(inst, 'text_size', (w, None))
+        )
+
+        self.layout.add_widget(self.prompt)
+
+        # Load sounds
+        self.sound_correct = SoundLoader.load('sound/ding.mp3')
+        self.sound_wrong   = SoundLoader.load('sound/buzz.mp3')
+
+        # Answer buttons grid
+        btn_grid = GridLayout(cols=2, spacing=dp(10), size_hint_y=None, height=dp(200))
+        self.answer_btns = []
+        for _ in range(4):
+            b = Button(
+                font_size=dp(20),
+                size_hint=(1, None),
+                height=dp(48),
+                background_normal='',
+                background_down='',
+                background_disabled_normal='',
+                background_disabled_down='',
+                background_color=self.translator.colors["container"],
+                color=(1,1,1,1),
+                disabled_color=(1,1,1,1),
+                halign='center',
+                valign='middle',
+                text_size=(0, None)
+            )
+            b.bind(on_release=self.check_answer)
+            self.answer_btns.append(b)
+            btn_grid.add_widget(b)
+
+            # enable text wrapping at the button’s current width
+            b.text_size = (b.width, None)
+            b.halign    = 'center'
+            b.valign    = 'middle'
+            b.bind(width=lambda inst, w: setattr(inst, 'text_size', (w, None)))
+
+            # 1) Make the text wrap at the button’s width minus padding
+            b.bind(width=lambda inst, w: setattr(inst, 'text_size', (w - dp(20), None)))
+
+            # 2) Auto‐grow the height based on wrapped text size
+            b.bind(texture_size=lambda inst, ts: setattr(inst, 'height', ts[1] + dp(20)))
+        
+        self.layout.add_widget(btn_grid)
+
+        # Close button
+        close = Button(text="Close", size_hint_y=None, height=dp(48))
+        close.bind(on_release=lambda *_: self.dismiss())
+        self.layout.add_widget(close)
+
+        # Attach the layout
+        self.add_widget(self.layout)
+
+        # 3) Now that all widgets exist, load the first deck
+        self.load_tier(self.current_tier)
+
+    def load_tier(self, tier):
+        # 1) Build & shuffle the new deck
+        pool = TIERS[tier].copy()
+        random.shuffle(pool)
+        self.cards = pool
+
+        # 2) Reset indices and score
+        self.index = 0
+        self.score = 0
+
+        # 3) Reset progress bar to match deck size
+        self.progress.max = len(self.cards)
+        self.progress.value = 0
+
+        # 4) Display the first card in the already‐built UI
+        self.next_card()
+
+    def next_card(self):
+        # ——— 1) End-of-deck? show pass/fail + buttons ———
+        if self.index >= len(self.cards):
+            total = len(self.cards)
+            pct   = self.score / total
+            passed = pct >= 0.7
+            status = "DIRECTIVE PASSED" if passed else "DIRECTIVE FAILED"
+
+            # Hide the small score label and progress bar
+            self.score_lbl.opacity = 0
+            self.progress.opacity  = 0
+
+            # Use the prompt label for a big summary
+            self.prompt.font_name = "fonts/VT323-Regular.ttf"
+            self.prompt.font_size = dp(26)
+            self.prompt.text = f"SCORE: {self.score}/{total}\n{status}"
+
+            aus_status = cached_translate(status.lower())
+
+            # cleanup old buttons
+            for w in getattr(self, 'end_buttons', []):
+                try: self.layout.remove_widget(w)
+                except: pass
+            self.end_buttons = []            
+
+            # compute pass/fail
+            total = len(self.cards)
+            status = "DIRECTIVE PASSED" if passed else "DIRECTIVE FAILED"
+            pct    = self.score / len(self.cards)
+            passed = pct >= 0.7
+
+            # display definitive system report
+            self.score_lbl.color = (0,1,0,1) if passed else (1,0,0,1)
+            self.score_lbl.text  = f"Score: {self.score}/{total}   {status}"
+
+            # Restart button
+            restart = Button(
+                text="Restart",
+                size_hint_y=None, height=dp(48),
+                background_normal='',
+                background_color=self.translator.colors["accent"],
+                color=get_contrasting_color(self.translator.colors["accent"])
+            )
+            restart.bind(on_release=self.restart_quiz)
+            self.translator.theme.register(restart, background_color="accent", color="accent_text")
+            self.layout.add_widget(restart)
+            self.end_buttons.append(restart)
+
+            # Continue button
+            next_tier = self.current_tier + 1
+            # if they passed, unlock & persist the new tier
+            if passed and next_tier in TIERS:
+                self.translator.unlocked_tiers.add(next_tier)
+                save_unlocked_tiers(self.translator.unlocked_tiers)
+            if next_tier in TIERS:
+                cont_text = f"Continue to Tier {next_tier}"
+            else:
+                cont_text = "Restart or Close"
+
+            cont = Button(
+                text=cont_text,
+                size_hint_y=None, height=dp(48),
+                background_normal='',
+                background_color=self.translator.colors["accent"],
+                color=get_contrasting_color(self.translator.colors["accent"])
+            )
+            cont.bind(on_release=self.continue_quiz)
+            self.translator.theme.register(cont, background_color="accent", color="accent_text")
+            self.layout.add_widget(cont)
+            self.end_buttons.append(cont)
+
+            return
+
+        # ——— 2) Otherwise, show the next card as normal ———
+        # live score in white
+        self.score_lbl.color = (1,1,1,1)
+        self.score_lbl.text  = f"{self.score} / {len(self.cards)}"
+        self.progress.value  = self.index
+
+        eng = self.cards[self.index]
+        self.prompt.text = cached_translate(eng)
+
+        # pick & display four choices
+        choices = draw_choices(self.cards, eng)
+        for btn, text in zip(self.answer_btns, choices):
+            btn.text             = text
+            btn.background_color = self.translator.colors["container"]
+            btn.color            = (1,1,1,1)
+            btn.disabled         = False
+            btn.opacity          = 1
+
+
+    def check_answer(self, btn):
+        correct = self.cards[self.index]
+        container = self.translator.colors["container"]
+        label_col = self.translator.colors["label"]
+        green = (0, 1, 0, 1)
+        red   = (1, 0, 0, 1)
+        white = (1, 1, 1, 1)
+
+        if btn.text == correct:
+            self.sound_correct.play()
+            Animation(
+                background_color=green,
+                color=white,
+                duration=0.2
+            ).start(btn)
+            self.score += 1
+        else:
+            self.sound_wrong.play()
+            Animation(
+                background_color=red,
+                color=white,
+                duration=0.2
+            ).start(btn)
+            # highlight correct
+            for b2 in self.answer_btns:
+                if b2.text == correct:
+                    Animation(
+                        background_color=green,
+                        color=white,
+                        duration=0.3
+                    ).start(b2)
+
+        # disable & advance
+        for b2 in self.answer_btns:
+            b2.disabled = True
+        self.index += 1
+        Clock.schedule_once(lambda dt: self.next_card(), 0.6)
+
+    def restart_quiz(self, *args):
+        # restore prompt style
+        self.prompt.font_name = "Aurebesh-ImpRemnant.otf"
+        self.prompt.font_size = dp(32)
+        # make the in‐quiz widgets visible again
+        self.score_lbl.opacity = 1
+        self.progress.opacity  = 1
+        # 1) Remove both end‐of‐deck buttons
+        for w in getattr(self, 'end_buttons', []):
+            try:    self.layout.remove_widget(w)
+            except: pass
+        self.end_buttons = []
+
+        # 2) Reset score label to default color & text
+        self.score_lbl.color = self.translator.colors["label"]
+        self.score_lbl.text  = ""
+
+        # 3) Restore and show answer buttons
+        for b in self.answer_btns:
+            b.disabled = False
+            b.opacity  = 1
+            # reset their theme colors too
+            b.background_color = self.translator.colors["container"]
+            b.color            = self.translator.colors["label"]
+
+        # 4) Reset progress bar
+        self.progress.value = 0
+
+        # 5) Reload the deck & show first card
+        self.load_tier(self.current_tier)
+
+    def start(self, tier):
+        """Begin a fresh quiz on `tier`; used each time the pooled pop-up opens."""
+        self.current_tier = tier
+        self.unlocked_tiers = self.translator.unlocked_tiers
+        self.restart_quiz()
+
+    def continue_quiz(self, *args):
+        # restore prompt style
+        self.prompt.font_name = "Aurebesh-ImpRemnant.otf"
+        self.prompt.font_size = dp(32)
+        # make the in‐quiz widgets visible again
+        self.score_lbl.opacity = 1
+        self.progress.opacity  = 1
+
+        # 1) Remove both end‐of‐deck buttons
+        for w in getattr(self, 'end_buttons', []):
+            try:    self.layout.remove_widget(w)
+            except: pass
+        self.end_buttons = []
+
+        # 2) Restore answer buttons
+        for b in self.answer_btns:
+            b.disabled         = False
+            b.opacity          = 1
+            b.background_color = self.translator.colors["container"]
+            b.color            = (1, 1, 1, 1)
+
+        # 3) Advance to next tier if available
+        next_tier = self.current_tier + 1
+        if next_tier in TIERS:
+            self.current_tier = next_tier
+
+        # 4) Load that tier’s deck
+        self.load_tier(self.current_tier)
+
+from kivy.uix.modalview import ModalView
+from kivy.uix.boxlayout  import BoxLayout
+from kivy.uix.button     import Button
+from kivy.metrics         import dp
+from kivy.core.text       import Label as CoreLabel
+from kivy.graphics        import Mesh, RenderContext
+
+# -----------------------------
+# Word-Search Grid (every cell on one canvas)
+# -----------------------------
+# Position, atlas coordinates and an RGBA colour per vertex, so a
+# highlight only rewrites colour floats.
+GRID_VERTEX_FORMAT = [(b'vPosition', 2, 'float'), (b'vTexCoords0', 2, 'float'), (b'vColor', 4, 'float')]
+GRID_VERTEX_SIZE = 8
+GRID_VS = """
+$HEADER$
+attribute vec4 vColor;
+
+void main(void) {
+    frag_color = vColor * vec4(1.0, 1.0, 1.0, opacity);
+    tex_coord0 = vTexCoords0;
+    gl_Position = projection_mat * modelview_mat * vec4(vPosition.xy, 0.0, 1.0);
+}
+"""
+GRID_FS = """
+$HEADER$
+
+void main(void) {
+    gl_FragColor = frag_color * texture2D(texture0, tex_coord0);
+}
+"""
+CELL_PLAIN = ((0, 0, 0, 0), (1, 1, 1, 1))        # (background, letter)
+CELL_SELECTED = ((1, 1, 0, 1), (0, 0, 0, 1))
+CELL_FOUND = ((0.7, 1, 0.7, 1), (0, 0, 0, 1))
+CELL_WRONG = ((1, 0.7, 0.7, 1), (0, 0, 0, 1))
+
+_glyph_atlases = {}
+
+def get_glyph_atlas(chars, font_name="Aurebesh-ImpRemnant.otf", font_size=64):
+    """Render `chars` once, side by side, into a single texture.
+
+    Returns (texture, {char: (u_left, u_right, aspect)}); the vertical
+    texture coordinates are shared by every glyph.
+    """
+    key = (font_name, font_size, chars)
+    atlas = _glyph_atlases.get(key)
+    if atlas is None:
+        # Spaces keep neighbouring glyphs (and kerning) apart.
+        text = " ".join(chars)
+        label = CoreLabel(text=text, font_name=font_name, font_size=font_size)
+        label.refresh()
+        texture = label.texture
+        width, height = texture.size
+        u0, _, u1 = texture.tex_coords[:3]
+        glyphs = {}
+        for i, ch in enumerate(chars):
+            left = label.get_extents(text[:2 * i])[0]
+            glyph_width = label.get_extents(ch)[0]
+            glyphs[ch] = (u0 + (u1 - u0) * left / width,
+                          u0 + (u1 - u0) * (left + glyph_width) / width,
+                          glyph_width / height)
+        atlas = _glyph_atlases[key] = (texture, glyphs)
+    return atlas
+
+class WordSearchGrid(Widget):
+    """A letter grid drawn as two meshes on a single canvas.
+
+    One mesh holds the cell backgrounds, the other the letters, cut from a
+    glyph atlas. Taps are mapped to cells arithmetically and reported
+    through `on_cell_tap(x, y)`; `set_cell(x, y, style)` only rewrites the
+    vertex colours of that cell, and all changes in a frame are uploaded
+    together.
+    """
+    __events__ = ('on_cell_tap',)
+
+    def __init__(self, grid, **kwargs):
+        self.canvas = RenderContext(use_parent_projection=True, use_parent_modelview=True,
+                                    use_parent_frag_modelview=True)
+        self.canvas.shader.vs = GRID_VS
+        self.canvas.shader.fs = GRID_FS
+        super().__init__(**kwargs)
+        self.grid = grid
+        self.grid_size = len(grid)
+        chars = "".join(sorted({ch for row in grid for ch in row}))
+        self.atlas, self.glyphs = get_glyph_atlas(chars)
+        self.styles = [CELL_PLAIN] * (self.grid_size * self.grid_size)
+        indices = []
+        for i in range(self.grid_size * self.grid_size):
+            v = i * 4
+            indices.extend((v, v + 1, v + 2, v + 2, v + 3, v))
+        with self.canvas:
+            self.bg_mesh = Mesh(fmt=GRID_VERTEX_FORMAT, mode='triangles', indices=indices)
+            self.fg_mesh = Mesh(fmt=GRID_VERTEX_FORMAT, mode='triangles', indices=indices, texture=self.atlas)
+        self._upload = Clock.create_trigger(self.upload_colors)
+        self.bind(pos=self.update_geometry, size=self.update_geometry)
+        self.update_geometry()
+
+    def cell_geometry(self):
+        """(left, top, cell size) of the square grid, centred in the widget."""
+        cell = min(self.width, self.height) / self.grid_size
+        left = self.x + (self.width - cell * self.grid_size) / 2
+        top = self.top - (self.height - cell * self.grid_size) / 2
+        return left, top, cell
+
+    def update_geometry(self, *args):
+        left, top, cell = self.cell_geometry()
+        gap = 1 if cell > 4 else 0
+        glyph_h = cell * 0.7
+        _, v0, _, _, _, v1 = self.atlas.tex_coords[:6]
+        bg, fg = [], []
+        for y in range(self.grid_size):
+            y1 = top - y * cell
+            y0 = y1 - cell + gap
+            for x in range(self.grid_size):
+                x0 = left + x * cell
+                x1 = x0 + cell - gap
+                back, front = self.styles[y * self.grid_size + x]
+                for vx, vy in ((x0, y0), (x1, y0), (x1, y1), (x0, y1)):
+                    bg.extend((vx, vy, 0, 0))
+                    bg.extend(back)
+                u_left, u_right, aspect = self.glyphs[self.grid[y][x]]
+                glyph_w = glyph_h * aspect
+                gx0 = x0 + (cell - glyph_w) / 2
+                gy0 = y1 - (cell + glyph_h) / 2
+                gx1, gy1 = gx0 + glyph_w, gy0 + glyph_h
+                for vx, vy, u, v in ((gx0, gy0, u_left, v0), (gx1, gy0, u_right, v0),
+                                     (gx1, gy1, u_right, v1), (gx0, gy1, u_left, v1)):
+                    fg.extend((vx, vy, u, v))
+                    fg.extend(front)
+        self.bg_vertices = bg
+        self.fg_vertices = fg
+        self.upload_colors()
+
+    def set_cell(self, x, y, style):
+        i = y * self.grid_size + x
+        if self.styles[i] == style:
+            return
+        self.styles[i] = style
+        back, front = style
+        for k in range(4):
+            offset = (i * 4 + k) * GRID_VERTEX_SIZE + 4
+            self.bg_vertices[offset:offset + 4] = back
+            self.fg_vertices[offset:offset + 4] = front
+        self._upload()
+
+    def get_cell(self, x, y):
+        return self.styles[y * self.grid_size + x]
+
+    def upload_colors(self, *args):
+        self.bg_mesh.vertices = self.bg_vertices
+        self.fg_mesh.vertices = self.fg_vertices
+
+    def cell_at(self, touch_x, touch_y):
+        left, top, cell = self.cell_geometry()
+        if cell <= 0:
+            return None
+        x = int((touch_x - left) // cell)
+        y = int((top - touch_y) // cell)
+        if 0 <= x < self.grid_size and 0 <= y < self.grid_size:
+            return x, y
+        return None
+
+    def on_touch_down(self, touch):
+        if not self.collide_point(*touch.pos):
+            return super().on_touch_down(touch)
+        cell = self.cell_at(*touch.pos)
+        if cell is not None:
+            self.dispatch('on_cell_tap', *cell)
+        return True
+
+    def on_cell_tap(self, x, y):
+        pass
+
+class WordSearchPopup(ModalView):
+    def __init__(self, words, grid_size=12, puzzle=None, **kwargs):
+        super().__init__(**kwargs)
+        self.size_hint = (0.9, 0.9)
+        self.words = [w.upper() for w in words]
+        self.grid_size = grid_size
+        # puzzle: a Puzzle made ahead of time, if there is one; it comes
+        # with its answer key already built
+        puzzle = puzzle or generate_word_search(self.words, grid_size)
+        self.grid, self.placed = puzzle
+        self.answers = puzzle.answers
+        self.selected = []
+        self.found = set()  # cells of found words
+
+        # Build a single layout up front
+        layout = BoxLayout(orientation='vertical', spacing=dp(8), padding=dp(8))
+
+        # 1) Instruction icon (opens small popup)
+        from kivy.uix.anchorlayout import AnchorLayout
+        header = AnchorLayout(anchor_x='right', anchor_y='center',
+                               size_hint_y=None, height=dp(40))
+        instr_btn = Button(
+            text='?', size_hint=(None,None), size=(dp(30), dp(30)),
+            background_normal='', background_color=(0.9,0.9,0.5,1)
+        )
+        instr_btn.bind(on_release=self.show_instructions)
+        header.add_widget(instr_btn)
+        layout.add_widget(header)
+
+        # 2) Grid of Aurebesh letters
+        self.grid_widget = WordSearchGrid(self.grid)
+        self.grid_widget.bind(on_cell_tap=lambda grid, x, y: self.on_cell_tap((x, y)))
+        layout.add_widget(self.grid_widget)
+
+        # 3) Current selection and clear-selection button
+        self.selected_label = Label(text="Selected:   ", size_hint_y=None, height=dp(30))
+        layout.add_widget(self.selected_label)
+        clear_btn = Button(text="Clear Selection", size_hint_y=None, height=dp(30))
+        clear_btn.bind(on_release=lambda *a: self.clear_selection())
+        layout.add_widget(clear_btn)
+
+        # 4) English list of the words still to find
+        self.word_list = Label(size_hint_y=None, height=dp(40))
+        self.update_word_list()
+        layout.add_widget(self.word_list)
+
+        # 5) Close button
+        close = Button(text="Close", size_hint_y=None, height=dp(48))
+        close.bind(on_release=lambda *a: self.dismiss())
+        layout.add_widget(close)
+
+        # 6) Attach everything
+        self.add_widget(layout)
+
+    def update_word_list(self):
+        if self.answers.complete:
+            self.word_list.text = "All words found!"
+        else:
+            self.word_list.text = "Find: " + ", ".join(self.words[i] for i in self.answers.remaining())
+
+    def cell_style(self, pos):
+        """How a cell looks when nothing is selected on it."""
+        return CELL_FOUND if pos in self.found else CELL_PLAIN
+
+    def on_cell_tap(self, pos):
+        # clear any prior “first-tap” highlight when tapping it again
+        if self.selected and self.selected[0] == pos:
+            self.clear_selection()
+            return
+
+        # record & highlight this tap
+        self.selected.append(pos)
+        self.grid_widget.set_cell(*pos, CELL_SELECTED)
+
+        # update our “Selected:” label
+        letters = [self.grid[y][x] for x, y in self.selected]
+        self.selected_label.text = f"Selected: {' – '.join(letters)}"
+
+        # once we have two taps, check correctness
+        if len(self.selected) == 2:
+            i = self.answers.match(*self.selected)
+            if i is not None:
+                # highlight the entire found word in green
+                coords = self.placed[i][1]
+                self.found.update(coords)
+                for cell in coords:
+                    self.grid_widget.set_cell(*cell, CELL_FOUND)
+                if self.answers.mark_found(i):
+                    self.update_word_list()
+            else:
+                # mark wrong taps in red, then put them back after 0.5s
+                wrong = list(self.selected)
+                for cell in wrong:
+                    self.grid_widget.set_cell(*cell, CELL_WRONG)
+                Clock.schedule_once(lambda dt: self.reset_cells(wrong), 0.5)
+
+            # reset selection state
+            self.selected = []
+            self.selected_label.text = "Selected:   "
+
+    def reset_cells(self, cells):
+        for cell in cells:
+            if cell not in self.selected:
+                self.grid_widget.set_cell(*cell, self.cell_style(cell))
+
+    def clear_selection(self):
+        # reset any highlighted cells and clear state
+        selected, self.selected = self.selected, []
+        self.reset_cells(selected)
+        self.selected_label.text = "Selected:   "
+
+    def show_instructions(self, *args):
+        from kivy.uix.modalview import ModalView
+        help_popup = ModalView(size_hint=(0.6, 0.4))
+        msg = Label(
+            text="How to play:\nTap the first and last letter of an English word to select it.",
+            halign="center", valign="middle"
+        )
+        msg.text_size = (help_popup.width * 0.9, None)
+        help_popup.add_widget(msg)
+        help_popup.open()
+
+class TierSelectPopup(ModalView):
+    def __init__(self, translator_widget, tiers=None, **kwargs):
+        super().__init__(size_hint=(0.6, 0.4), **kwargs)
+        self.translator = translator_widget
+        self.layout = BoxLayout(orientation="vertical", spacing=dp(10), padding=dp(20))
+        self.add_widget(self.layout)
+        self.tiers = None
+        self.set_tiers(tiers if tiers is not None else sorted(self.translator.unlocked_tiers))
+
+    def set_tiers(self, tiers):
+        # Buttons are only rebuilt when a new tier has been unlocked.
+        tiers = list(tiers)
+        if tiers == self.tiers:
+            return
+        self.tiers = tiers
+        self.layout.clear_widgets()
+        for t in tiers:
+            btn = Button(text=f"Tier {t}", size_hint_y=None, height=dp(48))
+            btn.bind(on_release=lambda _, tier=t: self.start_tier(tier))
+            self.layout.add_widget(btn)
+
+    def refresh(self):
+        self.set_tiers(sorted(self.translator.unlocked_tiers))
+
+    def start_tier(self, tier):
+        popup = self.translator.popups.get(FlashCardPopup)
+        popup.start(tier)
+        popup.open()
+        self.dismiss()
+
+# -----------------------------
+# Pop-up Pool
+# -----------------------------
+class PopupPool:
+    """Builds each pop-up class once and hands the same instance back on
+    every later open, after calling its refresh() (if it has one) so it can
+    pick up changed data and a new theme."""
+    def __init__(self, translator_widget):
+        self.translator = translator_widget
+        self._popups = {}
+
+    def get(self, cls):
+        popup = self._popups.get(cls)
+        if popup is None:
+            popup = self._popups[cls] = cls(translator_widget=self.translator)
+        elif hasattr(popup, "refresh"):
+            popup.refresh()
+        return popup
+
+    def open(self, cls):
+        popup = self.get(cls)
+        popup.open()
+        return popup
+
+# -----------------------------
+# Main Translator Widget
+# -----------------------------
+class TranslatorWidget(BoxLayout):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # load the set of unlocked tiers (persists across runs)
+        self.unlocked_tiers = load_unlocked_tiers()
+        # Pop-ups are built on first use and reused after that.
+        self.popups = PopupPool(self)
+        # Start making word-search puzzles before anyone asks for one.
+        get_puzzle_pool()
+        # keeps the other input's translation in step with the one being edited
+        self._mirror = None
+        self.orientation = "vertical"
+        self.padding = [dp(10)] * 4
+        self.spacing = dp(10)
+
+        # Theme & header
+        self.view_mode = DEFAULT_VIEW_MODE
+        self.colors = VIEW_MODES[self.view_mode]
+        # Every themed widget registers here; apply_theme() updates them all.
+        self.theme = ThemeManager(self.colors)
+        self.theme.register(Window, clearcolor="bg")
+
+        from kivy.uix.anchorlayout import AnchorLayout
+
+        header = AnchorLayout(
+            anchor_x="right",  # push children to the right edge
+            anchor_y="center", # vertically centered
+            size_hint_y=None,
+            height=dp(48),
+        )
+
+        header = BoxLayout(
+            orientation="horizontal",
+            spacing=dp(10),
+            size_hint_y=None,
+            height=dp(48),
+        )
+
+        header.add_widget(Widget(size_hint_x=1))
+
+        self.learn_btn = MainIconButton(
+            text="\uf11b",
+            font_size=dp(24),
+            normal_color=self.colors["icon_normal"],
+            active_color=self.colors["icon_active"],
+            font_name="fonts/icon-font.ttf",
+            size_hint=(None, None),
+            size=(dp(48), dp(48))
+        )
+
+        self.learn_btn.bind(on_release=lambda _: self.open_learning())
+        self.theme.register(self.learn_btn, **ICON_ROLES)
+        header.add_widget(self.learn_btn)
+
+        self.gear_btn = MainIconButton(
+            text="\uf013",
+            font_size=dp(24),
+            normal_color=self.colors["icon_normal"],
+            active_color=self.colors["icon_active"],
+            font_name="fonts/icon-font.ttf",
+            size_hint=(None, None),
+            size=(dp(48), dp(48))
+)
+        self.gear_btn.bind(on_release=lambda _: self.open_settings())
+        self.theme.register(self.gear_btn, **ICON_ROLES)
+        header.add_widget(self.gear_btn)
+        self.add_widget(header)
+
+        # English input
+        self.english_input = TextInput(
+            hint_text="English Input", multiline=True,
+            font_size=dp(18), font_name="fonts/VT323-Regular.ttf",
+            size_hint_y=0.15,
+            background_color=self.colors["container"],
+            foreground_color=self.colors["input_text"],
+            padding=[dp(10)]*4
+        )
+        self.english_input.bind(focus=lambda inst, val: update_border(inst, val))
+        self.english_input.bind(text=self.on_english_text)
+        self.theme.register(self.english_input, background_color="container", foreground_color="input_text")
+        self.add_widget(self.english_input)
+
+        # Aurebesh input
+        self.aurebesh_input = TextInput(
+            hint_text="Aurebesh Translation", multiline=True,
+            font_size=dp(18), font_name="Aurebesh-ImpRemnant.otf",
+            size_hint_y=0.15,
+            background_color=self.colors["container"],
+            foreground_color=self.colors["input_text"],
+            padding=[dp(10)]*4
+        )
+        self.aurebesh_input.bind(focus=lambda inst, val: update_border(inst, val))
+        self.aurebesh_input.bind(text=self.on_aurebesh_text)
+        self.theme.register(self.aurebesh_input, background_color="container", foreground_color="input_text")
+        self.aurebesh_input.input_type = 'null'  # disable system keyboard
+        self.add_widget(self.aurebesh_input)
+
+        # Action bar
+        self.bottom_bar = BoxLayout(
+            orientation="horizontal",
+            size_hint_y=None,
+            height=dp(48),
+            spacing=dp(10)
+        )
+        for icon, handler in [
+            ("\uf0c5", self.copy_active_text),
+            ("\uf0ea", self.paste_text),
+            ("\uf00d", self.clear_texts),
+            ("\uf02e", self.open_saved_popup),
+            ("\uf005", self.save_current_phrase),
+            ("\uf1da", self.open_history),
+        ]:
+            btn = MainIconButton(
+                text=icon,
+                font_size=dp(24),
+                normal_color=self.colors["icon_normal"],
+                active_color=self.colors["icon_active"],
+                font_name="fonts/icon-font.ttf",
+                size_hint=(1, None),
+                height=dp(48), 
+            )
+            btn.bind(on_release=lambda _, fn=handler: fn())
+            self.theme.register(btn, **ICON_ROLES)
+            self.bottom_bar.add_widget(btn)
+        self.add_widget(self.bottom_bar)
+
+        # Custom Aurebesh keyboard
+        self.keyboard_overlay = CustomKeyboard(
+            input_target=self.aurebesh_input,
+            translator=self,
+            size_hint_y=None,
+            height=dp(200)
+        )
+        self.add_widget(self.keyboard_overlay)
+
+    # Translation callbacks
+    def on_english_text(self, instance, value):
+        self.mirror_edit("to_aurebesh", instance, value, self.aurebesh_input, self.on_aurebesh_text)
+
+    def on_aurebesh_text(self, instance, value):
+        self.mirror_edit("to_english", instance, value, self.english_input, self.on_english_text)
+
+    def mirror_edit(self, direction, source, value, target, target_callback):
+        # Patch only the edited region into the other input while edits keep
+        # coming from the same side; otherwise (first edit, or the user
+        # switched inputs) retranslate the whole buffer. The source's cursor
+        # tells the mirror where to look for the edit.
+        mirror = self._mirror
+        target.unbind(text=target_callback)
+        if mirror is not None and mirror.direction == direction:
+            length = mirror.dst_len
+            start, end, replacement = mirror.edit(value, source.cursor_index())
+            patch_text_input(target, start, end, replacement, length)
+        else:
+            mirror = self._mirror = EditMirror(direction)
+            target.text = mirror.reset(value)
+        target.bind(text=target_callback)
+
+    # Action handlers
+    def copy_active_text(self):
+        if self.english_input.focus:
+            Clipboard.copy(self.english_input.text)
+        elif self.aurebesh_input.focus:
+            Clipboard.copy(self.aurebesh_input.text)
+        else:
+            Clipboard.copy(self.english_input.text)
+
+    def paste_text(self):
+        pasted = Clipboard.paste()
+        # Decide target: whichever is focused, or default to English
+        if self.english_input.focus:
+            target = self.english_input
+        elif self.aurebesh_input.focus:
+            target = self.aurebesh_input
+        else:
+            target = self.english_input
+            target.focus = True
+
+        # Insert at current cursor position
+        cursor = target.cursor_index()
+        target.text = target.text[:cursor] + pasted + target.text[cursor:]
+        # Move cursor to end of pasted text
+        target.cursor = (cursor + len(pasted), 0)
+
+    def clear_texts(self):
+        self.english_input.text = ""
+        self.aurebesh_input.text = ""
+
+    def open_saved_popup(self):
+        self.popups.open(SavedPopup)
+
+    def save_current_phrase(self):
+        phrase = self.english_input.text.strip()
+        if phrase:
+            add_saved_phrase(phrase)
+
+    def open_history(self):
+        if self.english_input.text.strip():
+            add_history_entry(self.english_input.text, self.aurebesh_input.text)
+        self.popups.open(HistoryPopup)
+
+    def open_settings(self):
+        self.popups.open(SettingsPopup)
+
+    def open_learning(self):
+        self.popups.open(GameSelectionPopup)
+
+    def open_flashcards(self):
+        if len(self.unlocked_tiers) > 1:
+            self.popups.open(TierSelectPopup)
+        else:
+            popup = self.popups.get(FlashCardPopup)
+            popup.start(1)
+            popup.open()
+
+    def open_word_search(self):
+        # The puzzle normally comes ready-made from the background pool.
+        words, size = WORD_SEARCH_PUZZLES[0]
+        puzzle = get_puzzle_pool().take(words, size)
+        WordSearchPopup(words=words, grid_size=size, puzzle=puzzle).open()
+
+    def apply_theme(self):
+        # One pass over every registered widget, open pop-ups included.
+        self.theme.apply(self.colors)
+
+# -----------------------------
+# Custom Keyboard
+# -----------------------------
+
+class CustomKeyboard(GridLayout):
+    def __init__(self, input_target, translator=None, **kwargs):
+        super().__init__(**kwargs)
+        self.cols = 1                 # one row per BoxLayout
+        self.spacing = dp(4)
+        self.input_target = input_target
+        self.translator = translator
+        self.build_keyboard()
+
+    def build_keyboard(self):
+        rows = [
+            list("QWERTYUIOP"),
+            list("ASDFGHJKL"),
+            list("ZXCVBNM"),
+            ["SPACE", "BACK", "ENTER"],
+            ["CH", "SH", "TH", "NG", "AE", "EO", "KH", "OO"],
+        ]
+        ligature_map = {
+            "CH": "\ue011", "SH": "\ue016", "TH": "\ue018", "NG": "\ue014",
+            "AE": "\ue010", "EO": "\ue012", "KH": "\ue013", "OO": "\ue015"
+        }
+
+        for row in rows:
+            row_layout = BoxLayout(
+                orientation="horizontal",
+                size_hint_y=None,
+                height=dp(48),
+                spacing=dp(4),
+            )
+            for key in row:
+                btn = Button(
+                    text=key,
+                    font_size=dp(18),
+                    font_name="Aurebesh-ImpRemnant.otf",
+                    background_color=(0, 0, 0, 0.7),
+                    color=(1, 0.631, 0.129, 1),
+                    size_hint=(1, 1),
+                )
+                btn.bind(on_release=self.on_key_press)
+                btn.key_value = ligature_map.get(key, key.upper())
+                row_layout.add_widget(btn)
+            self.add_widget(row_layout)
+
+    def on_key_press(self, button):
+        key = button.key_value
+        input_box = self.input_target
+        text = input_box.text
+        cursor = input_box.cursor_index()
+
+        # 1) Merge last char + new char into a ligature if possible
+        if len(key) == 1 and key.isalpha() and text:
+            duo = (text[-1] + key).lower()
+            if duo in ligatures:
+                glyph = ligatures[duo]
+                input_box.text = text[:-1] + glyph
+                input_box.cursor = (len(input_box.text), 0)
+                if self.translator:
+                    self.translator.on_aurebesh_text(input_box, input_box.text)
+                return
+
+        # 2) Handle SPACE, BACK, ENTER
+        if key == "SPACE":
+            key = " "
+        elif key == "BACK":
+            if cursor > 0:
+                input_box.text = text[:cursor-1] + text[cursor:]
+                input_box.cursor = (cursor-1, 0)
+            return
+        elif key == "ENTER":
+            key = "\n"
+
+        # 3) Normal insert
+        input_box.text = text[:cursor] + key + text[cursor:]
+        new_index = cursor + len(key)
+        input_box.cursor = input_box.get_cursor_from_index(new_index)
+
+        # 4) Trigger English translation
+        if self.translator:
+            self.translator.on_aurebesh_text(input_box, input_box.text)
+
+# -----------------------------
+# The Kivy App
+# -----------------------------
+class AurebeshTranslatorApp(App):
+    def build(self):
+        return TranslatorWidget()
+
+    def on_pause(self):
+        # Mobile platforms may kill a paused app without calling on_stop.
+        flush_pending_writes()
+        return True
+
+    def on_stop(self):
+        flush_pending_writes()
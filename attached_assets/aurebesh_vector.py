@@ -0,0 +1,120 @@
+import unicodedata
+
+try:
+    import numpy as np
+except ImportError:  # optional: only needed for bulk translation
+    np = None
+
+import aurebesh_engine
+from aurebesh_engine import ligatures
+
+# Code points above the BMP (and the rare characters whose lowercase form is
+# more than one character) go through the plain engine instead.
+_BMP = 0x10000
+_COMPLEX = 0xFFFFFFFF
+
+_tables = None
+
+# -----------------------------
+# Code Point Arrays
+# -----------------------------
+def _require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required for the vectorized translator (pip install numpy)")
+
+def _encode(text):
+    return np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype="<u4")
+
+def _decode(codes):
+    return codes.astype("<u4", copy=False).tobytes().decode("utf-32-le", "surrogatepass")
+
+def _pair_key(first, second):
+    return (first.astype(np.uint64) << np.uint64(21)) | second
+
+def _build_tables():
+    global _tables
+    if _tables is not None:
+        return _tables
+
+    if any(len(lig) != 2 for lig in ligatures):
+        raise ValueError("The vectorized translator only supports two-letter ligatures")
+
+    # Forward: digraph keys (sorted, for searchsorted) -> glyph code points.
+    items = sorted(
+        (_pair_key(np.array([ord(lig[0])], np.uint32), np.array([ord(lig[1])], np.uint32))[0], ord(glyph))
+        for lig, glyph in ligatures.items()
+    )
+    pair_keys = np.array([k for k, _ in items], dtype=np.uint64)
+    pair_glyphs = np.array([g for _, g in items], dtype=np.uint32)
+
+    # Reverse: one entry per BMP code point, mirroring the engine's
+    # per-character NFC + lowercase rule.
+    lut = np.empty(_BMP, dtype=np.uint32)
+    for cp in range(_BMP):
+        value = unicodedata.normalize('NFC', chr(cp)).lower()
+        lut[cp] = ord(value) if len(value) == 1 else _COMPLEX
+    glyph_first = np.zeros(_BMP, dtype=np.uint32)
+    glyph_second = np.zeros(_BMP, dtype=np.uint32)
+    is_glyph = np.zeros(_BMP, dtype=bool)
+    for lig, glyph in ligatures.items():
+        cp = ord(glyph)
+        is_glyph[cp] = True
+        glyph_first[cp], glyph_second[cp] = ord(lig[0]), ord(lig[1])
+        lut[cp] = glyph_first[cp]
+
+    _tables = (pair_keys, pair_glyphs, lut, is_glyph, glyph_second)
+    return _tables
+
+# -----------------------------
+# Vectorized Translation
+# -----------------------------
+def english_to_aurebesh(text):
+    _require_numpy()
+    pair_keys, pair_glyphs, _, _, _ = _build_tables()
+    codes = _encode(text.lower())
+    if codes.size < 2:
+        return _decode(codes).upper()
+
+    starts = np.flatnonzero(np.isin(_pair_key(codes[:-1], codes[1:]), pair_keys))
+    if starts.size:
+        # Overlapping candidates ("ooo") form runs of consecutive starts; the
+        # greedy scan takes the first of each run, skips one, takes the next...
+        new_run = np.ones(starts.size, dtype=bool)
+        new_run[1:] = np.diff(starts) != 1
+        run_first = np.maximum.accumulate(np.where(new_run, starts, 0))
+        taken = starts[(starts - run_first) % 2 == 0]
+
+        codes = codes.copy()
+        keys = _pair_key(codes[taken], codes[taken + 1])
+        codes[taken] = pair_glyphs[np.searchsorted(pair_keys, keys)]
+        keep = np.ones(codes.size, dtype=bool)
+        keep[taken + 1] = False
+        codes = codes[keep]
+
+    # Glyphs have no case, so upper-casing afterwards only touches letters.
+    return _decode(codes).upper()
+
+def aurebesh_to_english(text):
+    _require_numpy()
+    _, _, lut, is_glyph, glyph_second = _build_tables()
+    codes = _encode(text)
+    if codes.size == 0:
+        return ""
+    if int(codes.max()) >= _BMP:
+        return aurebesh_engine.aurebesh_to_english(text)
+
+    first = lut[codes]
+    if (first == _COMPLEX).any():
+        return aurebesh_engine.aurebesh_to_english(text)
+
+    glyphs = is_glyph[codes]
+    if not glyphs.any():
+        return _decode(first)
+
+    # Every glyph expands to its two ligature letters.
+    counts = glyphs.astype(np.intp) + 1
+    offsets = np.cumsum(counts) - counts
+    out = np.empty(int(offsets[-1] + counts[-1]), dtype=np.uint32)
+    out[offsets] = first
+    out[offsets[glyphs] + 1] = glyph_second[codes[glyphs]]
+    return _decode(out)
@@ -0,0 +1,909 @@
+import functools
+import hashlib
+import random
+import string
+import struct
+import threading
+from array import array
+
+from aurebesh_persist import atomic_write_bytes
+
+# (dx, dy) reading directions: across, down, diagonally down-right and
+# diagonally down-left.
+DIRECTIONS = ((1, 0), (0, 1), (1, 1), (-1, 1))
+# ... and the same four read backwards, for solving.
+ALL_DIRECTIONS = DIRECTIONS + tuple((-dx, -dy) for dx, dy in DIRECTIONS)
+FILL_LETTERS = string.ascii_uppercase
+# Characters a grid cell can hold; all ASCII, so a cell packs into a byte.
+GRID_CHARS = frozenset(string.ascii_uppercase + string.digits)
+
+def grid_letters(word):
+    """The part of `word` that goes in the grid: "X-Wing" -> "XWING"."""
+    return "".join(ch for ch in word.upper() if ch in GRID_CHARS)
+
+# -----------------------------
+# Occupancy Bitmasks
+# -----------------------------
+@functools.lru_cache(maxsize=None)
+def _layout(size):
+    """Every line of a size x size grid, and the lines through each cell."""
+    lines = []  # (direction, cells)
+    cell_lines = [[[] for _ in range(size)] for _ in range(size)]  # -> [(line, bit)]
+    for direction in DIRECTIONS:
+        dx, dy = direction
+        for y in range(size):
+            for x in range(size):
+                if 0 <= x - dx < size and 0 <= y - dy < size:
+                    continue  # not the start of a line
+                cells = []
+                cx, cy = x, y
+                while 0 <= cx < size and 0 <= cy < size:
+                    cell_lines[cy][cx].append((len(lines), 1 << len(cells)))
+                    cells.append((cx, cy))
+                    cx, cy = cx + dx, cy + dy
+                lines.append((direction, cells))
+    return lines, cell_lines
+
+class _Board:
+    """A partly filled grid, indexed by line.
+
+    Each line (a row, column or diagonal, in reading order) keeps an
+    occupancy bitmask and one bitmask per letter, bit i standing for the
+    line's i-th cell. That makes "where on this line can WORD go" a handful
+    of shifts and ors instead of a cell-by-cell walk.
+    """
+    def __init__(self, size):
+        self.size = size
+        self.grid = [['' for _ in range(size)] for _ in range(size)]
+        self.lines, self.cell_lines = _layout(size)
+        self.occupied = [0] * len(self.lines)
+        self.letters = [{} for _ in self.lines]
+        self.spans = [[] for _ in self.lines]  # (start, end) of words on each line
+
+    def offsets(self, line, word):
+        """Bitmask of the offsets on `line` where `word` fits.
+
+        A slot fits when every cell is empty or already holds the right
+        letter, and it neither lies inside nor swallows a word already
+        placed (crossing other words is fine).
+        """
+        length = len(self.lines[line][1])
+        slots = length - len(word) + 1
+        if slots <= 0:
+            return 0
+        all_slots = (1 << slots) - 1
+        occupied = self.occupied[line]
+        if not occupied:
+            return all_slots
+        letters = self.letters[line]
+        conflict = 0
+        for i, ch in enumerate(word):
+            conflict |= (occupied & ~letters.get(ch, 0)) >> i
+        size = len(word)
+        if size == 1:
+            # Any word through an occupied cell would contain this one.
+            conflict |= occupied
+        for start, end in self.spans[line]:
+            # Two words on different lines share at most one cell, so only
+            # words on this line can contain (or be contained by) it.
+            inside = (1 << max(end - size - start + 1, 0)) - 1 << start
+            low = max(end - size, 0)
+            around = (1 << max(start - low + 1, 0)) - 1 << low
+            conflict |= inside | around
+        return all_slots & ~conflict
+
+    def place(self, line, offset, word):
+        """Write `word` into the slot; returns its cells and what remove() needs."""
+        cells = self.lines[line][1][offset:offset + len(word)]
+        if len(word) == 1:
+            # A one-letter word lies inside any word through its cell, on
+            # whichever line, so it counts as a word on all of them.
+            span_lines = [(other, bit.bit_length() - 1) for other, bit in self.cell_lines[cells[0][1]][cells[0][0]]]
+        else:
+            span_lines = [(line, offset)]
+        for other, start in span_lines:
+            self.spans[other].append((start, start + len(word)))
+        filled = []
+        for (x, y), ch in zip(cells, word):
+            if self.grid[y][x]:
+                continue
+            self.grid[y][x] = ch
+            for other, bit in self.cell_lines[y][x]:
+                self.occupied[other] |= bit
+                masks = self.letters[other]
+                masks[ch] = masks.get(ch, 0) | bit
+            filled.append((x, y))
+        return cells, (span_lines, filled)
+
+    def remove(self, undo):
+        """Undo the last place()."""
+        span_lines, filled = undo
+        for other, _ in span_lines:
+            self.spans[other].pop()
+        for x, y in filled:
+            ch = self.grid[y][x]
+            self.grid[y][x] = ''
+            for other, bit in self.cell_lines[y][x]:
+                self.occupied[other] &= ~bit
+                self.letters[other][ch] &= ~bit
+
+# -----------------------------
+# Slot Numbering
+# -----------------------------
+# Once the grid is crowded the search tracks, for every word still to
+# place, the set of slots it could still go in as one int bitmask. Slots
+# are numbered line by line and then by offset, so a _Board.offsets() mask
+# shifted left by the line's base is that line's part of the set.
+@functools.lru_cache(maxsize=None)
+def _word_lines(size, length):
+    """Lines a word of `length` letters can go on, and the base of each
+    line's slot numbers (indexed by line)."""
+    lines = _layout(size)[0]
+    usable, base, count = [], [], 0
+    for line, (direction, cells) in enumerate(lines):
+        base.append(count)
+        # One-letter words only use rows: on any other line the same cell
+        # would just be a second copy of the same slot.
+        if len(cells) >= length and (length > 1 or direction == DIRECTIONS[0]):
+            usable.append(line)
+            count += len(cells) - length + 1
+    return usable, base
+
+@functools.lru_cache(maxsize=64)
+def _slot_cover(size, length):
+    """slots[n] = (line, offset) of slot n, and cover[y][x] = bitmask of
+    the slots that use cell (x, y)."""
+    lines, cell_lines = _layout(size)
+    usable, base = _word_lines(size, length)
+    slots = [(line, offset) for line in usable for offset in range(len(lines[line][1]) - length + 1)]
+    usable = set(usable)
+    cover = [[0] * size for _ in range(size)]
+    for y in range(size):
+        for x in range(size):
+            mask = 0
+            for line, bit in cell_lines[y][x]:
+                if line not in usable:
+                    continue
+                pos = bit.bit_length() - 1
+                low = max(pos - length + 1, 0)
+                high = min(pos, len(lines[line][1]) - length)
+                mask |= (1 << high - low + 1) - 1 << base[line] + low
+            cover[y][x] = mask
+    return slots, cover
+
+def _bits(mask):
+    out = []
+    while mask:
+        low = mask & -mask
+        out.append(low.bit_length() - 1)
+        mask ^= low
+    return out
+
+# -----------------------------
+# Backtracking Search
+# -----------------------------
+RESTART_BUDGET = 64  # dead ends allowed in the first attempt
+MAX_RESTART_BUDGET = 64 * 2 ** 8  # budgeted attempts stop doubling here
+
+class _OutOfBudget(Exception):
+    pass
+
+class _Search:
+    """One backtracking attempt at placing every word on `board`.
+
+    Words go in longest first, each in a random slot that fits, which
+    almost always works straight away. From the first dead end on, the
+    search switches to forward checking: it keeps the slots each unplaced
+    word could still take, removes the ones every placement rules out,
+    always places the word with the fewest left next and backs out as
+    soon as any word has none.
+    """
+    def __init__(self, board, entries, rng, budget, matches):
+        self.board = board
+        self.entries = entries
+        self.rng = rng
+        self.budget = budget  # dead ends left; None for no limit
+        self.matches = matches  # shared cache, see match()
+        self.placed = [None] * len(entries)
+        self.taken = {}  # word -> slots its copies are in
+        self.tight = False  # set at the first dead end
+
+    def candidates(self, word):
+        # Lines in random order, then the fitting offsets on each one. The
+        # shuffle is done as we go, since the first few lines usually do.
+        board, rng = self.board, self.rng
+        lines = list(_word_lines(board.size, len(word))[0])
+        for k in range(len(lines)):
+            j = rng.randrange(k, len(lines))
+            lines[k], lines[j] = lines[j], lines[k]
+            line = lines[k]
+            mask = board.offsets(line, word)
+            if not mask:
+                continue
+            offsets = [i for i in range(mask.bit_length()) if mask >> i & 1]
+            rng.shuffle(offsets)
+            for offset in offsets:
+                yield line, offset
+
+    def solve(self, remaining, domains=None):
+        if not remaining:
+            return True
+        if self.tight:
+            return self.solve_tight(remaining, domains)
+        i, rest = remaining[0], remaining[1:]
+        word = self.entries[i]
+        # Identical words are interchangeable, so they are placed in slot
+        # order and each set of slots is only tried once.
+        used = self.taken.setdefault(word, [])
+        for slot in self.candidates(word):
+            if used and slot <= used[-1]:
+                continue
+            if self.try_slot(i, slot, rest):
+                return True
+        self.tight = True
+        return self.dead_end()
+
+    def try_slot(self, i, slot, rest, domains=None):
+        word = self.entries[i]
+        cells, undo = self.board.place(slot[0], slot[1], word)
+        self.placed[i] = (word, cells)
+        used = self.taken[word]
+        used.append(slot)
+        if self.solve(rest, domains):
+            return True
+        used.pop()
+        self.board.remove(undo)
+        return False
+
+    def solve_tight(self, remaining, domains):
+        if domains is None:
+            # Just switched, or backed out to a word placed before the
+            # switch: work the sets out from the board.
+            domains = {i: self.domain(self.entries[i]) for i in remaining}
+        best = None
+        for i in remaining:
+            mask = self.allowed(i, domains[i])
+            count = bin(mask).count("1")
+            if best is None or count < best[0]:
+                best = (count, i, mask)
+                if not count:
+                    return self.dead_end()
+        _, i, mask = best
+        word = self.entries[i]
+        rest = [j for j in remaining if j != i]
+        slots = _slot_cover(self.board.size, len(word))[0]
+        order = _bits(mask)
+        self.rng.shuffle(order)
+        full = (1 << len(word)) - 1
+        occupied = self.board.occupied
+        order.sort(key=lambda n: -bin(occupied[slots[n][0]] >> slots[n][1] & full).count("1"))
+        for n in order:
+            line, offset = slots[n]
+            child = {}
+            for j in rest:
+                left = self.prune(word, line, offset, self.entries[j], domains[j])
+                if not left:
+                    break
+                child[j] = left
+            else:
+                self.taken.setdefault(word, [])
+                if self.try_slot(i, (line, offset), rest, child):
+                    return True
+                continue
+            self.dead_end()
+        return self.dead_end()
+
+    def allowed(self, i, mask):
+        # Slots of word i that are still open, after the symmetry rule for
+        # identical words.
+        word = self.entries[i]
+        used = self.taken.get(word)
+        if used:
+            line, offset = used[-1]
+            floor = _word_lines(self.board.size, len(word))[1][line] + offset + 1
+            mask = mask >> floor << floor
+        return mask
+
+    def domain(self, word):
+        board = self.board
+        usable, base = _word_lines(board.size, len(word))
+        mask = 0
+        for line in usable:
+            mask |= board.offsets(line, word) << base[line]
+        return mask
+
+    def match(self, word, x, y, ch):
+        """Bitmask of the slots that put `ch` at (x, y) for `word`."""
+        key = (word, x, y, ch)
+        mask = self.matches.get(key)
+        if mask is None:
+            lines, cell_lines = _layout(self.board.size)
+            usable, base = _word_lines(self.board.size, len(word))
+            mask = 0
+            for line, bit in cell_lines[y][x]:
+                pos = bit.bit_length() - 1
+                last = len(lines[line][1]) - len(word)
+                for k, letter in enumerate(word):
+                    if letter == ch and 0 <= pos - k <= last:
+                        mask |= 1 << base[line] + pos - k
+            self.matches[key] = mask
+        return mask
+
+    def prune(self, word, line, offset, other, mask):
+        """`mask` (slots of `other`) less the ones that clash with `word`
+        placed at (line, offset): a different letter on a shared cell, or
+        one word lying inside the other."""
+        size = self.board.size
+        cells = self.board.lines[line][1][offset:offset + len(word)]
+        cover = _slot_cover(size, len(other))[1]
+        single = len(word) == 1 or len(other) == 1
+        clash = 0
+        for (x, y), ch in zip(cells, word):
+            through = cover[y][x] & mask
+            if not through:
+                continue
+            if single:
+                clash |= through
+            else:
+                clash |= through & ~self.match(other, x, y, ch)
+        if not single:
+            # Slots on the same line that are nested in or around this one.
+            length = len(self.board.lines[line][1])
+            low = max(min(offset, offset + len(word) - len(other)), 0)
+            high = min(max(offset, offset + len(word) - len(other)), length - len(other))
+            if low <= high:
+                clash |= (1 << high - low + 1) - 1 << _word_lines(size, len(other))[1][line] + low
+        return mask & ~clash
+
+    def dead_end(self):
+        if self.budget is not None:
+            self.budget -= 1
+            if self.budget < 0:
+                raise _OutOfBudget()
+        return False
+
+# -----------------------------
+# Word Search Generation
+# -----------------------------
+def generate_word_search(words, size, rng=random, avoid=None):
+    """Hide `words` in a size x size grid of letters.
+
+    Returns a Puzzle, i.e. (grid, placed): grid is a list of rows of single
+    characters and placed holds (word, [(x, y), ...]) for each word, in the
+    order given. Its AnswerKey is built here too, as `puzzle.answers`.
+    Words are placed longest first and the search backtracks, so it only
+    raises ValueError when no arrangement exists at all. On a grid packed
+    nearly full that can take a while to prove; see _Search.
+
+    `avoid` is an optional WordTrie; the random fill is re-rolled until
+    none of its words runs through a filled-in cell.
+    """
+    entries = []
+    for word in words:
+        letters = grid_letters(word)
+        if not letters:
+            raise ValueError(f"Nothing to place in {word!r}")
+        if len(letters) > size:
+            raise ValueError(f"Couldn’t place word {letters}")
+        entries.append(letters)
+
+    order = sorted(range(len(entries)), key=lambda i: -len(entries[i]))
+    # Random searches on crowded grids occasionally wander into a huge dead
+    # subtree, so each attempt gets a budget of dead ends and the search
+    # restarts with a bigger one when it runs out. Once the budget passes
+    # MAX_RESTART_BUDGET the attempt runs to the end, so a layout is always
+    # found when one exists; an attempt that finishes has either found one
+    # or tried everything.
+    budget = RESTART_BUDGET
+    matches = {}
+    while True:
+        search = _Search(_Board(size), entries, rng, budget, matches)
+        try:
+            found = search.solve(order)
+            break
+        except _OutOfBudget:
+            budget = budget * 2 if budget < MAX_RESTART_BUDGET else None
+    if not found:
+        raise ValueError("Couldn’t place words " + ", ".join(entries))
+    board, placed = search.board, search.placed
+
+    grid = board.grid
+    fill = [(x, y) for y, row in enumerate(grid) for x, ch in enumerate(row) if not ch]
+    for x, y in fill:
+        grid[y][x] = rng.choice(FILL_LETTERS)
+    if avoid is not None:
+        _clear_extra_words(grid, fill, avoid, rng)
+    return Puzzle(grid, placed)
+
+class FillError(ValueError):
+    """The words were placed but the fill kept spelling `avoid` words.
+
+    Unlike a placement failure this depends on the random fill, so another
+    seed will usually work."""
+
+def generate_seeded(words, size, seed, avoid=None):
+    """The same puzzle every time for the same words, size and seed."""
+    return generate_word_search(words, size, random.Random(seed), avoid)
+
+MAX_REFILLS = 50
+
+def _clear_extra_words(grid, fill, avoid, rng):
+    # Only fill letters are re-rolled: a word made up entirely of placed
+    # letters can't be removed without moving the words themselves.
+    fill = set(fill)
+    for _ in range(MAX_REFILLS):
+        extra = {cell for _, cells in find_words(grid, avoid) for cell in cells if cell in fill}
+        if not extra:
+            return
+        for x, y in extra:
+            grid[y][x] = rng.choice(FILL_LETTERS)
+    raise FillError("Couldn’t fill the grid without extra words")
+
+# -----------------------------
+# Word Search Solver
+# -----------------------------
+class WordTrie:
+    """Dictionary words (as grid_letters) in a trie of nested dicts.
+
+    Each node maps a letter to the next node; a word ends where its node
+    has a None key, holding the word. Words shorter than `min_length`
+    letters are left out, so common short words don't swamp the results.
+    """
+    def __init__(self, words=(), min_length=1):
+        self.root = {}
+        self.min_length = min_length
+        self.count = 0
+        for word in words:
+            self.add(word)
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, word):
+        node = self.root
+        for ch in grid_letters(word):
+            node = node.get(ch)
+            if node is None:
+                return False
+        return None in node
+
+    def add(self, word):
+        letters = grid_letters(word)
+        if len(letters) < max(self.min_length, 1):
+            return
+        node = self.root
+        for ch in letters:
+            child = node.get(ch)
+            if child is None:
+                child = node[ch] = {}
+            node = child
+        if None not in node:
+            node[None] = letters
+            self.count += 1
+
+    def __iter__(self):
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            for ch, child in node.items():
+                if ch is None:
+                    yield child
+                else:
+                    stack.append(child)
+
+    def fingerprint(self):
+        """A short digest of the words, the same whatever order they came in."""
+        text = "\n".join(sorted(self)) + f"\n{self.min_length}"
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+def find_words(grid, trie):
+    """Every occurrence of a `trie` word in `grid`, in all eight directions.
+
+    Returns (word, [(x, y), ...]) pairs like generate_word_search's placed.
+    Each run from a start cell follows the trie and stops as soon as no
+    word continues with the next letter, so a large dictionary costs
+    little more than a small one. A palindrome, which reads the same both
+    ways along its cells, is reported once.
+    """
+    height = len(grid)
+    width = len(grid[0]) if height else 0
+    root = trie.root
+    found = []
+    for y, row in enumerate(grid):
+        for x, ch in enumerate(row):
+            start = root.get(ch)
+            if start is None:
+                continue
+            word = start.get(None)
+            if word is not None:
+                found.append((word, [(x, y)]))
+            for d, (dx, dy) in enumerate(ALL_DIRECTIONS):
+                node, cx, cy = start, x + dx, y + dy
+                while 0 <= cx < width and 0 <= cy < height:
+                    node = node.get(grid[cy][cx])
+                    if node is None:
+                        break
+                    word = node.get(None)
+                    if word is not None and (d < len(DIRECTIONS) or word != word[::-1]):
+                        found.append((word, [(x + dx * i, y + dy * i) for i in range(len(word))]))
+                    cx += dx
+                    cy += dy
+    return found
+
+# -----------------------------
+# Answer Checking
+# -----------------------------
+class AnswerKey:
+    """Which placed word runs between two tapped cells, and which are found.
+
+    Words are indexed by their unordered pair of end cells up front, so a
+    pair of taps is checked with one dict lookup whichever end came first.
+    Found words are tracked here as well, so the words still to find and
+    whether the puzzle is done never need a rescan of `placed`.
+    """
+    def __init__(self, placed):
+        self.placed = placed
+        self._ends = {}  # sorted (first cell, last cell) -> [word index]
+        for i, (_, cells) in enumerate(placed):
+            self._ends.setdefault(self._pair(cells[0], cells[-1]), []).append(i)
+        self._remaining = dict.fromkeys(range(len(placed)))  # ordered set
+        self.found = []  # word indexes, in the order they were found
+
+    @staticmethod
+    def _pair(a, b):
+        return (a, b) if a <= b else (b, a)
+
+    def match(self, a, b):
+        """Index of the word with ends at cells a and b, or None.
+
+        A word not found yet wins over one already found on the same ends.
+        """
+        matches = self._ends.get(self._pair(a, b))
+        if not matches:
+            return None
+        for i in matches:
+            if i in self._remaining:
+                return i
+        return matches[0]
+
+    def mark_found(self, i):
+        """Record word i as found; False if it already was."""
+        if i not in self._remaining:
+            return False
+        del self._remaining[i]
+        self.found.append(i)
+        return True
+
+    def remaining(self):
+        """Indexes of the words still to find, in puzzle order."""
+        return list(self._remaining)
+
+    @property
+    def complete(self):
+        return not self._remaining
+
+class Puzzle(tuple):
+    """A (grid, placed) pair that carries its AnswerKey as `answers`.
+
+    It unpacks and compares like the plain pair, so code that only wants
+    the grid and the words needn't know about the key.
+    """
+    def __new__(cls, grid, placed):
+        puzzle = super().__new__(cls, (grid, placed))
+        puzzle.answers = AnswerKey(placed)
+        return puzzle
+
+    @property
+    def grid(self):
+        return self[0]
+
+    @property
+    def placed(self):
+        return self[1]
+
+# -----------------------------
+# Packed Puzzle Format
+# -----------------------------
+# A packed puzzle is a header, then one byte per cell (row by row), then
+# four bytes per word: start x, start y, index into DIRECTIONS, length.
+# The words' letters are read back off the grid, so they aren't stored.
+# Version 1 stored the seed in 32 bits; it is still read.
+PACK_VERSION = 2
+PUZZLE_HEADERS = {
+    1: struct.Struct("<BBHI"),  # version, grid size, word count, seed
+    2: struct.Struct("<BBHQ"),
+}
+PUZZLE_HEADER = PUZZLE_HEADERS[PACK_VERSION]
+MAX_SEED = 2 ** 64 - 1
+WORD_PATH = struct.Struct("<BBBB")
+
+def pack_puzzle(seed, grid, placed):
+    if not 0 <= seed <= MAX_SEED:
+        raise ValueError(f"seed must be between 0 and {MAX_SEED}")
+    size = len(grid)
+    out = bytearray(PUZZLE_HEADER.pack(PACK_VERSION, size, len(placed), seed))
+    out += "".join("".join(row) for row in grid).encode("ascii")
+    for _, cells in placed:
+        x, y = cells[0]
+        direction = DIRECTIONS.index((cells[1][0] - x, cells[1][1] - y)) if len(cells) > 1 else 0
+        out += WORD_PATH.pack(x, y, direction, len(cells))
+    return bytes(out)
+
+def _unpack_header(data, offset=0):
+    # (header struct, (version, size, count, seed)) for any known version.
+    if offset >= len(data):
+        raise ValueError("truncated puzzle header")
+    header = PUZZLE_HEADERS.get(data[offset])
+    if header is None:
+        raise ValueError(f"unknown puzzle format {data[offset]}")
+    try:
+        return header, header.unpack_from(data, offset)
+    except struct.error:
+        raise ValueError("truncated puzzle header")
+
+def packed_length(data, offset=0):
+    """Length of the packed puzzle starting at `offset` in `data`."""
+    header, (_, size, count, _) = _unpack_header(data, offset)
+    return header.size + size * size + count * WORD_PATH.size
+
+def unpack_puzzle(data):
+    """(seed, grid, placed) from pack_puzzle() output (bytes or memoryview)."""
+    length = packed_length(data)
+    if len(data) < length:
+        raise ValueError("truncated puzzle")
+    header, (_, size, count, seed) = _unpack_header(data)
+    start = header.size
+    cells_text = bytes(data[start:start + size * size]).decode("ascii")
+    grid = [list(cells_text[y * size:(y + 1) * size]) for y in range(size)]
+    placed = []
+    for x, y, direction, word_len in WORD_PATH.iter_unpack(data[start + size * size:length]):
+        if direction >= len(DIRECTIONS):
+            raise ValueError(f"unknown direction {direction}")
+        dx, dy = DIRECTIONS[direction]
+        end_x, end_y = x + dx * (word_len - 1), y + dy * (word_len - 1)
+        if not (word_len and 0 <= x < size and 0 <= y < size and 0 <= end_x < size and 0 <= end_y < size):
+            raise ValueError("word runs off the grid")
+        cells = [(x + dx * i, y + dy * i) for i in range(word_len)]
+        placed.append(("".join(grid[cy][cx] for cx, cy in cells), cells))
+    return seed, grid, placed
+
+class PuzzleBook:
+    """Packed puzzles stored back to back in one buffer.
+
+    Only an offset table is built on load; puzzles are handed out as
+    memoryview slices of the buffer and unpacked when asked for, so a book
+    of tens of thousands costs little more than its bytes.
+    """
+    def __init__(self, data=b""):
+        self._view = memoryview(data)
+        self._offsets = array("I")
+        offset = 0
+        while offset < len(self._view):
+            self._offsets.append(offset)
+            offset += packed_length(self._view, offset)
+        if offset != len(self._view):
+            raise ValueError("truncated puzzle book")
+        self._offsets.append(offset)
+
+    @classmethod
+    def from_packed(cls, records):
+        return cls(b"".join(records))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    def save(self, path):
+        atomic_write_bytes(path, self._view)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        if not -len(self) <= i < len(self):
+            raise IndexError(i)
+        i %= len(self)
+        return self._view[self._offsets[i]:self._offsets[i + 1]]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def puzzle(self, i):
+        return unpack_puzzle(self[i])
+
+# -----------------------------
+# Puzzle Cache and Pre-Generation Pool
+# -----------------------------
+# The cache file is CACHE_MAGIC followed by one section per spec: the key
+# length, the length of its puzzles, the key (UTF-8) and then a PuzzleBook.
+CACHE_MAGIC = b"AWSC\x01"
+CACHE_SECTION = struct.Struct("<HI")
+FILL_RETRIES = 10  # seeds tried per puzzle when the fill keeps spelling words
+FILL_RETRY_DELAY = 1.0  # seconds the pool waits before another round of seeds
+
+def spec_key(words, size, avoid_key=""):
+    # avoid_key (WordTrie.fingerprint()) keeps puzzles made against another
+    # vocabulary, or none, from being handed out.
+    key = f"{size}:" + ",".join(w.upper() for w in words)
+    return f"{key}|{avoid_key}" if avoid_key else key
+
+def decode_puzzle(packed, words, size):
+    """A Puzzle from its packed form, checking it is a puzzle for `words`
+    at `size`; raises ValueError if it isn't."""
+    _, grid, placed = unpack_puzzle(packed)
+    if len(grid) != size or [w for w, _ in placed] != [grid_letters(w) for w in words]:
+        raise ValueError("puzzle does not match its parameters")
+    return Puzzle(grid, placed)
+
+class PuzzlePool:
+    """A stock of ready-made puzzles for each configured (words, size).
+
+    A background thread keeps every spec topped up to `depth` puzzles and
+    the stock is kept in a packed binary file (keyed by parameters, each
+    puzzle with its seed), so it survives restarts. take() hands out a
+    stored puzzle and only generates one on the spot if the stock is empty.
+    New puzzles keep the words of the `avoid` WordTrie out of their fill,
+    and stock made against a different vocabulary is never handed out.
+    """
+    def __init__(self, path, specs=(), depth=2, persister=None, avoid=None):
+        self.path = path
+        self.depth = depth
+        self.persister = persister
+        self.avoid = avoid
+        self._avoid_key = avoid.fingerprint() if avoid is not None else ""
+        self._specs = {}  # key -> (words, size)
+        self._stock = self._load()  # key -> [packed puzzle]
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._seeds = random.Random()
+        self._thread = None
+        self._closed = False
+        self.hits = 0
+        self.misses = 0
+        for words, size in specs:
+            self.add_spec(words, size)
+
+    def add_spec(self, words, size):
+        key = spec_key(words, size, self._avoid_key)
+        with self._cond:
+            self._specs[key] = (list(words), size)
+            self._cond.notify()
+        return key
+
+    def start(self):
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="word-search-pool", daemon=True)
+                self._thread.start()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+
+    def ready(self, words, size):
+        with self._cond:
+            return len(self._stock.get(spec_key(words, size, self._avoid_key), []))
+
+    def take(self, words, size):
+        """A fresh Puzzle."""
+        key = spec_key(words, size, self._avoid_key)
+        with self._cond:
+            stock = self._stock.get(key)
+            entry = stock.pop(0) if stock else None
+            self._cond.notify()
+        if entry is not None:
+            self._save()
+            try:
+                puzzle = decode_puzzle(entry, words, size)
+                self.hits += 1
+                return puzzle
+            except ValueError as e:
+                print("Skipping bad cached puzzle:", e)
+        self.misses += 1
+        return self._generate(words, size)[1]
+
+    # -- Internals ------------------------------------------------------
+    def _new_seed(self):
+        with self._cond:
+            return self._seeds.getrandbits(32)
+
+    def _generate(self, words, size):
+        # (seed, puzzle). A fill that keeps spelling vocabulary words
+        # is down to the seed, so a few more are tried before giving up; a
+        # placement failure is final.
+        for attempt in range(FILL_RETRIES):
+            seed = self._new_seed()
+            try:
+                return seed, generate_seeded(words, size, seed, self.avoid)
+            except FillError:
+                if attempt == FILL_RETRIES - 1:
+                    raise
+
+    def _wanted(self):
+        for key, spec in self._specs.items():
+            if len(self._stock.get(key, [])) < self.depth:
+                return key, spec
+        return None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed and self._wanted() is None:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                key, (words, size) = self._wanted()
+            try:
+                seed, puzzle = self._generate(words, size)
+                entry = pack_puzzle(seed, *puzzle)
+            except FillError as e:
+                # Not the spec's fault: try again with new seeds, but give
+                # take() and close() some room in between.
+                print("Error filling word search:", e)
+                with self._cond:
+                    self._cond.wait(FILL_RETRY_DELAY)
+                continue
+            except ValueError as e:
+                print("Error generating word search:", e)
+                with self._cond:
+                    self._specs.pop(key, None)  # it will never fit
+                continue
+            with self._cond:
+                self._stock.setdefault(key, []).append(entry)
+            self._save()
+
+    def _load(self):
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print("No puzzle cache found:", e)
+            return {}
+        if not data.startswith(CACHE_MAGIC):
+            print("Ignoring puzzle cache in an unknown format")
+            return {}
+        # The stock holds slices of `data`; nothing is copied or unpacked.
+        view = memoryview(data)
+        stock = {}
+        offset = len(CACHE_MAGIC)
+        try:
+            while offset < len(view):
+                key_len, book_len = CACHE_SECTION.unpack_from(view, offset)
+                offset += CACHE_SECTION.size
+                key = bytes(view[offset:offset + key_len]).decode("utf-8")
+                offset += key_len
+                stock[key] = list(PuzzleBook(view[offset:offset + book_len]))
+                offset += book_len
+        except (struct.error, ValueError) as e:
+            print("Puzzle cache is damaged:", e)
+        return stock
+
+    def _save(self):
+        if self.persister is None:
+            self._write()
+        else:
+            self.persister.schedule(self.path, self._write)
+
+    def _write(self):
+        # Without a persister take() and the pool thread both write; the
+        # lock keeps an older copy of the stock from landing last.
+        with self._write_lock:
+            parts = [CACHE_MAGIC]
+            with self._cond:
+                for key, stock in self._stock.items():
+                    if not stock or key not in self._specs:
+                        continue
+                    key = key.encode("utf-8")
+                    body = b"".join(stock)
+                    parts += [CACHE_SECTION.pack(len(key), len(body)), key, body]
+            try:
+                atomic_write_bytes(self.path, b"".join(parts))
+            except Exception as e:
+                print("Error saving puzzle cache:", e)
@@ -0,0 +1,50 @@
+import random
+import threading
+
+import pytest
+
+import aurebesh_batch
+from aurebesh_batch import shutdown_pool, translate_many
+from aurebesh_engine import get_translator
+
+@pytest.fixture(autouse=True)
+def stop_pool():
+    yield
+    shutdown_pool()
+
+def random_texts(seed, count):
+    rng = random.Random(seed)
+    return ["".join(rng.choice("the shadow oo ng ") for _ in range(rng.randint(0, 30)))
+            for _ in range(count)]
+
+def test_pool_matches_serial_in_order():
+    texts = random_texts(1, 500)
+    for direction in ("to_aurebesh", "to_english"):
+        translate = get_translator(direction)
+        pooled = translate_many(texts, direction, workers=2, chunk_size=7, threshold=0)
+        assert pooled == [translate(t) for t in texts]
+
+def test_small_batches_skip_the_pool():
+    texts = random_texts(2, 10)
+    assert translate_many(texts, workers=4) == [get_translator("to_aurebesh")(t) for t in texts]
+    assert aurebesh_batch._pool is None
+
+def test_threads_share_and_replace_the_pool():
+    texts = random_texts(3, 200)
+    expected = [get_translator("to_aurebesh")(t) for t in texts]
+    results, errors = [], []
+
+    def run(workers):
+        try:
+            results.append(translate_many(texts, workers=workers, chunk_size=5, threshold=0))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(2 + i % 2,)) for i in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    assert results == [expected] * len(threads)
+    assert aurebesh_batch._pool_users == 0
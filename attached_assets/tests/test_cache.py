@@ -0,0 +1,71 @@
+import sys
+import threading
+
+import pytest
+
+from aurebesh_cache import TranslationCache
+from aurebesh_engine import get_translator
+
+def test_hits_misses_and_lru_order():
+    cache = TranslationCache(maxsize=2)
+    cache.translate("a")
+    cache.translate("b")
+    cache.translate("a")        # "a" becomes most recent
+    cache.translate("c")        # evicts "b"
+    cache.translate("a")
+    cache.translate("b")
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 4, 2)
+    assert stats["entries"] == 2
+    assert stats["hit_rate"] == pytest.approx(2 / 6)
+
+def test_directions_are_cached_separately():
+    cache = TranslationCache()
+    word = "shadow"
+    assert cache.translate(word, "to_aurebesh") == get_translator("to_aurebesh")(word)
+    assert cache.translate(word, "to_english") == get_translator("to_english")(word)
+    assert cache.stats()["misses"] == 2
+
+def test_byte_limit():
+    text = "x" * 1000
+    cost = sys.getsizeof(text) + sys.getsizeof(get_translator("to_aurebesh")(text))
+    cache = TranslationCache(maxbytes=cost * 2 + 100)
+    for i in range(5):
+        cache.translate(text + str(i))
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["bytes"] <= cache.maxbytes
+    # An entry bigger than the whole budget is translated but never stored.
+    small = TranslationCache(maxbytes=cost - 1)
+    assert small.translate(text) == get_translator("to_aurebesh")(text)
+    assert small.stats()["entries"] == 0
+
+def test_clear_and_limits():
+    cache = TranslationCache()
+    cache.translate("a")
+    cache.clear()
+    assert cache.stats() == {"entries": 0, "bytes": 0, "hits": 0, "misses": 0,
+                             "evictions": 0, "hit_rate": 0.0}
+    with pytest.raises(ValueError):
+        TranslationCache(maxsize=0)
+
+def test_threads_agree_with_translator():
+    cache = TranslationCache(maxsize=8)
+    words = [f"word {i}" for i in range(20)]
+    expected = [get_translator("to_aurebesh")(w) for w in words]
+    errors = []
+
+    def run():
+        for _ in range(50):
+            if [cache.translate(w) for w in words] != expected:
+                errors.append("mismatch")
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    stats = cache.stats()
+    assert not errors
+    assert stats["entries"] <= 8
+    assert stats["hits"] + stats["misses"] == 4 * 50 * len(words)
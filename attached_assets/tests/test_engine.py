@@ -0,0 +1,105 @@
+import random
+import unicodedata
+
+from aurebesh_engine import (
+    EditMirror, aurebesh_to_english, english_to_aurebesh, get_translator, ligatures
+)
+
+# -----------------------------
+# The Original Translation Loops
+# -----------------------------
+# The character-by-character versions the table-driven engine replaced;
+# both must keep giving the same output.
+def old_english_to_aurebesh(text):
+    text = text.lower()
+    result = ""
+    i = 0
+    while i < len(text):
+        if i < len(text) - 1 and text[i:i + 2] in ligatures:
+            result += ligatures[text[i:i + 2]]
+            i += 2
+        else:
+            result += text[i].upper()
+            i += 1
+    return result
+
+def old_aurebesh_to_english(text):
+    result = ""
+    for char in text:
+        norm_char = unicodedata.normalize('NFC', char)
+        for lig, glyph in ligatures.items():
+            if ord(norm_char) == ord(glyph):
+                result += lig
+                break
+        else:
+            result += norm_char.lower()
+    return result
+
+ALPHABET = ("abcdeghknostCHSTOEAGK \n.,!'0" + "".join(ligatures.values())
+            # sigmas, sharp s, dotted I, composed and decomposed accents
+            + "\u03a3\u03c3\u00df\u0130\u00e9e\u0301\u212b\u00c5")
+
+def random_texts(seed, count=500):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 40)))
+
+# -----------------------------
+# Equivalence
+# -----------------------------
+def test_to_aurebesh_matches_original_loop():
+    for text in random_texts(1):
+        assert english_to_aurebesh(text) == old_english_to_aurebesh(text), repr(text)
+
+def test_to_english_matches_original_loop():
+    for text in random_texts(2):
+        assert aurebesh_to_english(text) == old_aurebesh_to_english(text), repr(text)
+
+def test_ligatures_round_trip():
+    for lig, glyph in ligatures.items():
+        assert english_to_aurebesh(lig) == glyph
+        assert english_to_aurebesh(lig.upper()) == glyph
+        assert aurebesh_to_english(glyph) == lig
+    assert english_to_aurebesh("Thee shoots") == "\ue018EE \ue016\ue015TS"
+
+# -----------------------------
+# Mirrored Edits
+# -----------------------------
+def random_edit(rng, text):
+    # (new text, cursor) the way TextInput reports them: the cursor may be
+    # before or after the edit, and a same-length replacement gives none.
+    pos = rng.randrange(len(text) + 1)
+    roll = rng.random()
+    if roll < 0.5:
+        typed = "".join(rng.choice(ALPHABET) for _ in range(rng.choice((1, 1, 2, 60))))
+        return text[:pos] + typed + text[pos:], rng.choice((pos, pos + len(typed), None))
+    if roll < 0.9:
+        end = min(len(text), pos + rng.choice((1, 1, 4, 60)))
+        return text[:pos] + text[end:], rng.choice((pos, end, None))
+    end = min(len(text), pos + rng.randrange(6))
+    typed = "".join(rng.choice(ALPHABET) for _ in range(rng.randrange(6)))
+    return text[:pos] + typed + text[end:], None
+
+def test_mirrored_edits_match_full_translation():
+    rng = random.Random(3)
+    for direction in ("to_aurebesh", "to_english"):
+        translate = get_translator(direction)
+        for _ in range(20):
+            text = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 300)))
+            mirror = EditMirror(direction)
+            out = mirror.reset(text)
+            for _ in range(100):
+                text, cursor = random_edit(rng, text)
+                start, end, patch = mirror.edit(text, cursor)
+                out = out[:start] + patch + out[end:]
+                assert out == translate(text), (direction, text)
+                assert mirror.dst_len == len(out)
+
+def test_misleading_cursor_still_finds_the_edit():
+    # TextInput can report a cursor far from an edit made on another line.
+    text = "the shadow of the empire " * 40
+    mirror = EditMirror("to_aurebesh")
+    out = mirror.reset(text)
+    edited = text[:10] + text[40:]
+    start, end, patch = mirror.edit(edited, len(text) // 2)
+    assert out[:start] + patch + out[end:] == english_to_aurebesh(edited)
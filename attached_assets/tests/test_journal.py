@@ -0,0 +1,128 @@
+import json
+import random
+
+import aurebesh_journal
+from aurebesh_journal import HistoryJournal
+
+def entries(journal):
+    return [dict(entry) for entry in journal]
+
+# -----------------------------
+# Replay
+# -----------------------------
+def test_random_changes_replay_after_reopening(tmp_path):
+    rng = random.Random(5)
+    for trial in range(40):
+        snapshot = str(tmp_path / f"history{trial}.json")
+        journal = HistoryJournal(snapshot, compact_min=rng.randint(1, 10))
+        model = {}
+        for _ in range(rng.randint(0, 60)):
+            roll = rng.random()
+            if roll < 0.5 or not model:
+                entry = journal.append(f"phrase {rng.random()}", "x")
+                model[entry["id"]] = dict(entry)
+            elif roll < 0.75:
+                entry_id, favorite = rng.choice(list(model)), rng.random() < 0.5
+                journal.set_favorite(entry_id, favorite)
+                model[entry_id]["favorite"] = favorite
+            else:
+                entry_id = rng.choice(list(model))
+                journal.delete(entry_id)
+                del model[entry_id]
+            if rng.random() < 0.1:
+                journal.close()
+                journal = HistoryJournal(snapshot, compact_min=rng.randint(1, 10))
+        assert entries(journal) == list(model.values())
+        journal.close()
+        assert entries(HistoryJournal(snapshot)) == list(model.values())
+
+def test_records_replayed_twice_are_harmless(tmp_path):
+    # A crash after the snapshot is written but before the log is emptied
+    # leaves records that are already in the snapshot.
+    snapshot = str(tmp_path / "history.json")
+    journal = HistoryJournal(snapshot)
+    first = journal.append("one", "x")
+    second = journal.append("two", "y")
+    journal.set_favorite(first["id"], True)
+    journal.delete(second["id"])
+    journal.close()
+    with open(snapshot, "w", encoding="utf-8") as f:
+        json.dump(entries(journal), f)
+    reopened = HistoryJournal(snapshot)
+    assert entries(reopened) == entries(journal)
+    assert reopened.append("three", "z")["id"] == second["id"] + 1
+
+# -----------------------------
+# Damaged and Old Files
+# -----------------------------
+def test_torn_last_line_is_dropped(tmp_path):
+    snapshot = str(tmp_path / "history.json")
+    journal = HistoryJournal(snapshot)
+    journal.append("kept", "x")
+    journal.close()
+    with open(journal.log_path, "a", encoding="utf-8") as f:
+        f.write('{"op":"add","ent')
+    reopened = HistoryJournal(snapshot)
+    assert [e["english"] for e in reopened] == ["kept"]
+    reopened.append("after", "y")
+    reopened.close()
+    assert [e["english"] for e in HistoryJournal(snapshot)] == ["kept", "after"]
+
+def test_bad_record_is_skipped(tmp_path):
+    snapshot = str(tmp_path / "history.json")
+    journal = HistoryJournal(snapshot)
+    journal.append("one", "x")
+    journal.close()
+    with open(journal.log_path, "a", encoding="utf-8") as f:
+        f.write('{"op":"zap"}\nnot json\n')
+    journal = HistoryJournal(snapshot)
+    journal.append("two", "y")
+    assert [e["english"] for e in journal] == ["one", "two"]
+    journal.close()
+
+def test_snapshot_without_ids_is_migrated(tmp_path):
+    snapshot = str(tmp_path / "history.json")
+    old = [{"english": f"old {i}", "aurebesh": "", "favorite": i == 1, "timestamp": "t"}
+           for i in range(3)]
+    with open(snapshot, "w", encoding="utf-8") as f:
+        json.dump(old, f)
+    journal = HistoryJournal(snapshot)
+    assert [e["id"] for e in journal] == [0, 1, 2]
+    assert journal.get(1)["favorite"]
+    journal.close()
+    with open(snapshot, encoding="utf-8") as f:
+        assert [e["id"] for e in json.load(f)] == [0, 1, 2]
+
+# -----------------------------
+# Failed Writes
+# -----------------------------
+def test_failed_snapshot_write_keeps_records(tmp_path, monkeypatch):
+    snapshot = str(tmp_path / "history.json")
+    journal = HistoryJournal(snapshot, compact_min=3)
+    journal.append("one", "x")
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    write_json = aurebesh_journal.atomic_write_json
+    monkeypatch.setattr(aurebesh_journal, "atomic_write_json", fail)
+    journal.append("two", "y")
+    journal.append("three", "z")      # compacts; the snapshot write fails
+    journal.delete(0)
+    monkeypatch.setattr(aurebesh_journal, "atomic_write_json", write_json)
+
+    journal.append("four", "w")
+    journal.close()
+    assert [e["english"] for e in HistoryJournal(snapshot)] == ["two", "three", "four"]
+
+def test_failed_log_write_keeps_records(tmp_path, monkeypatch):
+    snapshot = str(tmp_path / "history.json")
+    journal = HistoryJournal(snapshot)
+    journal.append("one", "x")
+    journal.close()
+    monkeypatch.setattr(journal, "log_path", str(tmp_path / "missing" / "history.jsonl"))
+    journal.append("two", "y")        # cannot open the log
+    monkeypatch.undo()
+    journal.append("three", "z")
+    journal.close()
+    assert [e["english"] for e in HistoryJournal(snapshot)] == ["one", "two", "three"]
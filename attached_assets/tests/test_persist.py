@@ -0,0 +1,94 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+import aurebesh_core
+from aurebesh_persist import WriteBehindPersister
+
+# -----------------------------
+# Write-Behind Persister
+# -----------------------------
+def test_last_write_wins():
+    persister = WriteBehindPersister(debounce=60, max_wait=60)
+    ran = []
+    for i in range(5):
+        persister.schedule("key", lambda i=i: ran.append(i))
+    persister.schedule("other", lambda: ran.append("other"))
+    assert persister.pending() == ["key", "other"]
+    persister.flush("key")
+    assert ran == [4]
+    persister.close()
+    assert ran == [4, "other"]
+    assert (persister.writes, persister.coalesced) == (2, 4)
+
+def test_writes_run_in_the_background():
+    persister = WriteBehindPersister(debounce=0.01, max_wait=0.05)
+    ran = []
+    persister.schedule("key", lambda: ran.append(1))
+    deadline = time.monotonic() + 5
+    while not ran and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert ran == [1]
+    persister.close()
+
+def test_saves_after_close_run_immediately():
+    persister = WriteBehindPersister(debounce=60)
+    persister.close()
+    ran = []
+    persister.schedule("key", lambda: ran.append(1))
+    assert ran == [1]
+
+def test_pending_writes_are_flushed_at_exit(tmp_path):
+    path = tmp_path / "out.txt"
+    script = (
+        "from aurebesh_persist import WriteBehindPersister\n"
+        "p = WriteBehindPersister(debounce=60, max_wait=60)\n"
+        f"p.schedule('out', lambda: open({str(path)!r}, 'w').write('first'))\n"
+        f"p.schedule('out', lambda: open({str(path)!r}, 'w').write('last'))\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, timeout=60,
+                   cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert path.read_text() == "last"
+
+# -----------------------------
+# Saved Phrases Under SQLite
+# -----------------------------
+@pytest.fixture
+def sqlite_core(tmp_path, monkeypatch):
+    monkeypatch.setattr(aurebesh_core, "STORAGE_BACKEND", "sqlite")
+    monkeypatch.setattr(aurebesh_core, "DATABASE_FILE", str(tmp_path / "aurebesh.db"))
+    for name in ("HISTORY_FILE", "HISTORY_LOG_FILE", "SAVED_PHRASES_FILE", "UNLOCKED_TIERS_FILE"):
+        monkeypatch.setattr(aurebesh_core, name, str(tmp_path / name.lower()))
+    for name in ("_store", "_saved_phrases", "_unlocked_tiers"):
+        monkeypatch.setattr(aurebesh_core, name, None)
+    persister = WriteBehindPersister(debounce=60, max_wait=60)
+    monkeypatch.setattr(aurebesh_core, "persister", persister)
+    yield persister
+    persister.close()
+    aurebesh_core._store.close()
+
+def test_phrase_changes_are_written_behind_in_order(sqlite_core):
+    core = aurebesh_core
+    assert core.add_saved_phrase("a")
+    assert not core.add_saved_phrase("a")
+    assert core.add_saved_phrase("b")
+    assert core.remove_saved_phrase("a")
+    core.save_phrases_to_file(["c", "b", "c"])
+    assert core.add_saved_phrase("d")
+    assert core.page_saved_phrases(0, 10) == ["c", "b", "d"]
+    # Nothing has reached the database yet.
+    assert core.get_store().load_saved_phrases() == []
+    sqlite_core.flush()
+    assert core.get_store().load_saved_phrases() == ["c", "b", "d"]
+
+def test_unlocked_tiers_are_read_from_memory(sqlite_core):
+    core = aurebesh_core
+    assert core.load_unlocked_tiers() == {1}
+    core.save_unlocked_tiers({1, 2})
+    assert core.load_unlocked_tiers() == {1, 2}
+    assert core.get_store().load_unlocked_tiers() == {1}
+    sqlite_core.flush()
+    assert core.get_store().load_unlocked_tiers() == {1, 2}
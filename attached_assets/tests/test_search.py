@@ -0,0 +1,84 @@
+import random
+
+import pytest
+
+import aurebesh_core
+from aurebesh_persist import WriteBehindPersister
+from aurebesh_search import SearchIndex, scan
+
+WORDS = ["han", "hand", "handle", "solo", "sol", "luke", "Luk", "the", "force", "forces", "é", "ÉCLAT"]
+
+def random_text(rng):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 4)))
+
+def random_query(rng):
+    return " ".join(rng.choice(WORDS)[:rng.randint(1, 4)] for _ in range(rng.randint(0, 3)))
+
+# -----------------------------
+# Index Against a Linear Scan
+# -----------------------------
+def test_index_matches_scan_after_changes():
+    rng = random.Random(4)
+    index, docs = SearchIndex(), {}
+    for _ in range(2000):
+        roll = rng.random()
+        doc_id = rng.randrange(40)
+        if roll < 0.6:
+            text = random_text(rng)
+            index.add(doc_id, text)
+            docs.pop(doc_id, None)
+            docs[doc_id] = text  # re-adding moves a document to the end
+        elif roll < 0.8:
+            assert index.remove(doc_id) == (docs.pop(doc_id, None) is not None)
+        else:
+            query, limit = random_query(rng), rng.choice([None, 1, 3])
+            newest_first = rng.random() < 0.5
+            expected = scan(list(docs.items()), query, newest_first=newest_first, limit=limit)
+            assert index.search(query, newest_first=newest_first, limit=limit) == expected, query
+    assert len(index) == len(docs)
+
+# -----------------------------
+# Core Search Over History and Saved Phrases
+# -----------------------------
+@pytest.fixture
+def core(tmp_path, monkeypatch):
+    monkeypatch.setattr(aurebesh_core, "STORAGE_BACKEND", "json")
+    for name in ("HISTORY_FILE", "HISTORY_LOG_FILE", "SAVED_PHRASES_FILE"):
+        monkeypatch.setattr(aurebesh_core, name, str(tmp_path / name.lower()))
+    for name in ("_history", "_saved_phrases"):
+        monkeypatch.setattr(aurebesh_core, name, None)
+    monkeypatch.setattr(aurebesh_core, "_indexes", {"history": None, "saved": None})
+    monkeypatch.setattr(aurebesh_core, "_index_backlog", {"history": None, "saved": None})
+    persister = WriteBehindPersister(debounce=60, max_wait=60)
+    monkeypatch.setattr(aurebesh_core, "persister", persister)
+    yield aurebesh_core
+    persister.close()
+
+def check_searches(core, query):
+    history = [(entry["id"], entry["english"]) for entry in core.get_history()]
+    saved = [(phrase, phrase) for phrase in core.get_saved_phrases()]
+    assert core.search_history(query) == scan(history, query, newest_first=True)
+    assert core.search_saved_phrases(query) == scan(saved, query)
+
+def test_core_indexes_follow_add_delete_and_favorite(core):
+    rng = random.Random(6)
+    for i in range(20):
+        core.add_history_entry(f"{random_text(rng)} {i}", "")
+    core.prepare_search_indexes()
+    assert core._indexes["history"] is not None and core._indexes["saved"] is not None
+    for _ in range(300):
+        ids = [entry["id"] for entry in core.get_history()]
+        roll = rng.random()
+        if roll < 0.3 or not ids:
+            core.add_history_entry(random_text(rng) + f" {rng.random()}", "")
+        elif roll < 0.45:
+            core.delete_history_entry(rng.choice(ids))
+        elif roll < 0.7:
+            core.toggle_history_favorite(rng.choice(ids))
+        elif roll < 0.8:
+            phrase = rng.choice(core.get_saved_phrases() or ["none"])
+            core.remove_saved_phrase(phrase)
+        else:
+            check_searches(core, random_query(rng))
+    for word in WORDS:
+        check_searches(core, word[:2])
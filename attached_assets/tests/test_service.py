@@ -0,0 +1,89 @@
+import asyncio
+import json
+
+import pytest
+
+import aurebesh_service
+from aurebesh_engine import get_translator
+
+async def _exchange(raw):
+    server = await asyncio.start_server(aurebesh_service.handle_connection, "127.0.0.1", 0,
+                                        limit=aurebesh_service.MAX_HEADER_BYTES)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(raw)
+        await writer.drain()
+        data = await reader.read()
+        writer.close()
+        return data
+    finally:
+        server.close()
+        await server.wait_closed()
+
+def request(method, path, body=None, raw_body=None):
+    if raw_body is None:
+        raw_body = b"" if body is None else json.dumps(body).encode("utf-8")
+    head = (f"{method} {path} HTTP/1.1\r\nContent-Length: {len(raw_body)}\r\n"
+            f"Connection: close\r\n\r\n").encode("latin-1")
+    data = asyncio.run(_exchange(head + raw_body))
+    head, _, payload = data.partition(b"\r\n\r\n")
+    return int(head.split(b" ")[1]), json.loads(payload)
+
+def test_translate_round_trip():
+    text = "the shadow"
+    status, payload = request("POST", "/translate", {"text": text})
+    assert status == 200
+    aurebesh = payload["result"]
+    assert aurebesh == get_translator("to_aurebesh")(text)
+    status, payload = request("POST", "/translate", {"text": aurebesh, "direction": "to_english"})
+    assert (status, payload["result"]) == (200, get_translator("to_english")(aurebesh))
+
+def test_batch_and_health():
+    texts = ["one", "two", ""]
+    status, payload = request("POST", "/translate/batch", {"texts": texts})
+    assert status == 200
+    assert payload["results"] == [get_translator("to_aurebesh")(t) for t in texts]
+    assert request("GET", "/health") == (200, {"status": "ok"})
+
+@pytest.mark.parametrize("method, path, body, raw_body, status", [
+    ("GET", "/nowhere", None, None, 404),
+    ("GET", "/translate", None, None, 405),
+    ("POST", "/translate", None, b"{not json", 400),
+    ("POST", "/translate", None, b"\xff\xfe", 400),
+    ("POST", "/translate", ["text"], None, 400),
+    ("POST", "/translate", {"text": 5}, None, 400),
+    ("POST", "/translate", {"text": "a", "direction": "sideways"}, None, 400),
+    ("POST", "/translate/batch", {"texts": ["a", 1]}, None, 400),
+])
+def test_error_responses(method, path, body, raw_body, status):
+    got, payload = request(method, path, body, raw_body)
+    assert got == status
+    assert "error" in payload
+
+def test_oversized_body_is_rejected(monkeypatch):
+    monkeypatch.setattr(aurebesh_service, "MAX_BODY_BYTES", 10)
+    status, payload = request("POST", "/translate", {"text": "far too long"})
+    assert status == 413
+
+def test_large_bodies_are_parsed_off_the_loop(monkeypatch):
+    parsed_on = []
+    parse = aurebesh_service._parse_body
+
+    def spy(body):
+        try:
+            asyncio.get_running_loop()
+            parsed_on.append("loop")
+        except RuntimeError:
+            parsed_on.append("worker")
+        return parse(body)
+
+    monkeypatch.setattr(aurebesh_service, "_parse_body", spy)
+    request("POST", "/translate", {"text": "small"})
+    text = "x" * (aurebesh_service.INLINE_MAX_CHARS + 1)
+    status, payload = request("POST", "/translate", {"text": text})
+    assert status == 200
+    assert payload["result"] == get_translator("to_aurebesh")(text)
+    status, _ = request("POST", "/translate", None, b"[" * (aurebesh_service.INLINE_MAX_CHARS + 1))
+    assert status == 400
+    assert parsed_on == ["loop", "worker", "worker"]
@@ -0,0 +1,116 @@
+import json
+import sqlite3
+
+import pytest
+
+import aurebesh_core
+from aurebesh_sqlite import SQLiteStore
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteStore(str(tmp_path / "aurebesh.db"))
+    yield store
+    store.close()
+
+# -----------------------------
+# Round Trips
+# -----------------------------
+def test_history_round_trip(tmp_path):
+    path = str(tmp_path / "aurebesh.db")
+    store = SQLiteStore(path)
+    history = store.history()
+    added = [history.append(f"phrase {i}", f"glyphs {i}") for i in range(5)]
+    history.set_favorite(added[1]["id"], True)
+    history.delete(added[2]["id"])
+    store.close()
+
+    history = SQLiteStore(path).history()
+    expected = [dict(e, favorite=e is added[1]) for e in added if e is not added[2]]
+    assert list(history) == expected
+    assert list(reversed(history)) == expected[::-1]
+    assert len(history) == 4
+    assert history.get(added[1]["id"])["favorite"]
+    assert history.get(added[2]["id"]) is None
+    assert history.last() == expected[-1]
+    assert history.page(1, 2) == expected[::-1][1:3]
+
+def test_delete_removes_one_row(store):
+    history = store.history()
+    first, second, third = (history.append(w, w) for w in ("one", "two", "three"))
+    history.delete(second["id"])
+    assert [e["english"] for e in history] == ["one", "three"]
+    with pytest.raises(KeyError):
+        history.delete(second["id"])
+    with pytest.raises(KeyError):
+        history.set_favorite(second["id"], True)
+
+def test_phrases_and_tiers_round_trip(store):
+    store.save_saved_phrases(["b", "a", "b"])
+    assert store.add_saved_phrase("c")
+    assert not store.add_saved_phrase("a")
+    assert store.remove_saved_phrase("b")
+    assert not store.remove_saved_phrase("missing")
+    assert store.load_saved_phrases() == ["a", "c"]
+    assert store.page_saved_phrases(1, 5) == ["c"]
+
+    assert store.load_unlocked_tiers() == {1}
+    store.save_unlocked_tiers({1, 3})
+    assert store.load_unlocked_tiers() == {1, 3}
+
+# -----------------------------
+# Importing the JSON Files
+# -----------------------------
+@pytest.fixture
+def json_files(tmp_path, monkeypatch):
+    files = {
+        "HISTORY_FILE": tmp_path / "history.json",
+        "HISTORY_LOG_FILE": tmp_path / "history.jsonl",
+        "SAVED_PHRASES_FILE": tmp_path / "saved_phrases.json",
+        "UNLOCKED_TIERS_FILE": tmp_path / "unlocked_tiers.json",
+        "DATABASE_FILE": tmp_path / "aurebesh.db",
+    }
+    for name, path in files.items():
+        monkeypatch.setattr(aurebesh_core, name, str(path))
+    monkeypatch.setattr(aurebesh_core, "_store", None)
+    files["HISTORY_FILE"].write_text(json.dumps([
+        {"id": 0, "english": "old", "aurebesh": "x", "favorite": True, "timestamp": "t"},
+        {"id": 1, "english": "older", "aurebesh": "y", "favorite": False, "timestamp": "t"},
+    ]), encoding="utf-8")
+    files["SAVED_PHRASES_FILE"].write_text(json.dumps(["saved"]), encoding="utf-8")
+    files["UNLOCKED_TIERS_FILE"].write_text(json.dumps({"tiers": [1, 2]}), encoding="utf-8")
+    yield files
+    if aurebesh_core._store is not None:
+        aurebesh_core._store.close()
+
+def reopen():
+    aurebesh_core._store.close()
+    aurebesh_core._store = None
+    return aurebesh_core.get_store()
+
+def test_json_is_imported_once(json_files):
+    store = aurebesh_core.get_store()
+    assert [e["english"] for e in store.history()] == ["old", "older"]
+    assert store.load_saved_phrases() == ["saved"]
+    assert store.load_unlocked_tiers() == {1, 2}
+
+    # Emptying every table must not bring the JSON data back.
+    for entry in list(store.history()):
+        store.history().delete(entry["id"])
+    store.save_saved_phrases([])
+    store.save_unlocked_tiers(set())
+    store = reopen()
+    assert list(store.history()) == []
+    assert store.load_saved_phrases() == []
+
+def test_database_from_before_the_marker_is_not_reimported(json_files):
+    conn = sqlite3.connect(str(json_files["DATABASE_FILE"]))
+    conn.execute("CREATE TABLE saved_phrases (position INTEGER PRIMARY KEY, phrase TEXT NOT NULL UNIQUE)")
+    conn.execute("INSERT INTO saved_phrases (phrase) VALUES ('kept')")
+    conn.commit()
+    conn.close()
+    store = aurebesh_core.get_store()
+    assert list(store.history()) == []
+    store.remove_saved_phrase("kept")
+    store = reopen()
+    assert store.load_saved_phrases() == []
+    assert list(store.history()) == []
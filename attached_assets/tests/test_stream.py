@@ -0,0 +1,101 @@
+import io
+import itertools
+import random
+
+import pytest
+
+from aurebesh_engine import LigatureTable, english_to_aurebesh, get_translator, ligatures
+from aurebesh_stream import (iter_mapped_chunks, translate_chunks, translate_mapped_file,
+                             translate_stream)
+
+# Text that keeps putting ligatures across chunk boundaries.
+ALPHABET = "chstoengakCHST \n" + "".join(ligatures.values()) + "Σé"
+
+def random_splits(rng, text):
+    cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, rng.randint(0, 6))))
+    return [text[a:b] for a, b in zip([0] + cuts, cuts + [len(text)])]
+
+# -----------------------------
+# Chunk Boundaries
+# -----------------------------
+def test_every_split_matches_whole_text():
+    text = "Thought she cho oo eon  NGAE shooth"
+    for direction in ("to_aurebesh", "to_english"):
+        whole = get_translator(direction)(text)
+        for i in range(len(text) + 1):
+            pieces = translate_chunks([text[:i], text[i:]], direction)
+            assert "".join(pieces) == whole, (direction, i)
+
+def test_random_splits_match_whole_text():
+    rng = random.Random(1)
+    for _ in range(300):
+        text = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 30)))
+        for direction in ("to_aurebesh", "to_english"):
+            whole = get_translator(direction)(text)
+            assert "".join(translate_chunks(random_splits(rng, text), direction)) == whole
+
+def test_stream_with_tiny_chunks():
+    text = "the shadow of the empire\nsheng thoo\n" * 5
+    whole = english_to_aurebesh(text)
+    for chunk_size in (1, 2, 3, 7):
+        out = io.StringIO()
+        translate_stream(io.StringIO(text), out, chunk_size=chunk_size)
+        assert out.getvalue() == whole
+
+# -----------------------------
+# Longer Ligatures
+# -----------------------------
+# Overlapping ligatures of several lengths: a chunk ending in "th" or "the"
+# could still grow into "thee" or "there".
+LONG_TABLE = LigatureTable({
+    "th": "\ue100", "the": "\ue101", "thee": "\ue102", "there": "\ue103",
+    "he": "\ue104", "ere": "\ue105", "e": "\ue106",
+})
+
+def test_longest_ligature_wins():
+    assert LONG_TABLE.to_aurebesh("there") == "\ue103"
+    assert LONG_TABLE.to_aurebesh("ther") == "\ue101R"
+    assert LONG_TABLE.to_aurebesh("theer") == "\ue102R"
+    assert LONG_TABLE.to_english("\ue103\ue102") == "therethee"
+
+def test_long_ligatures_across_chunks():
+    rng = random.Random(2)
+    for _ in range(500):
+        text = "".join(rng.choice("therTHE ") for _ in range(rng.randint(0, 25)))
+        whole = LONG_TABLE.to_aurebesh(text)
+        pieces = translate_chunks(random_splits(rng, text), table=LONG_TABLE)
+        assert "".join(pieces) == whole, repr(text)
+
+# -----------------------------
+# Memory-Mapped Input
+# -----------------------------
+def test_mapped_windows_keep_characters_whole():
+    rng = random.Random(3)
+    for _ in range(200):
+        text = "".join(rng.choice("ab\u00e9\u20ac\U0001f600") for _ in range(rng.randint(0, 20)))
+        data = text.encode("utf-8")
+        for chunk_bytes in (4, 5, 6, 9):
+            assert "".join(iter_mapped_chunks(data, chunk_bytes)) == text
+
+def test_mapped_file_matches_whole_text(tmp_path):
+    text = "the shadow \u00e9\U0001f600 sheng thoo\n" * 50
+    src, dst = tmp_path / "in.txt", tmp_path / "out.txt"
+    src.write_bytes(text.encode("utf-8"))
+    translate_mapped_file(src, dst, chunk_bytes=7, buffer_size=16)
+    assert dst.read_bytes().decode("utf-8") == english_to_aurebesh(text)
+
+@pytest.mark.parametrize("data", [
+    b"abcd" + b"\x80" * 8,      # a run of continuation bytes longer than any character
+    b"\x80" * 10,               # nothing but continuation bytes
+    b"ab\xe2\x82",              # truncated final character
+    b"abc\xff" + b"d" * 8,      # byte that never appears in UTF-8
+])
+def test_invalid_utf8_raises(data):
+    with pytest.raises(UnicodeDecodeError):
+        list(itertools.islice(iter_mapped_chunks(data, 4), 100))
+
+def test_invalid_mapped_file_raises(tmp_path):
+    src = tmp_path / "in.txt"
+    src.write_bytes(b"\x80" * 4096)
+    with pytest.raises(UnicodeDecodeError):
+        translate_mapped_file(src, tmp_path / "out.txt", chunk_bytes=4)
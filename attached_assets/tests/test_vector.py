@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import aurebesh_engine
+import aurebesh_vector
+from aurebesh_engine import ligatures
+
+GLYPHS = "".join(ligatures.values())
+LETTERS = "".join(ligatures) + "abcdefghijklmnopqrstuvwxyz ABC"
+# Non-BMP, combining and multi-character-lowercase input all take the
+# engine fallback in aurebesh_to_english.
+SPECIAL = "\U0001f600\U0001d400éİΣ"
+
+def random_text(rng, alphabet, length):
+    return "".join(rng.choice(alphabet) for _ in range(length))
+
+@pytest.mark.parametrize("seed", range(20))
+def test_english_to_aurebesh_matches_engine(seed):
+    rng = random.Random(seed)
+    text = random_text(rng, LETTERS + SPECIAL, rng.randint(0, 200))
+    assert aurebesh_vector.english_to_aurebesh(text) == aurebesh_engine.english_to_aurebesh(text)
+
+@pytest.mark.parametrize("seed", range(20))
+def test_aurebesh_to_english_matches_engine(seed):
+    rng = random.Random(seed)
+    alphabet = GLYPHS + LETTERS + (SPECIAL if seed % 2 else "")
+    text = random_text(rng, alphabet, rng.randint(0, 200))
+    assert aurebesh_vector.aurebesh_to_english(text) == aurebesh_engine.aurebesh_to_english(text)
+
+@pytest.mark.parametrize("text", ["", "o", "oo", "ooo", "oooo", "\U0001f600", "İ", "\U0001f600" + GLYPHS])
+def test_edge_cases(text):
+    assert aurebesh_vector.english_to_aurebesh(text) == aurebesh_engine.english_to_aurebesh(text)
+    assert aurebesh_vector.aurebesh_to_english(text) == aurebesh_engine.aurebesh_to_english(text)
+
+def test_missing_numpy_raises_import_error(monkeypatch):
+    monkeypatch.setattr(aurebesh_vector, "np", None)
+    with pytest.raises(ImportError):
+        aurebesh_vector.english_to_aurebesh("text")
+    with pytest.raises(ImportError):
+        aurebesh_vector.aurebesh_to_english("text")
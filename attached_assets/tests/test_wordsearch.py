@@ -0,0 +1,357 @@
+import os
+import random
+import subprocess
+import sys
+import time
+
+import pytest
+
+import aurebesh_core
+import aurebesh_wordsearch
+from aurebesh_wordsearch import (
+    ALL_DIRECTIONS, DIRECTIONS, FILL_LETTERS, FILL_RETRIES, FillError, MAX_SEED, PUZZLE_HEADERS, PuzzleBook, PuzzlePool, WordTrie, decode_puzzle,
+    find_words, generate_seeded, generate_word_search, grid_letters, pack_puzzle, unpack_puzzle,
+    Puzzle
+)
+
+# -----------------------------
+# Helpers
+# -----------------------------
+def check_puzzle(words, size, grid, placed):
+    assert len(grid) == size and all(len(row) == size and all(row) for row in grid)
+    assert [w for w, _ in placed] == [grid_letters(w) for w in words]
+    spans = []
+    for word, cells in placed:
+        assert "".join(grid[y][x] for x, y in cells) == word
+        if len(cells) > 1:
+            step = (cells[1][0] - cells[0][0], cells[1][1] - cells[0][1])
+            assert step in DIRECTIONS
+            assert all((b[0] - a[0], b[1] - a[1]) == step for a, b in zip(cells, cells[1:]))
+        spans.append(frozenset(cells))
+    # No word may hide inside (or be) another one's cells.
+    for i, a in enumerate(spans):
+        for b in spans[i + 1:]:
+            assert not (a <= b or b <= a)
+
+def brute_force_fits(words, size):
+    # Tries every slot for every word: far too slow for real grids, but an
+    # independent answer to "does any arrangement exist?" on tiny ones.
+    letters = [grid_letters(w) for w in words]
+    slots = [(x, y, dx, dy) for dx, dy in DIRECTIONS for y in range(size) for x in range(size)]
+
+    def place(k, grid, spans):
+        if k == len(letters):
+            return True
+        word = letters[k]
+        for x, y, dx, dy in slots:
+            cells = [(x + dx * i, y + dy * i) for i in range(len(word))]
+            if not all(0 <= cx < size and 0 <= cy < size for cx, cy in cells):
+                continue
+            span = frozenset(cells)
+            if any(span <= other or other <= span for other in spans):
+                continue
+            if any(grid.get(cell, ch) != ch for cell, ch in zip(cells, word)):
+                continue
+            if place(k + 1, {**grid, **dict(zip(cells, word))}, spans + [span]):
+                return True
+        return False
+
+    return place(0, {}, [])
+
+# -----------------------------
+# Generator
+# -----------------------------
+def test_generated_puzzles_are_valid():
+    rng = random.Random(1)
+    for _ in range(200):
+        size = rng.randint(3, 12)
+        words = ["".join(rng.choice("ABCDE") for _ in range(rng.randint(1, size)))
+                 for _ in range(rng.randint(1, 6))]
+        try:
+            grid, placed = generate_word_search(words, size, rng)
+        except ValueError:
+            continue
+        check_puzzle(words, size, grid, placed)
+
+def test_generator_fails_only_when_nothing_fits():
+    rng = random.Random(2)
+    for _ in range(300):
+        size = rng.randint(2, 4)
+        words = ["".join(rng.choice("AB") for _ in range(rng.randint(1, size)))
+                 for _ in range(rng.randint(2, 6))]
+        try:
+            grid, placed = generate_word_search(words, size, rng)
+        except ValueError:
+            assert not brute_force_fits(words, size), (words, size)
+        else:
+            check_puzzle(words, size, grid, placed)
+
+def test_dense_grid_taken_from_its_own_lines():
+    # Words cut from the lines of a random grid, none inside another, always
+    # fit back in, however tightly they have to be packed.
+    rng = random.Random(3)
+    size = 8
+    source = [[rng.choice("ABCD") for _ in range(size)] for _ in range(size)]
+    words, spans = [], []
+    while len(words) < 22:
+        dx, dy = rng.choice(DIRECTIONS)
+        length = rng.randint(3, size)
+        x, y = rng.randrange(size), rng.randrange(size)
+        cells = [(x + dx * i, y + dy * i) for i in range(length)]
+        if not all(0 <= cx < size and 0 <= cy < size for cx, cy in cells):
+            continue
+        span = frozenset(cells)
+        if any(span <= other or other <= span for other in spans):
+            continue
+        spans.append(span)
+        words.append("".join(source[cy][cx] for cx, cy in cells))
+    grid, placed = generate_word_search(words, size, rng)
+    check_puzzle(words, size, grid, placed)
+
+def test_impossible_puzzle_raises():
+    with pytest.raises(ValueError):
+        generate_word_search(["ABCDEF"], 5)
+    with pytest.raises(ValueError):
+        generate_word_search(["AB", "AB", "AB", "AB", "AB"], 2)
+
+# -----------------------------
+# Seeded Puzzles and Packing
+# -----------------------------
+WORDS = ["MAY", "THE", "FORCE", "BE", "WITH", "YOU", "X-WING"]
+
+def test_seeded_puzzle_round_trips():
+    rng = random.Random(4)
+    for _ in range(100):
+        size = rng.randint(6, 20)
+        words = rng.sample(WORDS, rng.randint(1, len(WORDS)))
+        seed = rng.getrandbits(32)
+        grid, placed = generate_seeded(words, size, seed)
+        assert generate_seeded(words, size, seed) == (grid, placed)
+        data = pack_puzzle(seed, grid, placed)
+        assert unpack_puzzle(data) == (seed, grid, placed)
+        assert decode_puzzle(data, words, size) == (grid, placed)
+
+def test_decode_rejects_other_parameters():
+    data = pack_puzzle(1, *generate_seeded(WORDS, 12, 1))
+    with pytest.raises(ValueError):
+        decode_puzzle(data, WORDS, 13)
+    with pytest.raises(ValueError):
+        decode_puzzle(data, WORDS[1:], 12)
+
+def test_unpack_rejects_bad_data():
+    data = pack_puzzle(1, *generate_seeded(WORDS, 12, 1))
+    for bad in (b"", data[:5], data[:-1], b"\xff" + data[1:]):
+        with pytest.raises(ValueError):
+            unpack_puzzle(bad)
+
+@pytest.mark.parametrize("seed", [0, 2 ** 32 - 1, 2 ** 32, MAX_SEED])
+def test_seed_boundaries(seed):
+    grid, placed = generate_seeded(WORDS, 12, seed)
+    assert unpack_puzzle(pack_puzzle(seed, grid, placed)) == (seed, grid, placed)
+
+@pytest.mark.parametrize("seed", [-1, MAX_SEED + 1])
+def test_seed_out_of_range_raises(seed):
+    with pytest.raises(ValueError):
+        pack_puzzle(seed, *generate_seeded(WORDS, 12, 1))
+
+def test_version_1_puzzles_still_unpack():
+    grid, placed = generate_seeded(WORDS, 12, 9)
+    data = pack_puzzle(9, grid, placed)
+    old = PUZZLE_HEADERS[1].pack(1, 12, len(placed), 9) + data[PUZZLE_HEADERS[2].size:]
+    assert unpack_puzzle(old) == (9, grid, placed)
+    assert [bytes(r) for r in PuzzleBook.from_packed([old, data])] == [old, data]
+
+def test_puzzle_book_round_trips(tmp_path):
+    records = [pack_puzzle(seed, *generate_seeded(WORDS, 12, seed)) for seed in range(20)]
+    path = str(tmp_path / "book.bin")
+    PuzzleBook.from_packed(records).save(path)
+    book = PuzzleBook.load(path)
+    assert [bytes(r) for r in book] == records
+    assert book.puzzle(7) == unpack_puzzle(records[7])
+
+# -----------------------------
+# Answer Checking
+# -----------------------------
+def test_puzzles_carry_their_answer_key():
+    for seed in range(30):
+        puzzle = generate_seeded(WORDS, 12, seed)
+        grid, placed = puzzle
+        assert isinstance(puzzle, Puzzle) and puzzle == (grid, placed)
+        answers = puzzle.answers
+        assert answers.placed is placed
+        ends = {frozenset((cells[0], cells[-1])) for _, cells in placed}
+        cells = [(x, y) for x in range(12) for y in range(12)]
+        rng = random.Random(seed)
+        for _ in range(200):
+            a, b = rng.choice(cells), rng.choice(cells)
+            if frozenset((a, b)) not in ends:
+                assert answers.match(a, b) is None
+        for i, (_, word_cells) in enumerate(placed):
+            assert answers.match(word_cells[0], word_cells[-1]) == i
+            assert answers.match(word_cells[-1], word_cells[0]) == i
+            assert answers.mark_found(i)
+            assert not answers.mark_found(i)
+            assert answers.remaining() == list(range(i + 1, len(placed)))
+        assert answers.complete and answers.found == list(range(len(placed)))
+
+def test_decoded_puzzles_get_a_fresh_key(tmp_path):
+    puzzle = generate_seeded(WORDS, 12, 3)
+    puzzle.answers.mark_found(0)
+    decoded = decode_puzzle(pack_puzzle(3, *puzzle), WORDS, 12)
+    assert decoded == puzzle
+    assert decoded.answers.found == [] and not decoded.answers.complete
+    pool = PuzzlePool(str(tmp_path / "cache.bin"))
+    taken = pool.take(WORDS, 12)
+    assert isinstance(taken, Puzzle) and taken.answers.remaining() == list(range(len(WORDS)))
+
+# -----------------------------
+# Puzzle Pool
+# -----------------------------
+SPECS = [(WORDS[:3], 8), (WORDS, 12)]
+
+def wait_for(condition, timeout=60):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+def test_pool_keeps_each_spec_stocked(tmp_path):
+    path = str(tmp_path / "cache.bin")
+    pool = PuzzlePool(path, SPECS, depth=3)
+    pool.start()
+    try:
+        wait_for(lambda: all(pool.ready(w, s) == 3 for w, s in SPECS))
+        for words, size in SPECS:
+            check_puzzle(words, size, *pool.take(words, size))
+        assert (pool.hits, pool.misses) == (2, 0)
+        wait_for(lambda: all(pool.ready(w, s) == 3 for w, s in SPECS))
+    finally:
+        pool.close()
+    assert all(pool.ready(w, s) == 3 for w, s in SPECS)
+
+    # The stock survives a restart, but only for the same vocabulary.
+    reopened = PuzzlePool(path, SPECS, depth=3)
+    assert [reopened.ready(w, s) for w, s in SPECS] == [3, 3]
+    check_puzzle(WORDS, 12, *reopened.take(WORDS, 12))
+    assert reopened.hits == 1
+    other = PuzzlePool(path, SPECS, depth=3, avoid=WordTrie(["ZZZ"]))
+    assert [other.ready(w, s) for w, s in SPECS] == [0, 0]
+
+def test_empty_pool_generates_on_the_spot(tmp_path):
+    pool = PuzzlePool(str(tmp_path / "cache.bin"), SPECS)
+    check_puzzle(WORDS, 12, *pool.take(WORDS, 12))
+    check_puzzle(["NEW"], 5, *pool.take(["NEW"], 5))  # not a configured spec
+    assert (pool.hits, pool.misses) == (0, 2)
+
+def test_spec_that_never_fits_is_dropped(tmp_path):
+    pool = PuzzlePool(str(tmp_path / "cache.bin"), [(["LONGERTHANTHEGRID"], 5)] + SPECS, depth=1)
+    pool.start()
+    try:
+        wait_for(lambda: all(pool.ready(w, s) == 1 for w, s in SPECS))
+        assert len(pool._specs) == len(SPECS)
+    finally:
+        pool.close()
+
+@pytest.mark.parametrize("words, size", aurebesh_core.WORD_SEARCH_PUZZLES)
+def test_configured_puzzles_fit(words, size):
+    assert max(len(grid_letters(w)) for w in words) <= size
+    check_puzzle(words, size, *generate_word_search(words, size))
+
+# -----------------------------
+# Solver
+# -----------------------------
+def brute_force_words(grid, words):
+    # Every cell, every direction, every length: the answer find_words
+    # should give, palindromes counted once.
+    size = len(grid)
+    found = set()
+    for y in range(size):
+        for x in range(size):
+            for dx, dy in ALL_DIRECTIONS:
+                for length in range(1, size + 1):
+                    cells = [(x + dx * i, y + dy * i) for i in range(length)]
+                    if not all(0 <= cx < size and 0 <= cy < size for cx, cy in cells):
+                        break
+                    word = "".join(grid[cy][cx] for cx, cy in cells)
+                    if word in words:
+                        found.add((word, frozenset(cells)))
+    return found
+
+def test_solver_matches_brute_force():
+    rng = random.Random(8)
+    for _ in range(30):
+        size = rng.randint(1, 8)
+        grid = [[rng.choice("ABC") for _ in range(size)] for _ in range(size)]
+        words = {"".join(rng.choice("ABC") for _ in range(rng.randint(1, 4))) for _ in range(15)}
+        found = find_words(grid, WordTrie(words))
+        assert {(w, frozenset(c)) for w, c in found} == brute_force_words(grid, words)
+        assert len(found) == len(brute_force_words(grid, words))
+        for word, cells in found:
+            assert "".join(grid[y][x] for x, y in cells) == word
+
+def test_solver_finds_exactly_the_placed_words():
+    words = ["FORCE", "JEDI", "SITH", "WOOKIEE", "DROID", "EWOK", "TATOOINE", "X-WING"]
+    trie = WordTrie(words)
+    for seed in range(20):
+        grid, placed = generate_seeded(words, 12, seed, avoid=trie)
+        assert sorted(find_words(grid, trie)) == sorted(placed)
+
+def test_fingerprint_is_stable():
+    words = ["Jedi", "SITH", "x-wing", "ab"]
+    fingerprint = WordTrie(words, min_length=3).fingerprint()
+    assert WordTrie(reversed(words + ["JEDI"]), min_length=3).fingerprint() == fingerprint
+    assert WordTrie(words[:3], min_length=3).fingerprint() == fingerprint  # "ab" is too short
+    assert WordTrie(words, min_length=2).fingerprint() != fingerprint
+    assert WordTrie(words + ["EWOK"], min_length=3).fingerprint() != fingerprint
+    # The same in a fresh interpreter with a different hash seed.
+    script = ("from aurebesh_wordsearch import WordTrie\n"
+              f"print(WordTrie({words!r}, min_length=3).fingerprint())")
+    out = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                         cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         env=dict(os.environ, PYTHONHASHSEED="123"), timeout=60)
+    assert out.stdout.strip() == fingerprint
+
+# -----------------------------
+# Fill Retries
+# -----------------------------
+def test_fill_that_always_spells_words_raises():
+    # Every fill letter is a word of its own, so no refill can help.
+    with pytest.raises(FillError):
+        generate_seeded(["JEDI"], 6, 1, avoid=WordTrie(FILL_LETTERS))
+
+def failing_fills(monkeypatch, failures):
+    calls = []
+    generate = aurebesh_wordsearch.generate_seeded
+
+    def flaky(words, size, seed, avoid=None):
+        calls.append(seed)
+        if len(calls) <= failures:
+            raise FillError("the fill spelled a word")
+        return generate(words, size, seed, avoid)
+
+    monkeypatch.setattr(aurebesh_wordsearch, "generate_seeded", flaky)
+    return calls
+
+def test_take_retries_other_seeds(tmp_path, monkeypatch):
+    calls = failing_fills(monkeypatch, FILL_RETRIES - 1)
+    pool = PuzzlePool(str(tmp_path / "cache.bin"))
+    check_puzzle(WORDS, 12, *pool.take(WORDS, 12))
+    assert len(calls) == FILL_RETRIES
+    assert len(set(calls)) == FILL_RETRIES  # a new seed every time
+
+def test_take_gives_up_after_fill_retries(tmp_path, monkeypatch):
+    calls = failing_fills(monkeypatch, FILL_RETRIES)
+    with pytest.raises(FillError):
+        PuzzlePool(str(tmp_path / "cache.bin")).take(WORDS, 12)
+    assert len(calls) == FILL_RETRIES
+
+def test_pool_keeps_a_spec_whose_fills_fail(tmp_path, monkeypatch):
+    monkeypatch.setattr(aurebesh_wordsearch, "FILL_RETRY_DELAY", 0.01)
+    calls = failing_fills(monkeypatch, FILL_RETRIES * 2 + 1)
+    pool = PuzzlePool(str(tmp_path / "cache.bin"), [(WORDS, 12)], depth=1)
+    pool.start()
+    try:
+        wait_for(lambda: pool.ready(WORDS, 12) == 1)
+    finally:
+        pool.close()
+    assert len(calls) == FILL_RETRIES * 2 + 2  # two rounds failed, then one bad seed